@@ -10,14 +10,20 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import re
 import subprocess
+import sys
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Seconds the status probe may run before it is killed
+PROBE_TIMEOUT_SECONDS = 60
+
 
 @dataclass
 class CompletionResult:
@@ -66,6 +72,48 @@ def get_new_commits_count(project_path: Path, baseline_commit: str) -> int:
         return 0
 
 
+# Entry prefixes of `git status --porcelain=v2` and the number of space-separated
+# fields that precede the path for each of them.
+_PORCELAIN_V2_FIELDS = {b"1": 8, b"2": 9, b"u": 10}
+
+
+def _parse_porcelain_v2(raw: bytes) -> tuple[list[str], list[str]]:
+    """Parse NUL-terminated ``git status --porcelain=v2 -z`` output.
+
+    Args:
+        raw: Raw stdout bytes from git
+
+    Returns:
+        Tuple of (changed_files, staged_files)
+    """
+    changed_files: list[str] = []
+    staged_files: list[str] = []
+
+    entries = iter(raw.split(b"\x00"))
+    for entry in entries:
+        kind = entry[:1]
+        if kind == b"?":
+            changed_files.append(os.fsdecode(entry[2:]))
+            continue
+
+        field_count = _PORCELAIN_V2_FIELDS.get(kind)
+        if field_count is None:
+            # Ignored entries ("! ...") and the trailing empty chunk
+            continue
+
+        file_path = os.fsdecode(entry.split(b" ", field_count)[field_count])
+        if kind == b"2":
+            # Renames/copies are followed by the original path as a separate entry
+            next(entries, None)
+
+        changed_files.append(file_path)
+        # XY status: X is the index state, "." means nothing staged
+        if entry[2:3] != b".":
+            staged_files.append(file_path)
+
+    return changed_files, staged_files
+
+
 def check_uncommitted_changes(project_path: Path) -> dict[str, bool | list[str]]:
     """Check for uncommitted changes in working tree.
 
@@ -77,35 +125,23 @@ def check_uncommitted_changes(project_path: Path) -> dict[str, bool | list[str]]
             "staged_files": list[str]
         }
     """
+    empty: dict[str, bool | list[str]] = {
+        "has_changes": False,
+        "changed_files": [],
+        "staged_files": [],
+    }
     try:
         status_result = subprocess.run(
-            ["git", "status", "--porcelain"],
+            ["git", "status", "--porcelain=v2", "-z"],
             cwd=project_path,
             capture_output=True,
-            text=True,
             timeout=10,
         )
 
         if status_result.returncode != 0:
-            return {"has_changes": False, "changed_files": [], "staged_files": []}
+            return empty
 
-        lines = status_result.stdout.strip().split("\n")
-        changed_files = []
-        staged_files = []
-
-        for line in lines:
-            if not line:
-                continue
-            status_code = line[:2]
-            file_path = line[3:]
-
-            # Staged changes (first char is not space/?)
-            if status_code[0] not in (" ", "?"):
-                staged_files.append(file_path)
-
-            # Any change
-            if status_code.strip():
-                changed_files.append(file_path)
+        changed_files, staged_files = _parse_porcelain_v2(status_result.stdout)
 
         return {
             "has_changes": bool(changed_files),
@@ -114,7 +150,179 @@ def check_uncommitted_changes(project_path: Path) -> dict[str, bool | list[str]]
         }
     except (subprocess.TimeoutExpired, Exception) as e:
         logger.warning(f"Failed to check uncommitted changes: {e}")
-        return {"has_changes": False, "changed_files": [], "staged_files": []}
+        return empty
+
+
+def read_head_oid(project_path: Path) -> str | None:
+    """Read the commit HEAD points at straight from the .git directory.
+
+    Avoids forking git when only the HEAD commit is needed. Loose refs and
+    packed-refs are supported; anything else (worktrees, detached gitdirs,
+    project paths below the repository root) returns None so callers can fall
+    back to asking git.
+
+    Args:
+        project_path: Path to project
+
+    Returns:
+        Commit hash, or None if it could not be determined
+    """
+    git_dir = project_path / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        if not head.startswith("ref: "):
+            return head or None
+
+        ref = head[len("ref: ") :]
+        ref_path = git_dir / ref
+        if ref_path.is_file():
+            return ref_path.read_text(encoding="utf-8").strip() or None
+
+        packed_refs = git_dir / "packed-refs"
+        if packed_refs.is_file():
+            for line in packed_refs.read_text(encoding="utf-8").splitlines():
+                oid, _, name = line.partition(" ")
+                if name == ref:
+                    return oid
+    except OSError:
+        pass
+    return None
+
+
+def _count_commits_after_rescue(project_path: Path, baseline_commit: str) -> int:
+    """Count new commits after a rescue, skipping git when HEAD is still at baseline.
+
+    Args:
+        project_path: Path to project
+        baseline_commit: Baseline commit hash
+
+    Returns:
+        Number of new commits since baseline
+    """
+    if read_head_oid(project_path) == baseline_commit:
+        return 0
+    return get_new_commits_count(project_path, baseline_commit)
+
+
+class _JsonObjectScanner:
+    """Incrementally locate the first balanced top-level ``{...}`` in a text stream.
+
+    A balanced span that does not decode as JSON (a brace in the surrounding
+    prose) is skipped, and scanning resumes just after its opening brace.
+    """
+
+    def __init__(self) -> None:
+        self.text = ""
+        self._pos = 0
+        self._start = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, chunk: str) -> str | None:
+        """Consume more output.
+
+        Args:
+            chunk: Next piece of output
+
+        Returns:
+            The JSON object text once its closing brace arrives, otherwise None
+        """
+        self.text += chunk
+        text = self.text
+        index = self._pos
+        while index < len(text):
+            char = text[index]
+            index += 1
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"' and self._depth:
+                self._in_string = True
+            elif char == "{":
+                if self._depth == 0:
+                    self._start = index - 1
+                self._depth += 1
+            elif char == "}" and self._depth:
+                self._depth -= 1
+                if self._depth == 0:
+                    candidate = text[self._start : index]
+                    try:
+                        json.loads(candidate)
+                    except json.JSONDecodeError:
+                        # Not the object, just braces in prose: look for the next "{"
+                        index = self._start + 1
+                        self._in_string = False
+                        self._escaped = False
+                        continue
+                    self._pos = index
+                    return candidate
+        self._pos = len(text)
+        return None
+
+
+def _stream_probe_output(
+    command: list[str], project_path: Path, timeout: float
+) -> tuple[str, str | None]:
+    """Run a probe command and stop reading as soon as a JSON object closes.
+
+    Args:
+        command: Probe command to execute
+        project_path: Working directory for the command
+        timeout: Seconds before the process is killed
+
+    Returns:
+        Tuple of (output read so far, JSON object text or None if none closed)
+
+    Raises:
+        subprocess.TimeoutExpired: If no JSON object arrived before the timeout
+    """
+    proc = subprocess.Popen(
+        command,
+        cwd=project_path,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    )
+    timed_out = threading.Event()
+
+    def _kill() -> None:
+        timed_out.set()
+        proc.kill()
+
+    watchdog = threading.Timer(timeout, _kill)
+    watchdog.daemon = True
+    watchdog.start()
+
+    scanner = _JsonObjectScanner()
+    json_str = None
+    try:
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            json_str = scanner.feed(line)
+            if json_str is not None:
+                break
+    finally:
+        watchdog.cancel()
+        if proc.poll() is None:
+            proc.terminate()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        if proc.stdout is not None:
+            proc.stdout.close()
+
+    if json_str is None and timed_out.is_set():
+        raise subprocess.TimeoutExpired(command, timeout)
+    return scanner.text, json_str
 
 
 def probe_session_status(project_path: Path) -> dict[str, str | bool | int | list[str]]:
@@ -148,8 +356,9 @@ Status values:
 
 RESPOND WITH ONLY THE JSON OBJECT. No other text."""
 
+    output = ""
     try:
-        result = subprocess.run(
+        output, json_str = _stream_probe_output(
             [
                 "claude",
                 "--print",
@@ -159,33 +368,28 @@ RESPOND WITH ONLY THE JSON OBJECT. No other text."""
                 "--continue",
                 probe_prompt,
             ],
-            cwd=project_path,
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            timeout=60,
+            project_path,
+            timeout=PROBE_TIMEOUT_SECONDS,
         )
 
-        output = result.stdout
-
-        # Extract JSON (might be wrapped in markdown)
-        json_match = re.search(r"```json\s*(\{.*?\})\s*```", output, re.DOTALL)
-        if json_match:
-            json_str = json_match.group(1)
-        else:
-            # Try to find raw JSON
-            json_match = re.search(r'(\{[^{}]*"status"[^{}]*\})', output, re.DOTALL)
+        if json_str is None:
+            # Extract JSON (might be wrapped in markdown)
+            json_match = re.search(r"```json\s*(\{.*?\})\s*```", output, re.DOTALL)
             if json_match:
                 json_str = json_match.group(1)
             else:
-                json_str = output
+                # Try to find raw JSON
+                json_match = re.search(r'(\{[^{}]*"status"[^{}]*\})', output, re.DOTALL)
+                if json_match:
+                    json_str = json_match.group(1)
+                else:
+                    json_str = output
 
         status = json.loads(json_str)
         return status
 
     except subprocess.TimeoutExpired:
-        logger.warning("Probe timeout after 60s")
+        logger.warning(f"Probe timeout after {PROBE_TIMEOUT_SECONDS}s")
         return {
             "status": "error",
             "message": "Probe timeout",
@@ -227,8 +431,11 @@ def run_commit_rescue(project_path: Path, spec_name: str) -> bool:
             logger.warning("commit-rescue.py not found, skipping rescue")
             return False
 
+        # The rescue script runs its git commands relative to the process cwd and
+        # calls sys.exit(), so it stays out-of-process; reuse the running
+        # interpreter rather than resolving "python" from PATH.
         result = subprocess.run(
-            ["python", str(rescue_script), spec_name],
+            [sys.executable, str(rescue_script), spec_name],
             cwd=project_path,
             capture_output=True,  # Capture to avoid polluting logs
             text=True,
@@ -316,7 +523,7 @@ def smart_completion_check(
                 if run_commit_rescue(project_path, spec_name):
                     rescued = True
                     # Re-check commits after rescue
-                    new_commits = get_new_commits_count(project_path, baseline_commit)
+                    new_commits = _count_commits_after_rescue(project_path, baseline_commit)
                     if new_commits > 0:
                         logger.info(f"Rescue successful - {new_commits} commits created")
                         return CompletionResult(
@@ -378,7 +585,7 @@ def smart_completion_check(
         logger.info(f"Final rescue attempt ({len(changes['changed_files'])} files changed)")
         if run_commit_rescue(project_path, spec_name):
             rescued = True
-            new_commits = get_new_commits_count(project_path, baseline_commit)
+            new_commits = _count_commits_after_rescue(project_path, baseline_commit)
             if new_commits > 0:
                 logger.info(f"Final rescue successful - {new_commits} commits created")
                 return CompletionResult(
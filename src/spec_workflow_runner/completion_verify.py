@@ -5,14 +5,20 @@ Verifies implementation completeness, updates tasks.md, and makes git commits.
 
 from __future__ import annotations
 
+import functools
 import json
 import re
+import shutil
 import sys
 from dataclasses import dataclass
 from pathlib import Path
 
 from .progress_count import CHECKBOX_PATTERN
-from .subprocess_helpers import run_command
+
+# Resolved once so each git invocation skips the PATH search
+_GIT_EXE = shutil.which("git") or "git"
+
+_IN_PROGRESS_LINE_PATTERN = re.compile(r"^(\s*-\s+)\[-\](\s+.*)$", re.MULTILINE)
 
 
 @dataclass(frozen=True)
@@ -84,6 +90,17 @@ def extract_acceptance_criteria(task_text: str) -> AcceptanceCriteria | None:
       - [ ] Criterion 1
       - [x] Criterion 2
     """
+    parsed = _parse_acceptance_criteria(task_text)
+    if parsed is None:
+        return None
+
+    criteria, checked = parsed
+    return AcceptanceCriteria(criteria=list(criteria), checked=list(checked))
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_acceptance_criteria(task_text: str) -> tuple[tuple[str, ...], tuple[bool, ...]] | None:
+    """Parse acceptance checkboxes; cached since unfinished tasks are re-verified each pass."""
     # Find acceptance section
     acceptance_match = re.search(
         r"-\s+\*\*Acceptance(?:\s+Criteria)?\*\*:\s*\n((?:\s+-\s+\[[ x]\].*\n?)+)",
@@ -109,7 +126,7 @@ def extract_acceptance_criteria(task_text: str) -> AcceptanceCriteria | None:
     if not criteria:
         return None
 
-    return AcceptanceCriteria(criteria=criteria, checked=checked)
+    return tuple(criteria), tuple(checked)
 
 
 def get_modified_files(project_path: Path, since_ref: str = "HEAD~1") -> list[str]:
@@ -122,10 +139,12 @@ def get_modified_files(project_path: Path, since_ref: str = "HEAD~1") -> list[st
     Returns:
         List of modified file paths
     """
+    from .subprocess_helpers import run_command
+
     try:
         # Get staged and unstaged changes
         result = run_command(
-            ["git", "diff", "--name-only", "HEAD"],
+            [_GIT_EXE, "diff", "--name-only", "HEAD"],
             cwd=project_path,
             check=False,
         )
@@ -266,7 +285,14 @@ def verify_in_progress_tasks(
 
 def extract_files_from_task_section(task_text: str) -> list[str]:
     """Extract file paths from task section."""
-    files = []
+    return list(_extract_file_paths(task_text))
+
+
+@functools.lru_cache(maxsize=1024)
+def _extract_file_paths(task_text: str) -> tuple[str, ...]:
+    """Extract deduplicated file paths; cached since unfinished tasks are re-verified each pass."""
+    files: list[str] = []
+    seen: set[str] = set()
 
     # Pattern: - **File**: path or - **Files**:
     file_field = re.findall(r"-\s+\*\*Files?\*\*:\s*(.+)", task_text)
@@ -274,15 +300,17 @@ def extract_files_from_task_section(task_text: str) -> list[str]:
         paths = re.split(r"[,\n]", match)
         for path in paths:
             path = path.strip().strip("`").strip("(").strip(")").strip()
-            if path and not path.startswith("-"):
+            if path and not path.startswith("-") and path not in seen:
+                seen.add(path)
                 files.append(path)
 
     # Pattern: `path/to/file.ext` in backticks
-    backtick_files = re.findall(r"`([^`]+\.\w+)`", task_text)
-    files.extend(backtick_files)
+    for path in re.findall(r"`([^`]+\.\w+)`", task_text):
+        if path not in seen:
+            seen.add(path)
+            files.append(path)
 
-    # Deduplicate
-    return list(dict.fromkeys(files))
+    return tuple(files)
 
 
 def update_verified_tasks(tasks_md_path: Path, verified_tasks: list[TaskVerification]) -> int:
@@ -295,28 +323,26 @@ def update_verified_tasks(tasks_md_path: Path, verified_tasks: list[TaskVerifica
     Returns:
         Number of tasks marked complete
     """
-    if not verified_tasks:
+    # Title prefixes still waiting for their [-] line, in task order
+    pending = [task.title[:30] for task in verified_tasks if task.should_mark_complete]
+    if not pending:
         return 0
 
     content = tasks_md_path.read_text(encoding="utf-8")
     completed_count = 0
 
-    for task in verified_tasks:
-        if not task.should_mark_complete:
-            continue
-
-        # Find and replace [-] with [x] for this task
-        pattern = re.compile(
-            rf"^(\s*-\s+)\[-\](\s+.*{re.escape(task.title[:30])}.*?)$",
-            re.MULTILINE,
-        )
-
-        match = pattern.search(content)
-        if match:
-            new_content = pattern.sub(r"\1[x]\2", content, count=1)
-            if new_content != content:
-                content = new_content
+    def _mark_complete(match: re.Match[str]) -> str:
+        nonlocal completed_count
+        rest = match.group(2)
+        for index, prefix in enumerate(pending):
+            if prefix in rest[1:]:
+                del pending[index]
                 completed_count += 1
+                return f"{match.group(1)}[x]{rest}"
+        return match.group(0)
+
+    # Single pass over in-progress lines instead of one compiled regex per task
+    content = _IN_PROGRESS_LINE_PATTERN.sub(_mark_complete, content)
 
     if completed_count > 0:
         tasks_md_path.write_text(content, encoding="utf-8")
@@ -339,6 +365,8 @@ def make_commit_for_verified_work(
     Returns:
         List of commit SHAs created
     """
+    from .subprocess_helpers import run_command
+
     commits = []
 
     # Group verified tasks by completion status
@@ -349,7 +377,7 @@ def make_commit_for_verified_work(
 
     # Stage all modified files
     try:
-        run_command(["git", "add", "-A"], cwd=project_path, check=True)
+        run_command([_GIT_EXE, "add", "-A"], cwd=project_path, check=True)
 
         # Create commit message
         task_ids = [t.task_id for t in completed_tasks]
@@ -365,7 +393,7 @@ def make_commit_for_verified_work(
 
         # Make commit
         result = run_command(
-            ["git", "commit", "-m", commit_msg],
+            [_GIT_EXE, "commit", "-m", commit_msg],
             cwd=project_path,
             check=False,
         )
@@ -373,7 +401,7 @@ def make_commit_for_verified_work(
         if result.returncode == 0:
             # Get commit SHA
             sha_result = run_command(
-                ["git", "rev-parse", "HEAD"],
+                [_GIT_EXE, "rev-parse", "HEAD"],
                 cwd=project_path,
                 check=True,
             )
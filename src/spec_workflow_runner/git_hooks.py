@@ -5,10 +5,27 @@ Installs temporary pre-commit hooks to prevent commits during implementation.
 
 from __future__ import annotations
 
-import stat
+import errno
+import os
 from contextlib import contextmanager
 from pathlib import Path
 
+# os.link errnos meaning the filesystem cannot hard-link (exFAT, many FUSE/SMB mounts)
+_NO_HARD_LINK_ERRNOS = frozenset(
+    {errno.EPERM, errno.EXDEV, errno.ENOTSUP, getattr(errno, "EOPNOTSUPP", errno.ENOTSUP)}
+)
+
+# Blocking pre-commit hook, encoded once at import
+_HOOK_SCRIPT: bytes = """#!/bin/sh
+# Temporary hook installed by spec-workflow-runner
+# Blocks commits during implementation phase
+
+echo "❌ Commits are blocked during implementation phase"
+echo "   The runner will create commits during post-session verification"
+echo "   after validating that acceptance criteria are met."
+exit 1
+""".encode()
+
 
 class GitHookManager:
     """Manages temporary git hooks for commit control."""
@@ -23,6 +40,7 @@ class GitHookManager:
         self.hooks_dir = repo_path / ".git" / "hooks"
         self.pre_commit_hook = self.hooks_dir / "pre-commit"
         self.backup_hook = self.hooks_dir / "pre-commit.backup"
+        self.tmp_hook = self.hooks_dir / "pre-commit.tmp"
 
     def install_commit_blocker(self) -> bool:
         """Install pre-commit hook that blocks all commits.
@@ -30,34 +48,63 @@ class GitHookManager:
         Returns:
             True if installed successfully, False otherwise
         """
-        if not self.hooks_dir.exists():
-            return False
-
         # Backup existing hook if present
-        if self.pre_commit_hook.exists():
-            if not self.backup_hook.exists():
-                self.pre_commit_hook.rename(self.backup_hook)
-            else:
-                # Backup already exists, remove current hook
-                self.pre_commit_hook.unlink()
-
-        # Create blocking hook
-        hook_content = """#!/bin/sh
-# Temporary hook installed by spec-workflow-runner
-# Blocks commits during implementation phase
+        self._backup_existing_hook()
+
+        # Write to a temp file created executable, then swap it in so a
+        # concurrent commit never sees a partial or non-executable hook
+        try:
+            fd = os.open(self.tmp_hook, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+        except (FileNotFoundError, NotADirectoryError):
+            # Hooks directory is missing, or .git is a file (worktree, submodule)
+            return False
+        try:
+            try:
+                # A leftover temp file keeps its old mode; O_CREAT's mode only
+                # applies to new files (Windows has no fchmod or exec bit)
+                if hasattr(os, "fchmod"):
+                    os.fchmod(fd, 0o755)
+                os.write(fd, _HOOK_SCRIPT)
+            finally:
+                os.close(fd)
+            os.replace(self.tmp_hook, self.pre_commit_hook)
+        except BaseException:
+            self.tmp_hook.unlink(missing_ok=True)
+            raise
 
-echo "❌ Commits are blocked during implementation phase"
-echo "   The runner will create commits during post-session verification"
-echo "   after validating that acceptance criteria are met."
-exit 1
-"""
+        return True
 
-        self.pre_commit_hook.write_text(hook_content)
+    def _backup_existing_hook(self) -> None:
+        """Move an existing pre-commit hook aside without overwriting an older backup.
 
-        # Make executable
-        self.pre_commit_hook.chmod(self.pre_commit_hook.stat().st_mode | stat.S_IEXEC)
+        A hard link claims the backup name atomically (FileExistsError when a
+        backup is already there), so no exists() probes are needed.
+        """
+        try:
+            os.link(self.pre_commit_hook, self.backup_hook, follow_symlinks=False)
+        except FileExistsError:
+            # Backup already exists, remove current hook
+            self.pre_commit_hook.unlink(missing_ok=True)
+            return
+        except (FileNotFoundError, NotADirectoryError):
+            # No hook to back up (or no hooks directory, or .git is a file)
+            return
+        except OSError as e:
+            if e.errno not in _NO_HARD_LINK_ERRNOS:
+                raise
+            self._backup_existing_hook_by_rename()
+            return
+        self.pre_commit_hook.unlink()
 
-        return True
+    def _backup_existing_hook_by_rename(self) -> None:
+        """Move an existing pre-commit hook aside with exists() checks and rename."""
+        if not self.pre_commit_hook.exists():
+            return
+        if not self.backup_hook.exists():
+            self.pre_commit_hook.rename(self.backup_hook)
+        else:
+            # Backup already exists, remove current hook
+            self.pre_commit_hook.unlink()
 
     def remove_commit_blocker(self) -> bool:
         """Remove pre-commit hook and restore backup if exists.
@@ -65,15 +112,17 @@ exit 1
         Returns:
             True if removed successfully, False otherwise
         """
-        if not self.pre_commit_hook.exists():
-            return True
-
         # Remove blocking hook
-        self.pre_commit_hook.unlink()
+        try:
+            self.pre_commit_hook.unlink()
+        except (FileNotFoundError, NotADirectoryError):
+            return True
 
         # Restore backup if exists
-        if self.backup_hook.exists():
+        try:
             self.backup_hook.rename(self.pre_commit_hook)
+        except (FileNotFoundError, NotADirectoryError):
+            pass
 
         return True
 
@@ -83,11 +132,13 @@ exit 1
         Returns:
             True if blocker is installed, False otherwise
         """
-        if not self.pre_commit_hook.exists():
+        # The markers sit in the header comment, so the first block is enough
+        try:
+            with open(self.pre_commit_hook, "rb") as handle:
+                head = handle.read(512)
+        except (FileNotFoundError, NotADirectoryError):
             return False
-
-        content = self.pre_commit_hook.read_text()
-        return "spec-workflow-runner" in content and "Blocks commits" in content
+        return b"spec-workflow-runner" in head and b"Blocks commits" in head
 
 
 @contextmanager
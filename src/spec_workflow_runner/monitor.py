@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import os
 import time
 from collections import deque
 from pathlib import Path
@@ -21,9 +22,13 @@ from .utils import (
     discover_projects,
     discover_specs,
     load_config,
+    mtime_is_settled,
     read_task_stats,
 )
 
+# Poll interval right after a change; doubles while idle up to the configured refresh
+MIN_POLL_SECONDS = 0.25
+
 
 def parse_args() -> argparse.Namespace:
     """Return CLI arguments for the monitor."""
@@ -82,18 +87,25 @@ class LogFollower:
         """Return the currently buffered lines."""
         return list(self._lines)
 
-    def poll(self) -> None:
-        """Read newly written data from the log file."""
+    def poll(self) -> bool:
+        """Read newly written data from the log file.
+
+        Returns:
+            True if the followed file or its buffered lines changed
+        """
         latest = self._latest_path()
         if latest is None:
+            changed = self.current_path is not None
             self.current_path = None
             self.offset = 0
             self._lines.clear()
-            return
+            return changed
+        changed = False
         if self.current_path != latest:
             self.current_path = latest
             self.offset = 0
             self._lines.clear()
+            changed = True
         size = latest.stat().st_size
         if size < self.offset:
             self.offset = 0
@@ -104,6 +116,8 @@ class LogFollower:
                 self.offset = handle.tell()
             for line in chunk.splitlines():
                 self._lines.append(line)
+            changed = True
+        return changed
 
     def render_panel(self) -> Panel:
         """Return a Rich Panel describing the current log tail."""
@@ -126,36 +140,54 @@ class LogFollower:
         return max(candidates, key=lambda path: path.stat().st_mtime)
 
 
-def build_dashboard(
-    project: Path,
-    spec_name: str,
-    stats: TaskStats,
-    log_panel: Panel,
-) -> Group:
-    """Return Rich renderables summarizing the current progress and logs."""
-    table = Table.grid(padding=(0, 1))
-    table.add_row("[bold]Project[/bold]", str(project))
-    table.add_row("[bold]Spec[/bold]", spec_name)
-    table.add_row("[bold]Total Tasks[/bold]", str(stats.total))
-    table.add_row("[bold]Completed[/bold]", str(stats.done))
-    table.add_row("[bold]In Progress[/bold]", str(stats.in_progress))
-    table.add_row("[bold]Pending[/bold]", str(stats.pending))
-
-    progress = Progress(
-        TextColumn("[bold blue]Tasks[/bold blue]"),
-        BarColumn(bar_width=None),
-        TextColumn("{task.completed}/{task.total}"),
-        expand=True,
-    )
-    task_id = progress.add_task("tasks", total=max(stats.total, 1))
-    progress.update(task_id, completed=stats.done)
+class Dashboard:
+    """Rich renderables summarizing progress, built once and updated in place."""
 
-    summary = Panel(
-        Group(table, progress),
-        title="Spec Workflow Monitor",
-        border_style="green" if stats.pending == 0 and stats.in_progress == 0 else "yellow",
-    )
-    return Group(summary, log_panel)
+    def __init__(self, project: Path, spec_name: str) -> None:
+        self._total = Text()
+        self._done = Text()
+        self._in_progress = Text()
+        self._pending = Text()
+
+        table = Table.grid(padding=(0, 1))
+        table.add_row("[bold]Project[/bold]", str(project))
+        table.add_row("[bold]Spec[/bold]", spec_name)
+        table.add_row("[bold]Total Tasks[/bold]", self._total)
+        table.add_row("[bold]Completed[/bold]", self._done)
+        table.add_row("[bold]In Progress[/bold]", self._in_progress)
+        table.add_row("[bold]Pending[/bold]", self._pending)
+
+        self._progress = Progress(
+            TextColumn("[bold blue]Tasks[/bold blue]"),
+            BarColumn(bar_width=None),
+            TextColumn("{task.completed}/{task.total}"),
+            expand=True,
+        )
+        self._task_id = self._progress.add_task("tasks", total=1)
+
+        self._summary = Panel(
+            Group(table, self._progress),
+            title="Spec Workflow Monitor",
+            border_style="yellow",
+        )
+
+    def update(self, stats: TaskStats, log_panel: Panel) -> Group:
+        """Refresh the counts and return the dashboard with the given log panel."""
+        self._total.plain = str(stats.total)
+        self._done.plain = str(stats.done)
+        self._in_progress.plain = str(stats.in_progress)
+        self._pending.plain = str(stats.pending)
+        self._progress.update(self._task_id, total=max(stats.total, 1), completed=stats.done)
+        self._summary.border_style = (
+            "green" if stats.pending == 0 and stats.in_progress == 0 else "yellow"
+        )
+        return Group(self._summary, log_panel)
+
+
+def _file_signature(path: Path) -> tuple[int, int]:
+    """Return (mtime_ns, size) so unchanged files can be skipped without reading."""
+    stat_result = os.stat(path)
+    return stat_result.st_mtime_ns, stat_result.st_size
 
 
 def monitor(cfg: Config, project: Path, spec_name: str, spec_path: Path) -> None:
@@ -171,16 +203,39 @@ def monitor(cfg: Config, project: Path, spec_name: str, spec_path: Path) -> None
         cfg.log_file_template.replace("{index}", "*") if "{index}" in cfg.log_file_template else "*"
     )
     follower = LogFollower(log_dir, pattern)
+    dashboard = Dashboard(project, spec_name)
 
-    with Live(console=console, refresh_per_second=4) as live:
+    min_sleep = min(MIN_POLL_SECONDS, refresh)
+    sleep_for = min_sleep
+    last_signature = _file_signature(tasks_path)
+    stats = read_task_stats(tasks_path)
+    tasks_changed = True
+
+    # Only repaint when something changed instead of auto-refreshing on a timer
+    with Live(console=console, auto_refresh=False) as live:
         while True:
-            stats = read_task_stats(tasks_path)
-            follower.poll()
-            live.update(build_dashboard(project, spec_name, stats, follower.render_panel()))
-            if stats.pending == 0 and stats.in_progress == 0:
-                console.print("[bold green]All tasks complete![/bold green]")
-                break
-            time.sleep(refresh)
+            logs_changed = follower.poll()
+
+            if tasks_changed or logs_changed:
+                live.update(dashboard.update(stats, follower.render_panel()), refresh=True)
+                if stats.pending == 0 and stats.in_progress == 0:
+                    console.print("[bold green]All tasks complete![/bold green]")
+                    break
+                sleep_for = min_sleep
+            else:
+                # Back off while idle, never sleeping longer than the configured refresh
+                sleep_for = min(sleep_for * 2, refresh)
+            time.sleep(sleep_for)
+
+            signature = _file_signature(tasks_path)
+            tasks_changed = signature != last_signature
+            # A same-size checkbox flip in the same timestamp tick keeps the
+            # signature, so keep re-reading until the mtime has settled
+            if tasks_changed or not mtime_is_settled(signature[0]):
+                last_signature = signature
+                new_stats = read_task_stats(tasks_path)
+                tasks_changed = tasks_changed or new_stats != stats
+                stats = new_stats
 
 
 def main() -> int:
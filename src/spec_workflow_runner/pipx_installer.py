@@ -49,6 +49,7 @@ class JsonLogger:
     def __init__(self, *, debug: bool, now: NowFunc) -> None:
         self._debug_enabled = debug
         self._now = now
+        self._service = SERVICE_NAME
 
     def info(self, event: str, **context: object) -> None:
         self._emit("info", event, context)
@@ -65,11 +66,12 @@ class JsonLogger:
         payload = {
             "ts": self._now().isoformat(),
             "level": level,
-            "service": SERVICE_NAME,
+            "service": self._service,
             "event": event,
             "context": {key: _stringify(value) for key, value in context.items()},
         }
-        print(json.dumps(payload))
+        # One compact write per line instead of print()'s separate newline write
+        sys.stdout.write(json.dumps(payload, separators=(",", ":")) + "\n")
 
 
 def parse_args() -> argparse.Namespace:
@@ -204,13 +206,17 @@ def install_target(
 
 
 def _normalize_target(raw: str) -> str:
-    path = Path(raw)
-    if path.exists():
-        return str(path.resolve())
-    return raw
+    # strict resolution doubles as the existence check, saving a separate stat;
+    # a symlink loop raises RuntimeError rather than OSError before Python 3.13
+    try:
+        return str(Path(raw).resolve(strict=True))
+    except (OSError, RuntimeError):
+        return raw
 
 
 def _stringify(value: object) -> str:
+    if isinstance(value, str):
+        return value
     if isinstance(value, Path):
         return str(value)
     if value is None:
@@ -12,8 +12,10 @@ from __future__ import annotations
 
 import re
 import sys
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
+from typing import BinaryIO
 
 
 @dataclass(frozen=True)
@@ -46,6 +48,14 @@ class TaskProgress:
             "percentage": round(self.percentage, 1),
         }
 
+    def to_json(self) -> str:
+        """Serialize to compact JSON without importing the json module."""
+        return (
+            f'{{"pending": {self.pending}, "in_progress": {self.in_progress}, '
+            f'"completed": {self.completed}, "total": {self.total}, '
+            f'"percentage": {round(self.percentage, 1)}}}'
+        )
+
     def summary(self) -> str:
         """Human-readable summary."""
         return (
@@ -54,106 +64,202 @@ class TaskProgress:
         )
 
 
-# Regex pattern for checkbox tasks
+# Regex pattern for checkbox tasks, used by callers that need titles.
+# count_tasks uses the cheaper _COUNT_PATTERN below.
 # Matches: - [ ] 1. Task or - [x] Task or - [-] 2.1 Task
 CHECKBOX_PATTERN = re.compile(
     r"^\s*-\s+\[(?P<state>[ x\-])\]\s+(?:\d+(?:\.\d+)?\.\s+)?(?P<title>.+)$",
     re.MULTILINE,
 )
 
+# Heading-based tasks (#### Task XX-N) that the checkbox format replaces
+_HEADING_TASK_PATTERN = re.compile(rb"^#{3,4}\s+Task\s+[A-Z]+-\d+", re.MULTILINE)
+
+# Counting-only variant of CHECKBOX_PATTERN: ASCII bytes, no title capture,
+# just a lookahead requiring a title on the same line
+_COUNT_PATTERN = re.compile(rb"^\s*-\s+\[([ x\-])\](?=[^\S\n]+\S)", re.MULTILINE | re.ASCII)
+
+# "## Tasks" header and the section body up to the next ## heading, in one search
+_TASKS_SECTION = re.compile(rb"## Tasks(.*?)(?=\n## |\Z)", re.DOTALL)
+
+# Read size for streaming tasks.md; blocks are trimmed back to the last newline
+_CHUNK_SIZE = 64 * 1024
+
+
+def _count_checkbox_states(task_text: bytes) -> tuple[int, int, int]:
+    """Count checkbox states in the raw bytes of a tasks section.
+
+    Args:
+        task_text: Raw bytes of the tasks section
+
+    Returns:
+        Tuple of (pending, in_progress, completed)
+    """
+    # Each captured state is exactly one byte, so joining them yields one byte
+    # per task and bytes.count tallies every state in C
+    states = b"".join(_COUNT_PATTERN.findall(task_text))
+    return states.count(b" "), states.count(b"-"), states.count(b"x")
 
-def count_tasks(tasks_md_path: Path) -> TaskProgress:
-    """Count tasks from tasks.md file.
+
+class _TaskSectionScanner:
+    """Incrementally count checkbox states in the "## Tasks" section.
+
+    Content is fed as blocks of whole lines. Tasks seen before the "## Tasks"
+    header are only kept when the file turns out to have no such header, in
+    which case the entire file is counted.
+    """
+
+    def __init__(self, *, check_format: bool) -> None:
+        self.check_format = check_format
+        self.counts = (0, 0, 0)
+        self.has_tasks_header = False
+        self.has_heading_tasks = False
+        self.section_done = False
+
+    def _add(self, block: bytes) -> None:
+        pending, in_progress, completed = _count_checkbox_states(block)
+        self.counts = (
+            self.counts[0] + pending,
+            self.counts[1] + in_progress,
+            self.counts[2] + completed,
+        )
+
+    def feed(self, block: bytes) -> bool:
+        """Consume a block of whole lines.
+
+        Returns:
+            True once nothing further in the file can change the result
+        """
+        if self.check_format and not self.has_heading_tasks:
+            self.has_heading_tasks = _HEADING_TASK_PATTERN.search(block) is not None
+        if self.section_done:
+            return not self.check_format or self.has_heading_tasks
+
+        if self.has_tasks_header:
+            # Blocks end on a newline, so a section heading may open this one
+            section_end = 0 if block.startswith(b"## ") else block.find(b"\n## ")
+            if section_end == -1:
+                self._add(block)
+                return False
+            self._add(block[:section_end])
+        else:
+            match = _TASKS_SECTION.search(block)
+            if match is None:
+                self._add(block)
+                return False
+            # Found the section: discard anything counted before it
+            self.has_tasks_header = True
+            self.counts = (0, 0, 0)
+            self._add(match.group(1))
+            if match.end() == len(block):
+                # The section may continue into the next block
+                return False
+
+        self.section_done = True
+        return not self.check_format or self.has_heading_tasks
+
+
+def _iter_line_blocks(stream: BinaryIO) -> Iterator[bytes]:
+    """Yield blocks of whole lines read from a binary stream in fixed-size chunks."""
+    tail = b""
+    while chunk := stream.read(_CHUNK_SIZE):
+        cut = chunk.rfind(b"\n") + 1
+        if cut == 0:
+            tail += chunk
+            continue
+        yield tail + chunk[:cut]
+        tail = chunk[cut:]
+    if tail:
+        yield tail
+
+
+def _scan(tasks_md_path: Path, *, check_format: bool) -> tuple[TaskProgress | None, list[str]]:
+    """Stream tasks.md once and derive both the progress counts and format errors.
+
+    The file is read in chunks so memory stays constant for large generated
+    specs, and counting stops at the end of the Tasks section unless the
+    format checks still need the rest of the file.
 
     Args:
         tasks_md_path: Path to tasks.md file
+        check_format: Whether to run the format checks used by validate_format
 
     Returns:
-        TaskProgress object with counts
+        Tuple of (progress or None when no checkbox tasks exist, format errors)
 
     Raises:
         FileNotFoundError: If tasks.md doesn't exist
-        ValueError: If no tasks found in file
     """
-    if not tasks_md_path.exists():
-        raise FileNotFoundError(f"File not found: {tasks_md_path}")
-
-    content = tasks_md_path.read_text(encoding="utf-8")
-
-    # Extract Tasks section (stop at next ## heading)
-    tasks_section_start = content.find("## Tasks")
-    if tasks_section_start != -1:
-        task_text_start = tasks_section_start + len("## Tasks")
-        next_section = content.find("\n## ", task_text_start)
-        if next_section == -1:
-            task_text = content[tasks_section_start:]
-        else:
-            task_text = content[tasks_section_start:next_section]
-    else:
-        # Use entire file if no Tasks section
-        task_text = content
+    scanner = _TaskSectionScanner(check_format=check_format)
+    try:
+        with open(tasks_md_path, "rb", buffering=0) as stream:
+            for block in _iter_line_blocks(stream):
+                if scanner.feed(block):
+                    break
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {tasks_md_path}") from None
 
-    # Count checkboxes
-    pending = in_progress = completed = 0
+    errors: list[str] = []
+    if check_format:
+        # Check for invalid heading-based format
+        if scanner.has_heading_tasks:
+            errors.append(
+                "Invalid format detected: Heading-based tasks (#### Task XX-N) are not allowed. "
+                "Use checkbox format: '- [ ] N. Task title'"
+            )
+
+        # Check for tasks section
+        if not scanner.has_tasks_header:
+            errors.append("Missing '## Tasks' section header")
 
-    for match in CHECKBOX_PATTERN.finditer(task_text):
-        state = match.group("state")
-        if state == "x":
-            completed += 1
-        elif state == "-":
-            in_progress += 1
-        else:  # space
-            pending += 1
+    pending, in_progress, completed = scanner.counts
 
     if pending + in_progress + completed == 0:
-        raise ValueError(
+        errors.append(
             f"No checkbox tasks found in {tasks_md_path}. Expected format: '- [ ] Task title'"
         )
+        return None, errors
 
-    return TaskProgress(
+    progress = TaskProgress(
         pending=pending,
         in_progress=in_progress,
         completed=completed,
     )
+    return progress, errors
 
 
-def validate_format(tasks_md_path: Path) -> list[str]:
-    """Validate that tasks.md uses checkbox format.
+def count_tasks(tasks_md_path: Path) -> TaskProgress:
+    """Count tasks from tasks.md file.
 
     Args:
         tasks_md_path: Path to tasks.md file
 
     Returns:
-        List of validation errors (empty if valid)
-    """
-    errors: list[str] = []
+        TaskProgress object with counts
 
-    if not tasks_md_path.exists():
-        errors.append(f"File not found: {tasks_md_path}")
-        return errors
+    Raises:
+        FileNotFoundError: If tasks.md doesn't exist
+        ValueError: If no tasks found in file
+    """
+    progress, errors = _scan(tasks_md_path, check_format=False)
+    if progress is None:
+        raise ValueError(errors[-1])
+    return progress
 
-    content = tasks_md_path.read_text(encoding="utf-8")
 
-    # Check for invalid heading-based format
-    heading_task_pattern = re.compile(r"^#{3,4}\s+Task\s+[A-Z]+-\d+", re.MULTILINE)
-    if heading_task_pattern.search(content):
-        errors.append(
-            "Invalid format detected: Heading-based tasks (#### Task XX-N) are not allowed. "
-            "Use checkbox format: '- [ ] N. Task title'"
-        )
+def validate_format(tasks_md_path: Path) -> list[str]:
+    """Validate that tasks.md uses checkbox format.
 
-    # Check for tasks section
-    if "## Tasks" not in content:
-        errors.append("Missing '## Tasks' section header")
+    Args:
+        tasks_md_path: Path to tasks.md file
 
-    # Check if we found any checkboxes
+    Returns:
+        List of validation errors (empty if valid)
+    """
     try:
-        progress = count_tasks(tasks_md_path)
-        if progress.total == 0:
-            errors.append("No checkbox tasks found. Expected format: '- [ ] N. Task title'")
-    except ValueError as e:
-        errors.append(str(e))
-
+        _, errors = _scan(tasks_md_path, check_format=True)
+    except FileNotFoundError as e:
+        return [str(e)]
     return errors
 
 
@@ -161,29 +267,34 @@ def main() -> int:
     """CLI entry point for progress counting.
 
     Usage:
-        python progress_count.py <path/to/tasks.md>
+        python progress_count.py [--json] <path/to/tasks.md>
         python progress_count.py --validate <path/to/tasks.md>
 
+    Count mode prints one line of compact JSON; --json pretty-prints it instead.
+
     Returns:
         Exit code (0 = success, 1 = error)
     """
-    import json
+    args = sys.argv[1:]
+    pretty_json = "--json" in args
+    if pretty_json:
+        args = [arg for arg in args if arg != "--json"]
 
-    if len(sys.argv) < 2:
-        print("Usage: progress_count.py [--validate] <path/to/tasks.md>", file=sys.stderr)
+    if not args:
+        print("Usage: progress_count.py [--validate | --json] <path/to/tasks.md>", file=sys.stderr)
         return 1
 
     validate_only = False
     tasks_path = None
 
-    if sys.argv[1] == "--validate":
+    if args[0] == "--validate":
         validate_only = True
-        if len(sys.argv) < 3:
+        if len(args) < 2:
             print("Usage: progress_count.py --validate <path/to/tasks.md>", file=sys.stderr)
             return 1
-        tasks_path = Path(sys.argv[2])
+        tasks_path = Path(args[1])
     else:
-        tasks_path = Path(sys.argv[1])
+        tasks_path = Path(args[0])
 
     # Validation mode
     if validate_only:
@@ -199,12 +310,18 @@ def main() -> int:
     # Count mode
     try:
         progress = count_tasks(tasks_path)
-        print(json.dumps(progress.to_dict(), indent=2))
-        return 0
     except (FileNotFoundError, ValueError) as e:
         print(f"❌ Error: {e}", file=sys.stderr)
         return 1
 
+    if pretty_json:
+        import json
+
+        print(json.dumps(progress.to_dict(), indent=2))
+    else:
+        print(progress.to_json())
+    return 0
+
 
 if __name__ == "__main__":
     sys.exit(main())
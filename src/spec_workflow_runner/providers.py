@@ -2,28 +2,56 @@
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
-from collections.abc import Sequence
-from dataclasses import dataclass
+import functools
+import sys
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from itertools import chain
 from pathlib import Path
+from types import MappingProxyType
+from typing import Protocol
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProviderCommand:
     """Command to execute for a provider."""
 
     executable: str
     args: Sequence[str]
+    argv: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    """Full command (executable followed by args), built once."""
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "argv", (self.executable, *self.args))
 
     def to_list(self) -> list[str]:
         """Convert to a list of command parts."""
-        return [self.executable, *self.args]
+        return list(self.argv)
+
+
+@functools.lru_cache(maxsize=128)
+def _override_args(config_overrides: tuple[tuple[str, str], ...]) -> tuple[str, ...]:
+    """Format config overrides as ``-c key=value`` command-line tokens.
+
+    Overrides are fixed per session while the prompt changes, so the formatted
+    tokens are cached instead of being rebuilt on every build_command call.
+
+    Args:
+        config_overrides: (key, value) pairs; must be a tuple so it can be cached
 
+    Returns:
+        Flat tuple of alternating ``-c`` flags and ``key=value`` tokens
+    """
+    return tuple(chain.from_iterable(("-c", f"{key}={value}") for key, value in config_overrides))
 
-class Provider(ABC):
-    """Abstract base class for AI providers."""
 
-    @abstractmethod
+class Provider(Protocol):
+    """Interface implemented by AI providers.
+
+    A Protocol rather than an ABC: the concrete providers below are plain
+    classes that satisfy it structurally, so they avoid ABCMeta dispatch.
+    """
+
     def build_command(
         self,
         prompt: str,
@@ -32,11 +60,9 @@ class Provider(ABC):
     ) -> ProviderCommand:
         """Build the command to execute for this provider."""
 
-    @abstractmethod
     def get_mcp_list_command(self) -> ProviderCommand:
         """Get command to list available MCP servers."""
 
-    @abstractmethod
     def get_mcp_add_command(self, server_name: str, package: str) -> ProviderCommand:
         """Get command to add an MCP server.
 
@@ -48,12 +74,11 @@ class Provider(ABC):
             Command to add the MCP server
         """
 
-    @abstractmethod
     def get_provider_name(self) -> str:
         """Get the human-readable provider name."""
 
 
-class CodexProvider(Provider):
+class CodexProvider:
     """Provider for Codex backend."""
 
     SUPPORTED_MODELS = (
@@ -70,6 +95,8 @@ class CodexProvider(Provider):
     ) -> None:
         self._base_command = tuple(base_command)
         self._model = model
+        # Everything before the per-call overrides and prompt is fixed per instance
+        self._prefix = self._base_command[1:] + (("--model", model) if model else ())
 
     def build_command(
         self,
@@ -78,14 +105,10 @@ class CodexProvider(Provider):
         config_overrides: Sequence[tuple[str, str]],
     ) -> ProviderCommand:
         """Build codex command with config overrides and model selection."""
-        executable = self._base_command[0]
-        args: list[str] = list(self._base_command[1:])
-        if self._model:
-            args.extend(["--model", self._model])
-        for key, value in config_overrides:
-            args.extend(["-c", f"{key}={value}"])
-        args.append(prompt)
-        return ProviderCommand(executable=executable, args=tuple(args))
+        overrides = _override_args(tuple(config_overrides))
+        return ProviderCommand(
+            executable=self._base_command[0], args=(*self._prefix, *overrides, prompt)
+        )
 
     def get_mcp_list_command(self) -> ProviderCommand:
         """Get command to list available MCP servers."""
@@ -100,7 +123,7 @@ class CodexProvider(Provider):
         return "Codex"
 
 
-class ClaudeProvider(Provider):
+class ClaudeProvider:
     """Provider for Claude CLI backend."""
 
     SUPPORTED_MODELS = (
@@ -119,28 +142,29 @@ class ClaudeProvider(Provider):
         self._skip_permissions = skip_permissions
         self._model = model
 
-    def build_command(
-        self,
-        prompt: str,
-        project_path: Path,
-        config_overrides: Sequence[tuple[str, str]],
-    ) -> ProviderCommand:
-        """Build claude command with permissions skipped for automation and model selection."""
-        args = ["--print"]
-        if self._model:
-            args.extend(["--model", self._model])
-        if self._skip_permissions:
-            args.append("--dangerously-skip-permissions")
+        prefix: tuple[str, ...] = ("--print",)
+        if model:
+            prefix += ("--model", model)
+        if skip_permissions:
+            prefix += ("--dangerously-skip-permissions",)
 
         # Use stream-json for real-time output visibility (requires --verbose)
-        args.extend(["--output-format", "stream-json", "--verbose"])
+        prefix += ("--output-format", "stream-json", "--verbose")
 
         # DO NOT load project MCP config in --print mode - it causes Claude to hang
         # Instead, rely on global MCP config (~/.claude/settings.json)
         # TODO: Investigate why --mcp-config causes readline() to block in subprocess
 
-        args.append(prompt)
-        return ProviderCommand(executable=self._executable, args=tuple(args))
+        self._prefix = prefix
+
+    def build_command(
+        self,
+        prompt: str,
+        project_path: Path,
+        config_overrides: Sequence[tuple[str, str]],
+    ) -> ProviderCommand:
+        """Build claude command with permissions skipped for automation and model selection."""
+        return ProviderCommand(executable=self._executable, args=(*self._prefix, prompt))
 
     def get_mcp_list_command(self) -> ProviderCommand:
         """Get command to list available MCP servers."""
@@ -157,7 +181,7 @@ class ClaudeProvider(Provider):
         return "Claude CLI"
 
 
-class GeminiProvider(Provider):
+class GeminiProvider:
     """Provider for Google Gemini CLI backend with maximum risk/efficiency settings."""
 
     SUPPORTED_MODELS = (
@@ -182,6 +206,13 @@ class GeminiProvider(Provider):
         self._model = model
         self._max_risk = max_risk
 
+        suffix: tuple[str, ...] = ()
+        if model:
+            suffix += ("--model", model)
+        if max_risk:
+            suffix += ("--yolo", "--output-format", "json")
+        self._suffix = suffix
+
     def build_command(
         self,
         prompt: str,
@@ -189,21 +220,7 @@ class GeminiProvider(Provider):
         config_overrides: Sequence[tuple[str, str]],
     ) -> ProviderCommand:
         """Build gemini command with maximum risk settings for efficiency."""
-        args = ["-p", prompt]
-
-        if self._model:
-            args.extend(["--model", self._model])
-
-        if self._max_risk:
-            args.extend(
-                [
-                    "--yolo",
-                    "--output-format",
-                    "json",
-                ]
-            )
-
-        return ProviderCommand(executable=self._executable, args=tuple(args))
+        return ProviderCommand(executable=self._executable, args=("-p", prompt, *self._suffix))
 
     def get_mcp_list_command(self) -> ProviderCommand:
         """Get command to list available MCP servers."""
@@ -220,15 +237,35 @@ class GeminiProvider(Provider):
         return "Google Gemini"
 
 
+# Read-only views so the dispatch tables cannot be mutated at runtime
+_SUPPORTED_MODELS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "codex": CodexProvider.SUPPORTED_MODELS,
+        "claude": ClaudeProvider.SUPPORTED_MODELS,
+        "gemini": GeminiProvider.SUPPORTED_MODELS,
+    }
+)
+
+_PROVIDER_FACTORIES: Mapping[str, Callable[[Sequence[str], str | None], Provider]] = (
+    MappingProxyType(
+        {
+            "codex": lambda base_command, model: CodexProvider(
+                base_command=base_command, model=model
+            ),
+            "claude": lambda base_command, model: ClaudeProvider(model=model),
+            "gemini": lambda base_command, model: GeminiProvider(model=model, max_risk=True),
+        }
+    )
+)
+
+
+@functools.cache
 def get_supported_models(provider_name: str) -> tuple[str, ...]:
     """Get the list of supported models for a given provider."""
-    if provider_name == "codex":
-        return CodexProvider.SUPPORTED_MODELS
-    if provider_name == "claude":
-        return ClaudeProvider.SUPPORTED_MODELS
-    if provider_name == "gemini":
-        return GeminiProvider.SUPPORTED_MODELS
-    raise ValueError(f"Unknown provider: {provider_name}")
+    try:
+        return _SUPPORTED_MODELS[provider_name]
+    except KeyError:
+        raise ValueError(f"Unknown provider: {provider_name}") from None
 
 
 def create_provider(
@@ -236,11 +273,27 @@ def create_provider(
     base_command: Sequence[str],
     model: str | None = None,
 ) -> Provider:
-    """Factory function to create a provider by name."""
-    if provider_name == "codex":
-        return CodexProvider(base_command=base_command, model=model)
-    if provider_name == "claude":
-        return ClaudeProvider(model=model)
-    if provider_name == "gemini":
-        return GeminiProvider(model=model, max_risk=True)
-    raise ValueError(f"Unknown provider: {provider_name}")
+    """Factory function to create a provider by name.
+
+    Providers hold no mutable state after construction, so instances are shared
+    between callers asking for the same provider, base command and model.
+    """
+    # Names usually arrive as fresh strings from CLI args or JSON; interning them
+    # lets the cache and factory-table lookups match by identity
+    return _create_provider(
+        sys.intern(provider_name), tuple(base_command), sys.intern(model) if model else model
+    )
+
+
+@functools.cache
+def _create_provider(
+    provider_name: str,
+    base_command: tuple[str, ...],
+    model: str | None,
+) -> Provider:
+    """Construct and cache a provider; base_command must be hashable."""
+    try:
+        factory = _PROVIDER_FACTORIES[provider_name]
+    except KeyError:
+        raise ValueError(f"Unknown provider: {provider_name}") from None
+    return factory(base_command, model)
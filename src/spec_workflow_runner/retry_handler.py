@@ -8,18 +8,26 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import subprocess
 import time
 from collections.abc import Callable
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 logger = logging.getLogger(__name__)
 
+# Compact encoder for retry log records, built once instead of per json.dumps call
+_RECORD_ENCODER = json.JSONEncoder(separators=(",", ":"))
 
-@dataclass(frozen=True)
+# Resolved retry log directories already created in this process, shared by all handlers
+_CREATED_LOG_DIRS: set[Path] = set()
+
+
+@dataclass(frozen=True, slots=True)
 class RetryConfig:
     """Configuration for retry behavior."""
 
@@ -45,7 +53,7 @@ class RetryConfig:
     """Maximum backoff delay in seconds (default: 300/5min)"""
 
 
-@dataclass
+@dataclass(slots=True)
 class RetryAttempt:
     """Record of a single retry attempt."""
 
@@ -55,8 +63,19 @@ class RetryAttempt:
     error_message: str | None
     duration_seconds: float
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging."""
+        # Fields are all primitives, so a plain dict avoids asdict's deep copy
+        return {
+            "attempt_number": self.attempt_number,
+            "timestamp": self.timestamp,
+            "exit_code": self.exit_code,
+            "error_message": self.error_message,
+            "duration_seconds": self.duration_seconds,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class RetryContext:
     """Context for tracking retry state across attempts."""
 
@@ -65,6 +84,11 @@ class RetryContext:
     project_path: Path
     attempts: list[RetryAttempt] = field(default_factory=list)
     start_time: datetime = field(default_factory=lambda: datetime.now(UTC))
+    project_path_str: str = field(init=False, repr=False, compare=False)
+    """project_path as a string, converted once for log records."""
+
+    def __post_init__(self) -> None:
+        self.project_path_str = os.fspath(self.project_path)
 
     @property
     def attempt_count(self) -> int:
@@ -81,8 +105,8 @@ class RetryContext:
         exit_code: int | None,
         error_message: str | None,
         duration: float,
-    ) -> None:
-        """Record a retry attempt."""
+    ) -> RetryAttempt:
+        """Record a retry attempt and return it."""
         attempt = RetryAttempt(
             attempt_number=self.attempt_count + 1,
             timestamp=datetime.now(UTC).isoformat(),
@@ -91,19 +115,33 @@ class RetryContext:
             duration_seconds=duration,
         )
         self.attempts.append(attempt)
+        return attempt
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for logging."""
+    def summary_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging, without the per-attempt records."""
         return {
             "runner_id": self.runner_id,
             "spec_name": self.spec_name,
-            "project_path": str(self.project_path),
+            "project_path": self.project_path_str,
             "start_time": self.start_time.isoformat(),
             "total_duration_seconds": self.total_duration_seconds,
             "attempt_count": self.attempt_count,
-            "attempts": [asdict(a) for a in self.attempts],
         }
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging."""
+        data = self.summary_dict()
+        data["attempts"] = [a.to_dict() for a in self.attempts]
+        return data
+
+
+class _Outcome(Enum):
+    """Result of a single execution attempt."""
+
+    SUCCESS = "success"
+    FAIL_RETRY = "fail_retry"
+    FAIL_GIVEUP = "fail_giveup"
+
 
 class RetryHandler:
     """Handles retry logic with crash detection and exponential backoff."""
@@ -115,70 +153,175 @@ class RetryHandler:
             config: Retry configuration
         """
         self.config = config
+        # Config is frozen and attempts never exceed max_retries + 1, so the
+        # whole backoff schedule is known up front
+        self._backoff_schedule = tuple(
+            self._compute_backoff(attempt) for attempt in range(1, config.max_retries + 2)
+        )
+        self._log_files: dict[str, TextIO] = {}
+        # Resolved once, so a later chdir cannot move the logs elsewhere
+        self._log_dir = config.retry_log_dir.resolve()
         self._ensure_log_dir()
 
     def _ensure_log_dir(self) -> None:
-        """Ensure retry log directory exists."""
-        self.config.retry_log_dir.mkdir(parents=True, exist_ok=True)
+        """Ensure retry log directory exists, creating it at most once per process."""
+        if self._log_dir in _CREATED_LOG_DIRS:
+            return
+        self._log_dir.mkdir(parents=True, exist_ok=True)
+        _CREATED_LOG_DIRS.add(self._log_dir)
 
-    def _calculate_backoff(self, attempt: int) -> float:
-        """Calculate exponential backoff delay.
+    def _open_retry_log(self, runner_id: str) -> TextIO:
+        """Open the runner's retry log for appending, recreating a deleted log directory.
 
         Args:
-            attempt: Current attempt number (1-indexed)
+            runner_id: Runner whose log file to open
 
         Returns:
-            Backoff delay in seconds
+            Buffered text handle positioned at the end of the log
         """
+        log_file = self._log_dir / f"{runner_id}.jsonl"
+        try:
+            return open(log_file, "a", buffering=8192, encoding="utf-8")
+        except FileNotFoundError:
+            # Directory removed since it was created (e.g. logs cleaned while the TUI runs)
+            _CREATED_LOG_DIRS.discard(self._log_dir)
+            self._ensure_log_dir()
+            return open(log_file, "a", buffering=8192, encoding="utf-8")
+
+    def _compute_backoff(self, attempt: int) -> float:
+        """Compute the capped exponential backoff delay for an attempt."""
         delay = self.config.retry_backoff_seconds * (
             self.config.backoff_multiplier ** (attempt - 1)
         )
         return min(delay, self.config.max_backoff_seconds)
 
-    def _log_retry_context(self, context: RetryContext) -> None:
-        """Log retry context to JSON file.
+    def _calculate_backoff(self, attempt: int) -> float:
+        """Calculate exponential backoff delay.
+
+        Args:
+            attempt: Current attempt number (1-indexed)
+
+        Returns:
+            Backoff delay in seconds
+        """
+        if attempt <= len(self._backoff_schedule):
+            return self._backoff_schedule[attempt - 1]
+        return self._compute_backoff(attempt)
+
+    def _append_retry_log(self, runner_id: str, record: dict[str, Any]) -> None:
+        """Append one JSON record to the runner's JSON Lines retry log.
 
         Args:
-            context: Retry context to log
+            runner_id: Runner whose log file receives the record
+            record: JSON-serializable record to append
         """
-        log_file = self.config.retry_log_dir / f"{context.runner_id}.json"
         try:
-            with open(log_file, "w", encoding="utf-8") as f:
-                json.dump(context.to_dict(), f, indent=2)
+            log_fh = self._log_files.get(runner_id)
+            if log_fh is None:
+                # Opened once per run and kept buffered; _close_retry_log flushes it
+                log_fh = self._open_retry_log(runner_id)
+                self._log_files[runner_id] = log_fh
+            log_fh.write(_RECORD_ENCODER.encode(record) + "\n")
         except Exception as e:
             logger.warning(f"Failed to write retry log: {e}")
 
-    def _should_retry(
+    def _close_retry_log(self, runner_id: str) -> None:
+        """Flush and close the runner's retry log if it was opened.
+
+        Args:
+            runner_id: Runner whose log file should be closed
+        """
+        log_fh = self._log_files.pop(runner_id, None)
+        if log_fh is None:
+            return
+        try:
+            log_fh.close()
+        except OSError as e:
+            logger.warning(f"Failed to write retry log: {e}")
+
+    def _log_retry_attempt(self, context: RetryContext, attempt: RetryAttempt) -> None:
+        """Append the latest attempt to the retry log.
+
+        Args:
+            context: Retry context the attempt belongs to
+            attempt: Attempt that just finished
+        """
+        self._append_retry_log(context.runner_id, {"event": "attempt", **attempt.to_dict()})
+
+    def _log_retry_summary(self, context: RetryContext, success: bool) -> None:
+        """Append the final outcome of a retry sequence to the retry log.
+
+        Args:
+            context: Retry context to summarize
+            success: Whether the last attempt succeeded
+        """
+        self._append_retry_log(
+            context.runner_id, {"event": "summary", "success": success, **context.summary_dict()}
+        )
+
+    def _run_one_attempt(
         self,
         context: RetryContext,
-        exit_code: int | None,
-    ) -> bool:
-        """Determine if subprocess should be retried.
+        attempt: int,
+        attempt_limit: int,
+        command_fn: Callable[[], subprocess.Popen[str]],
+        monitor_fn: Callable[[subprocess.Popen[str]], tuple[int | None, str | None]],
+    ) -> _Outcome:
+        """Run and record a single attempt, treating exceptions as crashes.
 
         Args:
-            context: Current retry context
-            exit_code: Exit code from subprocess (None if crash/timeout)
+            context: Retry context for tracking attempts
+            attempt: Current attempt number (1-indexed)
+            attempt_limit: Maximum number of attempts, for progress logging
+            command_fn: Callable that creates and returns subprocess
+            monitor_fn: Callable that monitors subprocess and returns (exit_code, error)
 
         Returns:
-            True if should retry, False otherwise
+            Outcome telling the caller whether to stop or back off and retry
         """
-        # Check if retry is enabled
-        if not self.config.retry_on_crash:
-            return False
-
-        # Check if max retries exceeded
-        if context.attempt_count >= self.config.max_retries:
-            logger.warning(
-                f"Max retries ({self.config.max_retries}) exceeded for runner {context.runner_id}"
+        runner_id = context.runner_id
+        start_time = time.monotonic()
+        logger.info(
+            "Attempt %d/%d for runner %s (spec: %s)",
+            attempt,
+            attempt_limit,
+            runner_id,
+            context.spec_name,
+        )
+
+        try:
+            process = command_fn()
+            exit_code, error_message = monitor_fn(process)
+        except Exception as e:
+            exit_code = None
+            error_message = f"Exception during execution: {e}"
+            logger.exception(error_message)
+        duration = time.monotonic() - start_time
+
+        self._log_retry_attempt(context, context.add_attempt(exit_code, error_message, duration))
+
+        if exit_code == 0:
+            logger.info(
+                "Runner %s completed successfully (attempt %d, duration: %.1fs)",
+                runner_id,
+                attempt,
+                duration,
             )
-            return False
+            self._log_retry_summary(context, success=True)
+            return _Outcome.SUCCESS
 
-        # Retry on crash (exit_code None or non-zero)
-        if exit_code is None or exit_code != 0:
-            return True
+        # Any non-zero or missing exit code is a crash; retry unless disabled or exhausted
+        config = self.config
+        if not config.retry_on_crash or context.attempt_count >= config.max_retries:
+            if config.retry_on_crash:
+                logger.warning(
+                    "Max retries (%d) exceeded for runner %s", config.max_retries, runner_id
+                )
+            logger.error("Runner %s failed after %d attempts", runner_id, attempt)
+            self._log_retry_summary(context, success=False)
+            return _Outcome.FAIL_GIVEUP
 
-        # Success - no retry needed
-        return False
+        return _Outcome.FAIL_RETRY
 
     def execute_with_retry(
         self,
@@ -196,72 +339,34 @@ class RetryHandler:
         Returns:
             Tuple of (success, updated_context)
         """
-        attempt = 0
-
-        while True:
-            attempt += 1
-            start_time = time.time()
-
-            logger.info(
-                f"Attempt {attempt}/{self.config.max_retries + 1} for "
-                f"runner {context.runner_id} (spec: {context.spec_name})"
-            )
+        # Attempts give up once max_retries are recorded, so the range only
+        # bounds the loop
+        max_retries = self.config.max_retries
+        attempt_limit = max_retries + 1
+        runner_id = context.runner_id
+        run_one_attempt = self._run_one_attempt
+
+        outcome = _Outcome.FAIL_GIVEUP
+        try:
+            for attempt in range(1, attempt_limit + 1):
+                outcome = run_one_attempt(context, attempt, attempt_limit, command_fn, monitor_fn)
+                if outcome is not _Outcome.FAIL_RETRY:
+                    break
 
-            try:
-                # Start subprocess
-                process = command_fn()
-
-                # Monitor subprocess
-                exit_code, error_message = monitor_fn(process)
-                duration = time.time() - start_time
-
-                # Record attempt
-                context.add_attempt(exit_code, error_message, duration)
-
-                # Check if successful
-                if exit_code == 0:
-                    logger.info(
-                        f"Runner {context.runner_id} completed successfully "
-                        f"(attempt {attempt}, duration: {duration:.1f}s)"
-                    )
-                    self._log_retry_context(context)
-                    return True, context
-
-                # Check if should retry
-                if not self._should_retry(context, exit_code):
-                    logger.error(f"Runner {context.runner_id} failed after {attempt} attempts")
-                    self._log_retry_context(context)
-                    return False, context
-
-                # Calculate backoff and retry
                 backoff = self._calculate_backoff(attempt)
                 logger.warning(
-                    f"Runner {context.runner_id} failed (exit_code: {exit_code}), "
-                    f"retrying in {backoff:.1f}s... "
-                    f"({attempt}/{self.config.max_retries} retries)"
+                    "Runner %s failed (exit_code: %s), retrying in %.1fs... (%d/%d retries)",
+                    runner_id,
+                    context.attempts[-1].exit_code,
+                    backoff,
+                    attempt,
+                    max_retries,
                 )
                 time.sleep(backoff)
+        finally:
+            self._close_retry_log(runner_id)
 
-            except Exception as e:
-                duration = time.time() - start_time
-                error_msg = f"Exception during execution: {e}"
-                logger.exception(error_msg)
-
-                # Record attempt
-                context.add_attempt(None, error_msg, duration)
-
-                # Check if should retry
-                if not self._should_retry(context, None):
-                    logger.error(
-                        f"Runner {context.runner_id} failed with exception after {attempt} attempts"
-                    )
-                    self._log_retry_context(context)
-                    return False, context
-
-                # Calculate backoff and retry
-                backoff = self._calculate_backoff(attempt)
-                logger.warning(f"Runner {context.runner_id} crashed, retrying in {backoff:.1f}s...")
-                time.sleep(backoff)
+        return outcome is _Outcome.SUCCESS, context
 
 
 def create_retry_handler(config: RetryConfig) -> RetryHandler:
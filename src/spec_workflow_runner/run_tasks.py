@@ -3,27 +3,47 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import io
 import json
 import logging
 import os
+import re
+import select
+import shutil
 import subprocess
 import sys
+import tempfile
 import textwrap
+import threading
 import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from itertools import repeat
 from pathlib import Path
-from typing import TextIO
+from typing import TextIO, cast
 
-from .completion_verify import run_verification
+from .completion_verify import VerificationResult, run_verification
 from .git_hooks import block_commits
 from .providers import ClaudeProvider, Provider, create_provider, get_supported_models
-from .subprocess_helpers import format_command_string, popen_command
+from .subprocess_helpers import (
+    format_command_string,
+    kill_process_group,
+    kill_process_group_on_abort,
+    popen_command,
+    safe_terminate_process,
+)
+from .tui.task_parser import TaskStatus, parse_tasks_file
 from .utils import (
     Config,
     RunnerError,
     TaskStats,
     check_clean_working_tree,
     choose_option,
+    classify_error,
     discover_projects,
     discover_specs,
     display_claude_flow_status,
@@ -33,18 +53,17 @@ from .utils import (
     get_current_commit,
     has_claude_flow_activity,
     has_uncommitted_changes,
-    is_context_limit_error,
-    is_no_messages_error,
-    is_rate_limit_error,
-    is_timeout_error,
     list_unfinished_specs,
     load_config,
-    read_task_details,
+    mtime_is_settled,
     read_task_stats,
+    read_tasks_cached,
+    read_tasks_text_cached,
     reduce_spec_context,
+    render_template,
     rotate_claude_account,
 )
-from .validation_check import run_validation
+from .validation_check import ValidationResult, run_validation
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +77,17 @@ def safe_print(text: str, **kwargs) -> None:
         print(text.encode("ascii", errors="replace").decode("ascii"), **kwargs)
 
 
+@functools.lru_cache(maxsize=1)
+def _format_hms(epoch_second: int) -> str:
+    """Format a whole epoch second as local HH:MM:SS."""
+    return time.strftime("%H:%M:%S", time.localtime(epoch_second))
+
+
+def _hms() -> str:
+    """Current local time as HH:MM:SS, formatted at most once per second."""
+    return _format_hms(int(time.time()))
+
+
 class AllSpecsSentinel:
     """Marker object representing the 'run all specs' selection."""
 
@@ -248,7 +278,7 @@ def poll_for_pending_tasks(project: Path, cfg: Config) -> None:
     poll_count = 0
     while True:
         poll_count += 1
-        current_time = datetime.now().strftime("%H:%M:%S")
+        current_time = _hms()
         print(f"[{current_time}] Poll #{poll_count}: Checking for pending tasks...")
 
         unfinished = list_unfinished_specs(project, cfg)
@@ -330,7 +360,7 @@ def run_all_specs(
 
         unfinished = list_unfinished_specs(project, cfg)
         if not unfinished:
-            current_time = datetime.now().strftime("%H:%M:%S")
+            current_time = _hms()
             print(f"\n[{current_time}] No unfinished specs remaining. All caught up!")
             print("Polling every 10 minutes for new specs. Press Ctrl+C to stop.")
             time.sleep(600)  # 10 minutes = 600 seconds
@@ -402,6 +432,51 @@ def ensure_model(provider_name: str, explicit_model: str | None) -> str | None:
     )[0]
 
 
+# Alternate tasks.md format: ### MEM-001: Title followed by a **Status** field
+_ALT_HEADING_PATTERN = re.compile(r"^### ([A-Z]+-\d+): (.+)$", re.MULTILINE)
+_ALT_STATUS_PATTERN = re.compile(r"\*\*Status\*\*:\s*(\w+)", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=512)
+def _checkbox_task_pattern(task_id: str) -> re.Pattern[str]:
+    """Compile (once per task ID) the pattern for a checkbox task line."""
+    return re.compile(rf"^(-\s+\[)[ x\-](\]\s+{re.escape(task_id)}\.\s+.+)$", re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=512)
+def _heading_task_pattern(task_id: str) -> re.Pattern[str]:
+    """Compile (once per task ID) the pattern for a heading task up to its status word.
+
+    Group 1 spans the heading through "**Status**: " without crossing into the
+    next ### heading, so the status word can be replaced in the same pass.
+    """
+    return re.compile(
+        rf"^(### {re.escape(task_id)}:(?:(?!\n### ).)*?\*\*Status\*\*:\s*)\w+",
+        re.MULTILINE | re.DOTALL,
+    )
+
+
+def _replace_tasks_file(tasks_file: Path, content: str) -> None:
+    """Swap new content into tasks.md so a crash or a concurrent reader never sees it truncated.
+
+    The temp file is written beside the symlink target with the target's mode,
+    so a symlinked tasks.md stays a symlink and keeps its permissions.
+    """
+    target = tasks_file.resolve()
+    tmp_file = target.with_name(f"{target.name}.tmp")
+    try:
+        tmp_file.write_text(content, encoding="utf-8")
+        shutil.copymode(target, tmp_file)
+        os.replace(tmp_file, target)
+    except PermissionError:
+        # Windows refuses to replace a file another process has open
+        tmp_file.unlink(missing_ok=True)
+        target.write_text(content, encoding="utf-8")
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
 def mark_task_status(tasks_file: Path, task_id: str, new_status: str) -> bool:
     """Mark a task with a new status in tasks.md.
 
@@ -414,48 +489,31 @@ def mark_task_status(tasks_file: Path, task_id: str, new_status: str) -> bool:
     Returns:
         True if task was found and updated, False otherwise
     """
-    if not tasks_file.exists():
+    try:
+        content = read_tasks_text_cached(tasks_file)
+    except FileNotFoundError:
         return False
 
-    content = tasks_file.read_text(encoding="utf-8")
-    import re
-
     # Try checkbox format first: - [ ] 1. Task title
-    task_pattern = re.compile(rf"^(-\s+\[)[ x\-](\]\s+{re.escape(task_id)}\.\s+.+)$", re.MULTILINE)
-    match = task_pattern.search(content)
-
-    if match:
-        # Checkbox format
-        new_line = f"{match.group(1)}{new_status}{match.group(2)}"
-        content = task_pattern.sub(new_line, content, count=1)
-        tasks_file.write_text(content, encoding="utf-8")
-        return True
-
-    # Try heading format: ### MEM-001: Title ... **Status**: Pending
-    status_map = {" ": "Pending", "-": "In Progress", "x": "Completed"}
-    status_word = status_map.get(new_status, new_status)
-
-    heading_pattern = re.compile(
-        rf"^### {re.escape(task_id)}:.+?(\*\*Status\*\*:\s*)\w+", re.MULTILINE | re.DOTALL
+    new_content, found = _checkbox_task_pattern(task_id).subn(
+        lambda m: f"{m.group(1)}{new_status}{m.group(2)}", content, count=1
     )
-    match = heading_pattern.search(content)
 
-    if match:
-        # Heading format - replace **Status**: Old with **Status**: New
-        old_status_pattern = re.compile(r"(\*\*Status\*\*:\s*)\w+")
-        # Find the status line after the heading
-        task_start = content.find(f"### {task_id}:")
-        task_section = content[task_start : task_start + 500]  # Look in next 500 chars
-        status_match = old_status_pattern.search(task_section)
+    if not found:
+        # Try heading format: ### MEM-001: Title ... **Status**: Pending
+        status_map = {" ": "Pending", "-": "In Progress", "x": "Completed"}
+        status_word = status_map.get(new_status, new_status)
+        new_content, found = _heading_task_pattern(task_id).subn(
+            lambda m: f"{m.group(1)}{status_word}", content, count=1
+        )
 
-        if status_match:
-            old_text = status_match.group(0)
-            new_text = f"{status_match.group(1)}{status_word}"
-            content = content.replace(old_text, new_text, 1)
-            tasks_file.write_text(content, encoding="utf-8")
-            return True
+    if not found:
+        return False
 
-    return False
+    # Skip the write when the task already has the requested status
+    if new_content != content:
+        _replace_tasks_file(tasks_file, new_content)
+    return True
 
 
 def parse_tasks_alternate_format(tasks_file: Path) -> list[dict]:
@@ -463,19 +521,14 @@ def parse_tasks_alternate_format(tasks_file: Path) -> list[dict]:
 
     Returns list of task dicts with: id, title, status, content
     """
-    import re
-
-    if not tasks_file.exists():
+    try:
+        content = read_tasks_text_cached(tasks_file)
+    except FileNotFoundError:
         return []
-
-    content = tasks_file.read_text(encoding="utf-8")
     tasks = []
 
     # Find all ### Task headings
-    task_pattern = re.compile(r"^### ([A-Z]+-\d+): (.+)$", re.MULTILINE)
-    status_pattern = re.compile(r"\*\*Status\*\*:\s*(\w+)", re.IGNORECASE)
-
-    matches = list(task_pattern.finditer(content))
+    matches = list(_ALT_HEADING_PATTERN.finditer(content))
 
     for i, match in enumerate(matches):
         task_id = match.group(1)
@@ -487,7 +540,7 @@ def parse_tasks_alternate_format(tasks_file: Path) -> list[dict]:
         task_content = content[start_pos:end_pos]
 
         # Extract status
-        status_match = status_pattern.search(task_content)
+        status_match = _ALT_STATUS_PATTERN.search(task_content)
         status = status_match.group(1).lower() if status_match else "pending"
 
         tasks.append(
@@ -502,8 +555,6 @@ def build_prompt(cfg: Config, spec_name: str, spec_path: Path, stats: TaskStats)
 
     Parses tasks.md to find the first pending task and includes its details in the prompt.
     """
-    from .tui.task_parser import TaskStatus, parse_tasks_file
-
     # Parse tasks.md to find first pending task
     tasks_file = spec_path / cfg.tasks_filename
 
@@ -518,8 +569,6 @@ def build_prompt(cfg: Config, spec_name: str, spec_path: Path, stats: TaskStats)
 
         if alt_pending:
             # Convert to Task-like structure
-            from dataclasses import dataclass
-
             @dataclass
             class AltTask:
                 id: str
@@ -555,7 +604,7 @@ def build_prompt(cfg: Config, spec_name: str, spec_path: Path, stats: TaskStats)
         "tasks_in_progress": stats.in_progress,
         "timestamp": datetime.now(UTC).isoformat(),
     }
-    return cfg.prompt_template.format(**context)
+    return render_template(cfg.prompt_template, context)
 
 
 def _build_log_header(iteration: int, spec_name: str, command: list[str], prompt: str) -> str:
@@ -587,36 +636,385 @@ def _write_dry_run_log(log_path: Path, header: str, command: str) -> None:
     print(f"Saved log: {log_path}")
 
 
-def _get_latest_file_mtime(project_path: Path, ignore_dirs: tuple[str, ...]) -> float:
+# Directory listing keyed by path: (st_mtime_ns, (name, path) of subdirectories, file paths)
+_DirListingCache = dict[str, tuple[int, tuple[tuple[str, str], ...], tuple[str, ...]]]
+
+
+@functools.lru_cache(maxsize=1)
+def _dir_listing_cache(project_root: str) -> _DirListingCache:
+    """Listing cache for one project; scanning a different project starts a fresh one."""
+    return {}
+
+
+def _list_dir_cached(
+    dir_path: str, cache: _DirListingCache
+) -> tuple[tuple[tuple[str, str], ...], tuple[str, ...]]:
+    """List a directory's subdirectories and files, relisting only when its mtime changes.
+
+    A directory's mtime moves whenever an entry is added, removed or renamed,
+    so an unchanged mtime means the cached listing is still accurate. Listings
+    taken within a timestamp tick of the directory's mtime are not cached.
+
+    Args:
+        dir_path: Directory to list
+        cache: Listing cache from _dir_listing_cache
+
+    Returns:
+        Tuple of ((name, path) for each non-symlinked subdirectory, file paths)
+
+    Raises:
+        OSError: If the directory cannot be read
+    """
+    mtime_ns = os.stat(dir_path).st_mtime_ns
+    cached = cache.get(dir_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1], cached[2]
+
+    subdirs: list[tuple[str, str]] = []
+    files: list[str] = []
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    # Like os.walk, do not descend into symlinked directories
+                    if not entry.is_symlink():
+                        subdirs.append((entry.name, entry.path))
+                    continue
+            except OSError:
+                continue
+            files.append(entry.path)
+
+    listing = (mtime_ns, tuple(subdirs), tuple(files))
+    if mtime_is_settled(mtime_ns):
+        cache[dir_path] = listing
+    return listing[1], listing[2]
+
+
+@functools.cache
+def _scan_pool() -> ThreadPoolExecutor:
+    """Shared pool for scanning top-level subtrees concurrently.
+
+    scandir and stat release the GIL, so a cold-cache scan overlaps its I/O
+    across subtrees; the pool is created on first use and reused by every check.
+    """
+    return ThreadPoolExecutor(
+        max_workers=min(8, os.cpu_count() or 1), thread_name_prefix="mtime-scan"
+    )
+
+
+def _max_file_mtime(file_paths: tuple[str, ...], threshold: float | None) -> float:
+    """Return the latest mtime among files, stopping at the first one past threshold."""
+    latest_mtime = 0.0
+    for file_path in file_paths:
+        try:
+            mtime = os.stat(file_path).st_mtime
+        except OSError:
+            # Skip files we can't access
+            continue
+        if mtime > latest_mtime:
+            latest_mtime = mtime
+            if threshold is not None and mtime > threshold:
+                break
+    return latest_mtime
+
+
+def _scan_tree_mtime(
+    root: str, ignore_dirs: frozenset[str], threshold: float | None, cache: _DirListingCache
+) -> float:
+    """Walk one directory tree and return its latest file mtime (see _get_latest_file_mtime)."""
+    latest_mtime = 0.0
+    pending = [root]
+    while pending:
+        try:
+            subdirs, files = _list_dir_cached(pending.pop(), cache)
+        except OSError:
+            # Unreadable directory, skip it like os.walk does
+            continue
+        pending.extend(path for name, path in subdirs if name not in ignore_dirs)
+        mtime = _max_file_mtime(files, threshold)
+        if mtime > latest_mtime:
+            latest_mtime = mtime
+            if threshold is not None and mtime > threshold:
+                # Callers only need to know that something changed
+                return mtime
+    return latest_mtime
+
+
+def _get_latest_file_mtime(
+    project_path: Path,
+    ignore_dirs: tuple[str, ...] | frozenset[str],
+    threshold: float | None = None,
+) -> float:
     """Get the most recent file modification time in project directory.
 
+    Directory listings are reused between calls while the directory itself is
+    unchanged; every file is still stat'ed, since in-place edits do not touch
+    the parent directory's mtime. Without a threshold, top-level subdirectories
+    are scanned in parallel on a shared thread pool; with one, the walk stays
+    serial so the first changed file ends it.
+
     Args:
         project_path: Project directory to scan
-        ignore_dirs: Directory names to skip
+        ignore_dirs: Directory names to skip; pass a frozenset to reuse it as is
+        threshold: Stop scanning at the first file modified after this timestamp
+            and return its mtime, which may not be the overall maximum
 
     Returns:
         Most recent modification timestamp, or 0.0 if no files found
     """
-    latest_mtime = 0.0
     try:
-        for root, dirs, files in os.walk(project_path):
-            # Filter out ignored directories
-            dirs[:] = [d for d in dirs if d not in ignore_dirs]
-
-            for file in files:
-                try:
-                    file_path = Path(root) / file
-                    mtime = file_path.stat().st_mtime
-                    if mtime > latest_mtime:
-                        latest_mtime = mtime
-                except (OSError, PermissionError):
-                    # Skip files we can't access
-                    continue
+        root = os.fspath(project_path)
+        cache = _dir_listing_cache(root)
+        try:
+            subdirs, files = _list_dir_cached(root, cache)
+        except OSError:
+            return 0.0
+        latest_mtime = _max_file_mtime(files, threshold)
+        if threshold is not None and latest_mtime > threshold:
+            return latest_mtime
+
+        # Hashed lookups for the per-directory name checks in every subtree
+        # (frozenset() of a frozenset returns it unchanged, without copying)
+        ignored = frozenset(ignore_dirs)
+        subtrees = [path for name, path in subdirs if name not in ignored]
+        if threshold is None and len(subtrees) > 1:
+            results = _scan_pool().map(
+                _scan_tree_mtime, subtrees, repeat(ignored), repeat(threshold), repeat(cache)
+            )
+        else:
+            results = (_scan_tree_mtime(path, ignored, threshold, cache) for path in subtrees)
+        for mtime in results:
+            if mtime > latest_mtime:
+                latest_mtime = mtime
+                if threshold is not None and mtime > threshold:
+                    break
+        return latest_mtime
     except Exception:
         # If scan fails, return 0 to avoid breaking timeout logic
-        pass
+        return 0.0
 
-    return latest_mtime
+
+def _git_head_fingerprint(project_path: Path) -> tuple | None:
+    """Cheap stat-based signature of where HEAD points, used to skip git calls.
+
+    Combines the contents of .git/HEAD with the stat of the branch ref it
+    names and of packed-refs. Every commit rewrites the branch ref through a
+    lock-file rename, so the signature changes whenever HEAD can move.
+
+    Args:
+        project_path: Repository root
+
+    Returns:
+        Hashable signature, or None when it cannot be computed (e.g. .git is a
+        worktree file) and the caller should ask git directly
+    """
+
+    def stat_key(path: Path) -> tuple[int, int, int] | None:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    git_dir = project_path / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        ref_key = stat_key(git_dir / head[5:]) if head.startswith("ref: ") else None
+        return (head, ref_key, stat_key(git_dir / "packed-refs"))
+    except OSError:
+        return None
+
+
+# Read and log-write buffer size for provider output; stream-json arrives in bursts of long lines
+_OUTPUT_BUFFER_SIZE = 64 * 1024
+
+# Provider output lines kept in memory for the failure message; the CLI reports
+# errors at the end of its output, and the full output is in the log file
+_OUTPUT_TAIL_LINES = 256
+
+# Tool uses awaiting a result that the reader tracks before dropping the oldest
+_MAX_PENDING_TOOL_USES = 1024
+
+# Agent ID mentioned in a Task tool result, e.g. "agent ID: abc-123"
+_AGENT_ID_PATTERN = re.compile(r"agent[_\s]+(?:ID|id)[\s:]+([a-zA-Z0-9_-]+)", re.IGNORECASE)
+
+# Claude CLI error the reader stops on; searched per line without lowercasing a copy
+_NO_MESSAGES_PATTERN = re.compile(r"no messages returned", re.IGNORECASE)
+
+# Reader thread flushes the log and console every N lines or after this many seconds
+_FLUSH_EVERY_LINES = 16
+_FLUSH_INTERVAL_SECONDS = 0.1
+
+# Bound decode of a shared decoder, skipping json.loads' per-call type and BOM checks
+_decode_stream_event = json.JSONDecoder().decode
+
+
+class _FlushBeforeReadPipe(io.RawIOBase):
+    """Raw pipe reader that runs a callback before every read from the pipe.
+
+    BufferedReader only reads the pipe once everything buffered has been
+    handed out, which is where the next line may block; a flush there pushes
+    out the lines already handled before the reader waits for more.
+    """
+
+    def __init__(self, raw: io.RawIOBase, before_read: Callable[[], None]) -> None:
+        self._raw = raw
+        self._before_read = before_read
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: memoryview | bytearray) -> int | None:  # type: ignore[override]
+        self._before_read()
+        return self._raw.readinto(buffer)
+
+    def close(self) -> None:
+        super().close()
+        self._raw.close()
+
+
+@dataclass(slots=True)
+class _StreamState:
+    """State shared by stream-json event handlers during one provider run."""
+
+    # Map tool_use id -> tool name until its result arrives (insertion-ordered, oldest first)
+    pending_tool_uses: dict[str, str] = field(default_factory=dict)
+    # Track agent info spawned via Task tool
+    spawned_agents: list[dict] = field(default_factory=list)
+
+
+def _handle_system_event(data: dict, state: _StreamState) -> None:
+    """Show MCP server connection status."""
+    if "mcp_servers" in data:
+        for server in data["mcp_servers"]:
+            status = server.get("status", "unknown")
+            name = server.get("name", "unknown")
+            print(f"[MCP: {name} - {status}]")
+
+
+def _handle_assistant_event(data: dict, state: _StreamState) -> None:
+    """Display assistant message content and record tool uses."""
+    if "message" in data and "content" in data["message"]:
+        content = data["message"]["content"]
+        if isinstance(content, list):
+            pending_tool_uses = state.pending_tool_uses
+            for item in content:
+                if item.get("type") == "text":
+                    text = item.get("text", "")
+                    # Handle Unicode encoding errors on Windows
+                    try:
+                        print(text)
+                    except UnicodeEncodeError:
+                        # Replace problematic characters with ASCII equivalents
+                        print(text.encode("ascii", errors="replace").decode("ascii"))
+                elif item.get("type") == "tool_use":
+                    tool_name = item.get("name", "unknown")
+                    tool_use_id = item.get("id")
+                    print(f"[Using tool: {tool_name}]")
+                    # Track tool use for later result matching
+                    if tool_use_id:
+                        pending_tool_uses[tool_use_id] = tool_name
+                        if len(pending_tool_uses) > _MAX_PENDING_TOOL_USES:
+                            # Drop the oldest; its result never arrived
+                            del pending_tool_uses[next(iter(pending_tool_uses))]
+                elif item.get("type") == "thinking":
+                    thinking = item.get("thinking", "")[:150]
+                    try:
+                        print(f"[Thinking: {thinking}...]")
+                    except UnicodeEncodeError:
+                        ascii_thinking = thinking.encode("ascii", errors="replace").decode("ascii")
+                        print(f"[Thinking: {ascii_thinking}...]")
+
+
+def _handle_result_event(data: dict, state: _StreamState) -> None:
+    """Show the final result."""
+    if "result" in data:
+        safe_print(f"\n[Result: {data['result'][:100]}...]")
+
+
+def _handle_tool_result_event(data: dict, state: _StreamState) -> None:
+    """Record Task agents spawned by a Task tool result."""
+    tool_use_id = data.get("tool_use_id")
+    # Each tool use gets one result, so the entry can go now
+    if not tool_use_id or state.pending_tool_uses.pop(tool_use_id, None) != "Task":
+        return
+
+    # Extract agent information from Task tool result
+    content = data.get("content", "")
+    # Try to parse agent ID from the result
+    if not isinstance(content, str):
+        return
+    # Look for patterns like "agent ID: xyz" or similar; the substring test
+    # skips the regex scan when it cannot match
+    agent_match = _AGENT_ID_PATTERN.search(content) if "agent" in content.lower() else None
+    if agent_match:
+        agent_id = agent_match.group(1)
+        state.spawned_agents.append(
+            {"agent_id": agent_id, "tool_use_id": tool_use_id, "content": content[:200]}
+        )
+        print(f"[!]  Task agent detected: {agent_id}")
+    else:
+        # No clear agent ID, but still record the Task spawn
+        state.spawned_agents.append(
+            {
+                "agent_id": f"unknown_{tool_use_id}",
+                "tool_use_id": tool_use_id,
+                "content": content[:200],
+            }
+        )
+        print(f"[!]  Task agent spawned (id: {tool_use_id})")
+
+
+# Stream-json event type -> handler; other types are silently skipped
+_STREAM_EVENT_HANDLERS: dict[str, Callable[[dict, _StreamState], None]] = {
+    "system": _handle_system_event,
+    "assistant": _handle_assistant_event,
+    "result": _handle_result_event,
+    "tool_result": _handle_tool_result_event,
+}
+
+
+def _pidfd_wait(proc: subprocess.Popen, timeout: float) -> bool:
+    """Block until the process exits or timeout passes, without polling.
+
+    Uses a Linux pidfd, which becomes readable once the process exits.
+
+    Returns:
+        False if the process is still running after timeout; True if it exited
+        or pidfds are unavailable, leaving the final wait to Popen.wait
+    """
+    if not hasattr(os, "pidfd_open") or proc.returncode is not None:
+        return True
+    try:
+        pidfd = os.pidfd_open(proc.pid)
+    except OSError:
+        # Already reaped, or the kernel lacks pidfd support
+        return True
+    try:
+        readable, _, _ = select.select([pidfd], [], [], timeout)
+    finally:
+        os.close(pidfd)
+    return bool(readable)
+
+
+def _wait_for_exit(proc: subprocess.Popen, output_done: threading.Event, timeout: float) -> int:
+    """Wait up to timeout for the process to exit.
+
+    While the reader is still receiving output the wait parks on output_done,
+    instead of Popen.wait's waitpid polling loop, and wakes as soon as the
+    output ends. After that it blocks on a pidfd where the platform has one.
+
+    Raises:
+        subprocess.TimeoutExpired: If the process is still running after timeout
+    """
+    if output_done.wait(timeout):
+        if not _pidfd_wait(proc, timeout):
+            raise subprocess.TimeoutExpired(proc.args, timeout)
+        return proc.wait(timeout=timeout)
+    returncode = proc.poll()
+    if returncode is None:
+        raise subprocess.TimeoutExpired(proc.args, timeout)
+    return returncode
 
 
 def _execute_provider_command(
@@ -642,176 +1040,114 @@ def _execute_provider_command(
     Raises:
         RunnerError: If command fails or times out due to inactivity
     """
-    import threading
-
     formatted_command = format_command_string(command)
+    # Built once for every activity scan in both monitoring loops
+    ignored_dirs = frozenset(ignore_dirs)
 
     # Save command to file for debugging
-    import tempfile
-
     cmd_file = Path(tempfile.gettempdir()) / "last_command.txt"
     cmd_file.write_text(formatted_command, encoding="utf-8")
 
     print("\nRunning:", formatted_command)
+    # Derived once; the wait loop repeats it in every status line
+    activity_timeout_minutes = (activity_timeout_seconds or 0) // 60
     if activity_timeout_seconds:
         print(
-            f"Activity timeout: {activity_timeout_seconds}s ({activity_timeout_seconds // 60} minutes of inactivity)"
+            f"Activity timeout: {activity_timeout_seconds}s ({activity_timeout_minutes} minutes of inactivity)"
         )
         print(
             f"Checking activity every: {activity_check_interval_seconds}s "
             f"({activity_check_interval_seconds // 60} minutes)"
         )
 
-    output_lines: list[str] = []
+    # Only the tail is used (error text and pattern checks), so long runs stay bounded
+    output_lines: deque[str] = deque(maxlen=_OUTPUT_TAIL_LINES)
     early_termination_flag = {"triggered": False}  # Use dict for mutability across threads
-    spawned_agents: list[dict] = []  # Track agent info spawned via Task tool
-    pending_tool_uses: dict[str, str] = {}  # Map tool_use id -> tool name
+    stream_state = _StreamState()
+    spawned_agents = stream_state.spawned_agents
 
-    def read_output(proc: subprocess.Popen, handle: TextIO, output_lines: list[str]) -> None:
+    def read_output(proc: subprocess.Popen, handle: TextIO, output_lines: deque[str]) -> None:
         """Read process output in background thread.
 
         Detects "No messages returned" error and kills the process early
         to avoid waiting for timeout.
         """
         assert proc.stdout is not None
-        no_messages_detected = False
 
-        import sys
+        last_flush = time.monotonic()
+
+        def flush_output() -> None:
+            nonlocal last_flush
+            handle.flush()
+            sys.stdout.flush()
+            last_flush = time.monotonic()
+
+        # Decode incrementally through one buffered text layer instead of
+        # allocating and decoding a bytes object per line. The pipe is opened
+        # binary and unbuffered (bufsize=0), so stdout is a raw FileIO. Lines
+        # end only at "\n": a bare "\r" (progress output) stays in its line.
+        # Output handled so far is flushed before each pipe read, so a quiet
+        # provider never leaves its last lines sitting in the buffers.
+        text_stream = io.TextIOWrapper(
+            io.BufferedReader(
+                _FlushBeforeReadPipe(cast(io.RawIOBase, proc.stdout), flush_output),
+                buffer_size=_OUTPUT_BUFFER_SIZE,
+            ),
+            encoding="utf-8",
+            errors="replace",
+            newline="\n",
+        )
 
+        stream_handlers = _STREAM_EVENT_HANDLERS
         line_count = 0
-        while True:
-            sys.stderr.flush()
-            line = proc.stdout.readline()
-            sys.stderr.flush()
-            if not line:  # Empty bytes means EOF
-                break
-            decoded = line.decode("utf-8", errors="replace").strip()
+        for line in text_stream:
+            decoded = line.strip()
 
-            # Write raw JSONL to log file
+            # Write raw JSONL to log file (flushed in batches below)
             handle.write(decoded + "\n")
-            handle.flush()
             output_lines.append(decoded)
 
-            # Parse and display stream-json format
-            try:
-                data = json.loads(decoded)
-                msg_type = data.get("type")
-
-                # Handle different message types
-                if msg_type == "system":
-                    # Show MCP server connection status
-                    if "mcp_servers" in data:
-                        for server in data["mcp_servers"]:
-                            status = server.get("status", "unknown")
-                            name = server.get("name", "unknown")
-                            print(f"[MCP: {name} - {status}]", flush=True)
-
-                elif msg_type == "assistant":
-                    # Display assistant message content
-                    if "message" in data and "content" in data["message"]:
-                        content = data["message"]["content"]
-                        if isinstance(content, list):
-                            for item in content:
-                                if item.get("type") == "text":
-                                    text = item.get("text", "")
-                                    # Handle Unicode encoding errors on Windows
-                                    try:
-                                        print(text, flush=True)
-                                    except UnicodeEncodeError:
-                                        # Replace problematic characters with ASCII equivalents
-                                        print(
-                                            text.encode("ascii", errors="replace").decode("ascii"),
-                                            flush=True,
-                                        )
-                                elif item.get("type") == "tool_use":
-                                    tool_name = item.get("name", "unknown")
-                                    tool_use_id = item.get("id")
-                                    print(f"[Using tool: {tool_name}]", flush=True)
-                                    # Track tool use for later result matching
-                                    if tool_use_id:
-                                        pending_tool_uses[tool_use_id] = tool_name
-                                elif item.get("type") == "thinking":
-                                    thinking = item.get("thinking", "")[:150]
-                                    try:
-                                        print(f"[Thinking: {thinking}...]", flush=True)
-                                    except UnicodeEncodeError:
-                                        ascii_thinking = thinking.encode(
-                                            "ascii", errors="replace"
-                                        ).decode("ascii")
-                                        print(
-                                            f"[Thinking: {ascii_thinking}...]",
-                                            flush=True,
-                                        )
-
-                elif msg_type == "result":
-                    # Show final result
-                    if "result" in data:
-                        safe_print(f"\n[Result: {data['result'][:100]}...]")
-
-                elif msg_type == "tool_result":
-                    # Check if this is a result from a Task tool
-                    tool_use_id = data.get("tool_use_id")
-                    if tool_use_id and pending_tool_uses.get(tool_use_id) == "Task":
-                        # Extract agent information from Task tool result
-                        content = data.get("content", "")
-                        # Try to parse agent ID from the result
-                        import re
-
-                        # Look for patterns like "agent ID: xyz" or similar
-                        if isinstance(content, str):
-                            agent_match = re.search(
-                                r"agent[_\s]+(?:ID|id)[\s:]+([a-zA-Z0-9_-]+)",
-                                content,
-                                re.IGNORECASE,
-                            )
-                            if agent_match:
-                                agent_id = agent_match.group(1)
-                                spawned_agents.append(
-                                    {
-                                        "agent_id": agent_id,
-                                        "tool_use_id": tool_use_id,
-                                        "content": content[:200],
-                                    }
-                                )
-                                print(f"[!]  Task agent detected: {agent_id}", flush=True)
-                            else:
-                                # No clear agent ID, but still record the Task spawn
-                                spawned_agents.append(
-                                    {
-                                        "agent_id": f"unknown_{tool_use_id}",
-                                        "tool_use_id": tool_use_id,
-                                        "content": content[:200],
-                                    }
-                                )
-                                print(f"[!]  Task agent spawned (id: {tool_use_id})", flush=True)
-
-                # If message type not handled, silently skip (don't spam console)
-
-            except (json.JSONDecodeError, KeyError, TypeError):
-                # If not valid JSON, just print the line
-                print(decoded, flush=True)
+            # Parse and display stream-json format. Only lines that can start an
+            # object reach the decoder, so plain-text output (warnings, progress)
+            # never pays for raising and catching JSONDecodeError.
+            if not decoded.startswith("{"):
+                print(decoded)
+            else:
+                try:
+                    data = _decode_stream_event(decoded)
+                    msg_type = data.get("type")
+
+                    # Dispatch by event type; unhandled types are skipped (don't spam console)
+                    handler = stream_handlers.get(msg_type)
+                    if handler is not None:
+                        handler(data, stream_state)
+
+                except (json.JSONDecodeError, KeyError, TypeError, AttributeError):
+                    # If not a valid stream-json object, just print the line
+                    print(decoded)
 
             line_count += 1
 
-            # Detect "No messages returned" error early
-            if "no messages returned" in decoded.lower() and not no_messages_detected:
-                no_messages_detected = True
-                early_termination_flag["triggered"] = True
-                # Give it a moment to finish output, then kill
-                import time
+            # Flush the log and console in batches rather than per line; the
+            # pipe wrapper also flushes whenever the next read may block
+            if (
+                line_count % _FLUSH_EVERY_LINES == 0
+                or time.monotonic() - last_flush >= _FLUSH_INTERVAL_SECONDS
+            ):
+                flush_output()
 
-                time.sleep(2)
-                if proc.poll() is None:  # Still running
-                    try:
-                        proc.terminate()  # Try graceful termination first
-                        time.sleep(1)
-                        if proc.poll() is None:  # Still alive
-                            proc.kill()  # Force kill if terminate didn't work
-                    except Exception:
-                        pass  # Ignore errors during termination
+            # Detect "No messages returned" error early; the loop stops right after
+            if _NO_MESSAGES_PATTERN.search(decoded):
+                early_termination_flag["triggered"] = True
+                # Give it up to 2s to exit on its own, then terminate (kill after 1s)
+                try:
+                    proc.wait(timeout=2)
+                except subprocess.TimeoutExpired:
+                    safe_terminate_process(proc, timeout=1)
                 break  # Exit the loop immediately after killing
 
-    with log_path.open("w", encoding="utf-8") as handle:
+    # Buffer a whole flush batch so each batched flush is a single write(2)
+    with log_path.open("w", encoding="utf-8", buffering=_OUTPUT_BUFFER_SIZE) as handle:
         handle.write(header)
         proc = popen_command(
             command,
@@ -821,103 +1157,115 @@ def _execute_provider_command(
             stderr=subprocess.STDOUT,  # Merge stderr into stdout
             clean_claude_env=True,
             env_additions={"PYTHONUNBUFFERED": "1"},
+            # Own group, so a kill also stops tools it spawned that hold the pipe open
+            new_process_group=True,
         )
 
-        # Start output reading thread
-        reader_thread = threading.Thread(
-            target=read_output, args=(proc, handle, output_lines), daemon=True
-        )
-        reader_thread.start()
+        # Any abnormal exit (exception, Ctrl+C, SIGTERM/SIGHUP) kills the provider's group
+        with kill_process_group_on_abort(proc):
+            # Start output reading thread; output_done is set once it stops reading
+            output_done = threading.Event()
 
-        # Note: Session monitoring only works for interactive mode, not --print mode
-        # In --print mode, we can only monitor file system changes
-        print("[MONITOR] Monitoring file system activity (--print mode has no session logs)...")
-        print(f"\n{'=' * 80}")
-        print("Claude Output:")
-        print(f"{'=' * 80}\n")
-
-        # Wait for process with activity-based timeout monitoring
-        returncode = None
-        last_mtime = _get_latest_file_mtime(project_path, ignore_dirs)
-
-        # Use short intervals for checking/displaying updates (5 seconds)
-        # But only do timeout checks at activity_check_interval_seconds
-        display_interval = 5  # Check for updates every 5 seconds
-        last_timeout_check = time.time()
-
-        while returncode is None:
-            try:
-                # Check process status with short timeout for responsive display
-                returncode = proc.wait(timeout=display_interval)
-            except subprocess.TimeoutExpired:
-                # Process hasn't finished yet - check for file modifications
-                current_time = time.time()
-                current_mtime = _get_latest_file_mtime(project_path, ignore_dirs)
-                file_has_activity = current_mtime > last_mtime
-
-                if file_has_activity:
-                    last_mtime = current_mtime
-                    print(
-                        f"[{datetime.now().strftime('%H:%M:%S')}] [FILE] File modified - Claude is working"
-                    )
-
-                # Check for timeout at configured interval
-                if (
-                    activity_timeout_seconds
-                    and (current_time - last_timeout_check) >= activity_check_interval_seconds
-                ):
-                    last_timeout_check = current_time
-                    inactivity_seconds = int(current_time - last_mtime)
-
-                    if inactivity_seconds > activity_timeout_seconds:
-                        # Inactivity timeout - kill the process
-                        print(
-                            f"\n[!]  No file changes for {inactivity_seconds}s "
-                            f"(>{activity_timeout_seconds}s). Terminating process..."
-                        )
-                        proc.kill()
-                        reader_thread.join(timeout=5)
-                        handle.write(
-                            f"\n# Inactivity Timeout\n"
-                            f"Process terminated after {inactivity_seconds} seconds of inactivity\n"
-                        )
-                        handle.write("\n# Exit Code\nINACTIVITY_TIMEOUT\n")
-                        raise RunnerError(
-                            f"Provider command timed out due to {inactivity_seconds} seconds of inactivity "
-                            f"(threshold: {activity_timeout_seconds}s = {activity_timeout_seconds // 60} minutes). "
-                            f"The AI may be stuck or waiting for input."
-                        ) from None
-                    else:
-                        # Show periodic status
-                        mins = inactivity_seconds // 60
-                        secs = inactivity_seconds % 60
-                        max_mins = activity_timeout_seconds // 60
-                        print(
-                            f"[{datetime.now().strftime('%H:%M:%S')}] [WAIT] "
-                            f"Running... (no file changes for {mins}m {secs}s, max: {max_mins}m)"
-                        )
-
-                # Continue loop
-                continue
+            def read_output_until_done() -> None:
+                try:
+                    read_output(proc, handle, output_lines)
+                finally:
+                    output_done.set()
+
+            reader_thread = threading.Thread(target=read_output_until_done, daemon=True)
+            reader_thread.start()
+
+            # Note: Session monitoring only works for interactive mode, not --print mode
+            # In --print mode, we can only monitor file system changes
+            print("[MONITOR] Monitoring file system activity (--print mode has no session logs)...")
+            print(f"\n{'=' * 80}")
+            print("Claude Output:")
+            print(f"{'=' * 80}\n")
+
+            # Wait for process with activity-based timeout monitoring
+            returncode = None
+            last_mtime = _get_latest_file_mtime(project_path, ignored_dirs)
+
+            # Use short intervals for checking/displaying updates (5 seconds)
+            # But only do timeout checks at activity_check_interval_seconds
+            display_interval = 5  # Check for updates every 5 seconds
+            last_timeout_check = time.time()
+
+            while returncode is None:
+                try:
+                    # Check process status with short timeout for responsive display
+                    returncode = _wait_for_exit(proc, output_done, display_interval)
+                except subprocess.TimeoutExpired:
+                    # Process hasn't finished yet - check for file modifications
+                    current_time = time.time()
+                    # Any file newer than both the last seen change and the timeout
+                    # window proves activity, so the scan can stop there
+                    threshold = last_mtime
+                    if activity_timeout_seconds:
+                        threshold = max(threshold, current_time - activity_timeout_seconds)
+                    current_mtime = _get_latest_file_mtime(project_path, ignored_dirs, threshold)
+                    file_has_activity = current_mtime > last_mtime
+
+                    if file_has_activity:
+                        last_mtime = current_mtime
+                        print(f"[{_hms()}] [FILE] File modified - Claude is working")
+
+                    # Check for timeout at configured interval
+                    if (
+                        activity_timeout_seconds
+                        and (current_time - last_timeout_check) >= activity_check_interval_seconds
+                    ):
+                        last_timeout_check = current_time
+                        inactivity_seconds = int(current_time - last_mtime)
+
+                        if inactivity_seconds > activity_timeout_seconds:
+                            # Inactivity timeout - kill the process
+                            print(
+                                f"\n[!]  No file changes for {inactivity_seconds}s "
+                                f"(>{activity_timeout_seconds}s). Terminating process..."
+                            )
+                            kill_process_group(proc)
+                            reader_thread.join(timeout=5)
+                            handle.write(
+                                f"\n# Inactivity Timeout\n"
+                                f"Process terminated after {inactivity_seconds} seconds of inactivity\n"
+                            )
+                            handle.write("\n# Exit Code\nINACTIVITY_TIMEOUT\n")
+                            raise RunnerError(
+                                f"Provider command timed out due to {inactivity_seconds} seconds of inactivity "
+                                f"(threshold: {activity_timeout_seconds}s = {activity_timeout_minutes} minutes). "
+                                f"The AI may be stuck or waiting for input."
+                            ) from None
+                        else:
+                            # Show periodic status
+                            mins = inactivity_seconds // 60
+                            secs = inactivity_seconds % 60
+                            print(
+                                f"[{_hms()}] [WAIT] "
+                                f"Running... (no file changes for {mins}m {secs}s, "
+                                f"max: {activity_timeout_minutes}m)"
+                            )
 
-        # Wait for output thread to finish (with timeout to avoid hanging)
-        reader_thread.join(timeout=10)
-        if reader_thread.is_alive():
-            print("[WARNING] Reader thread did not finish in time - process may have hung")
+                    # Continue loop
+                    continue
 
-        # Write note about early termination if it occurred (before closing file)
-        if early_termination_flag["triggered"]:
-            handle.write("\n# Note\nProcess killed early due to 'No messages returned' error\n")
+            # Wait for output thread to finish (with timeout to avoid hanging)
+            reader_thread.join(timeout=10)
+            if reader_thread.is_alive():
+                print("[WARNING] Reader thread did not finish in time - process may have hung")
+            # Show the reader's last unflushed lines; closing the log flushes the rest
+            sys.stdout.flush()
 
-        handle.write(f"\n# Exit Code\n{returncode}\n")
+            # Write note about early termination if it occurred (before closing file)
+            if early_termination_flag["triggered"]:
+                handle.write("\n# Note\nProcess killed early due to 'No messages returned' error\n")
 
-    # Check if "No messages returned" was detected in output
-    output_text = "".join(output_lines)
-    has_no_messages_error = "no messages returned" in output_text.lower()
+            handle.write(f"\n# Exit Code\n{returncode}\n")
 
     if returncode != 0:
-        # If process was killed due to "No messages returned", treat as potentially successful
-        if has_no_messages_error and returncode == -9:  # -9 = SIGKILL
+        # If process was killed due to "No messages returned", treat as potentially successful.
+        # The reader flags that line as it arrives, so the output needs no rescan here.
+        if early_termination_flag["triggered"] and returncode == -9:  # -9 = SIGKILL
             print("[!]  Process terminated due to 'No messages returned' error")
             print(
                 "   Treating as potentially successful. Circuit breaker will stop if no progress."
@@ -926,7 +1274,7 @@ def _execute_provider_command(
             return 0  # Don't raise error - let circuit breaker handle it
 
         # Include output in error message for better error detection
-        raise RunnerError(f"Provider command failed. Output: {output_text}")
+        raise RunnerError(f"Provider command failed. Output: {''.join(output_lines)}")
     print(f"Saved log: {log_path}")
 
     # No agents spawned - normal completion
@@ -953,12 +1301,15 @@ def _execute_provider_command(
         max_total_wait = 600  # 10 minutes maximum
         inactivity_threshold = 60  # 60 seconds of no activity = done
 
+        head_fingerprint = _git_head_fingerprint(project_path)
         initial_commit = get_current_commit(project_path)
         last_activity_time = time.time()
-        last_mtime = _get_latest_file_mtime(project_path, ignore_dirs)
+        last_mtime = _get_latest_file_mtime(project_path, ignored_dirs)
         commits_detected = []
+        status_interval = 10.0
+        next_status_at = status_interval
 
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] Starting agent monitoring...")
+        print(f"[{_hms()}] Starting agent monitoring...")
 
         while True:
             elapsed = time.time() - start_time
@@ -966,22 +1317,23 @@ def _execute_provider_command(
 
             # Check for maximum timeout
             if elapsed > max_total_wait:
-                print(
-                    f"\n[{datetime.now().strftime('%H:%M:%S')}] [TIMEOUT] Maximum wait time reached (10 minutes)"
-                )
+                print(f"\n[{_hms()}] [TIMEOUT] Maximum wait time reached (10 minutes)")
                 break
 
             # Check for file system activity
-            current_mtime = _get_latest_file_mtime(project_path, ignore_dirs)
+            current_mtime = _get_latest_file_mtime(project_path, ignored_dirs, last_mtime)
             if current_mtime > last_mtime:
                 last_mtime = current_mtime
                 last_activity_time = time.time()
-                print(
-                    f"[{datetime.now().strftime('%H:%M:%S')}] [FILE] File activity detected (agents working...)"
-                )
+                print(f"[{_hms()}] [FILE] File activity detected (agents working...)")
 
-            # Check for new commits
-            current_commit = get_current_commit(project_path)
+            # Check for new commits, only forking git once HEAD or its ref changed
+            current_fingerprint = _git_head_fingerprint(project_path)
+            if current_fingerprint is None or current_fingerprint != head_fingerprint:
+                head_fingerprint = current_fingerprint
+                current_commit = get_current_commit(project_path)
+            else:
+                current_commit = initial_commit
             if current_commit != initial_commit and current_commit not in commits_detected:
                 commits_detected.append(current_commit)
                 initial_commit = current_commit
@@ -996,34 +1348,36 @@ def _execute_provider_command(
                         check=True,
                     )
                     commit_msg = result.stdout.strip()
-                    print(
-                        f"[{datetime.now().strftime('%H:%M:%S')}] [OK] New commit detected: {commit_msg}"
-                    )
+                    print(f"[{_hms()}] [OK] New commit detected: {commit_msg}")
                 except Exception:
-                    print(
-                        f"[{datetime.now().strftime('%H:%M:%S')}] [OK] New commit detected: {current_commit[:8]}"
-                    )
+                    print(f"[{_hms()}] [OK] New commit detected: {current_commit[:8]}")
 
             # Check for inactivity threshold
             if inactivity > inactivity_threshold:
                 print(
-                    f"\n[{datetime.now().strftime('%H:%M:%S')}] [DONE] "
+                    f"\n[{_hms()}] [DONE] "
                     f"No activity for {int(inactivity)}s - agents appear complete"
                 )
                 break
 
-            # Show periodic status
-            if int(elapsed) % 10 == 0 and int(elapsed) > 0:
+            # Show periodic status at most once per 10s; after a long stall
+            # (e.g. a slow git call) print once rather than catching up
+            if elapsed >= next_status_at:
+                next_status_at = elapsed + status_interval
                 mins_elapsed = int(elapsed) // 60
                 secs_elapsed = int(elapsed) % 60
                 inactive_secs = int(inactivity)
                 print(
-                    f"[{datetime.now().strftime('%H:%M:%S')}] [WAIT] Waiting... "
+                    f"[{_hms()}] [WAIT] Waiting... "
                     f"({mins_elapsed}m {secs_elapsed}s elapsed, "
                     f"{inactive_secs}s inactive, {len(commits_detected)} commits)"
                 )
 
-            time.sleep(5)  # Check every 5 seconds
+            # Check every 5 seconds, but wake exactly when a deadline is due
+            # instead of overshooting it by up to a full interval
+            time.sleep(
+                max(0.0, min(5.0, inactivity_threshold - inactivity, max_total_wait - elapsed))
+            )
 
         print(f"\n{'=' * 80}")
         print("[DONE] Agent monitoring complete")
@@ -1035,6 +1389,323 @@ def _execute_provider_command(
         return len(commits_detected)
 
 
+@dataclass(slots=True)
+class _ProviderRetryState:
+    """Inputs and mutable bookkeeping shared by the run_provider retry handlers."""
+
+    provider: Provider
+    cfg: Config
+    project_path: Path
+    spec_name: str
+    iteration: int
+    attempt: int = 1
+    # Track starting account for rotation cycle
+    starting_claude_account: str | None = None
+
+
+def _rotate_claude_account_for_retry(state: _ProviderRetryState, reason: str) -> bool:
+    """Rotate to the next Claude account, waiting once every account has been tried.
+
+    Args:
+        state: Retry state holding the account the rotation cycle started from
+        reason: Human-readable limit that was hit, e.g. "Rate limit"
+
+    Returns:
+        True if the caller should retry now, False if rotation is unavailable
+    """
+    if state.starting_claude_account is None:
+        state.starting_claude_account = get_active_claude_account()
+        logger.info(f"Tracking starting Claude account: {state.starting_claude_account}")
+
+    print(f"[!]  {reason} exceeded. Rotating Claude account...")
+    if not rotate_claude_account():
+        print("[!]  Account rotation not available. Falling back to wait...")
+        return False
+
+    current_account = get_active_claude_account()
+    # Check if we've cycled through all accounts
+    if current_account == state.starting_claude_account:
+        logger.warning(
+            "All Claude accounts exhausted, waiting before retry",
+            extra={
+                "extra_context": {
+                    "starting_account": state.starting_claude_account,
+                    "spec_name": state.spec_name,
+                    "iteration": state.iteration,
+                }
+            },
+        )
+        backoff_seconds = state.cfg.context_limit_wait_seconds
+        wait_minutes = backoff_seconds // 60
+        print(
+            f"[!]  All Claude accounts exhausted. "
+            f"Waiting {wait_minutes} minutes ({backoff_seconds}s) before retry..."
+        )
+        time.sleep(backoff_seconds)
+        # Reset starting account for next cycle
+        state.starting_claude_account = get_active_claude_account()
+    else:
+        logger.info(
+            f"Rotated to Claude account: {current_account}, retrying",
+            extra={
+                "extra_context": {
+                    "current_account": current_account,
+                    "starting_account": state.starting_claude_account,
+                    "spec_name": state.spec_name,
+                    "iteration": state.iteration,
+                }
+            },
+        )
+    return True
+
+
+def _retry_after_no_messages(state: _ProviderRetryState, err: RunnerError) -> int | None:
+    """Treat 'No messages returned' as potentially successful."""
+    logger.warning(
+        "Claude CLI returned 'No messages returned' error - treating as potentially successful",
+        extra={
+            "extra_context": {
+                "attempt": state.attempt,
+                "spec_name": state.spec_name,
+                "iteration": state.iteration,
+                "error": str(err),
+            }
+        },
+    )
+    print(
+        "[!]  Claude CLI error: 'No messages returned'. "
+        "This may indicate completion or a transient issue."
+    )
+    print("   Continuing to next iteration. Circuit breaker will stop if no progress.")
+    # Return successfully - let circuit breaker handle repeated no-commit scenarios
+    return 0
+
+
+def _retry_after_timeout(state: _ProviderRetryState, err: RunnerError) -> int | None:
+    """Reduce context and retry after an activity timeout, giving up when that stops helping."""
+    cfg = state.cfg
+    logger.warning(
+        "Activity timeout exceeded, attempting recovery",
+        extra={
+            "extra_context": {
+                "attempt": state.attempt,
+                "timeout_seconds": cfg.activity_timeout_seconds,
+                "spec_name": state.spec_name,
+                "iteration": state.iteration,
+                "error": str(err),
+            }
+        },
+    )
+
+    # Try to reduce context by archiving implementation logs
+    print("[!]  Activity timeout (no file changes detected). Attempting to reduce context...")
+    if reduce_spec_context(state.project_path, state.spec_name, cfg):
+        logger.info(
+            "Context reduced after timeout, retrying immediately",
+            extra={
+                "extra_context": {
+                    "attempt": state.attempt,
+                    "spec_name": state.spec_name,
+                    "iteration": state.iteration,
+                }
+            },
+        )
+        print("[OK] Context reduced by archiving implementation logs. Retrying...")
+        # Retry immediately after reducing context, but increment attempt
+        state.attempt += 1
+        if state.attempt > cfg.max_retries:
+            logger.error(
+                "Timeout persists after context reduction and retries",
+                extra={
+                    "extra_context": {
+                        "attempts": state.attempt,
+                        "spec_name": state.spec_name,
+                        "iteration": state.iteration,
+                        "timeout_seconds": cfg.activity_timeout_seconds,
+                    }
+                },
+            )
+            raise RunnerError(
+                f"Activity timeout occurred repeatedly after {state.attempt - 1} retries "
+                f"({cfg.activity_timeout_seconds}s = {cfg.activity_timeout_seconds // 60} min). "
+                f"The task may be too complex or the AI is stuck. "
+                f"Consider breaking down the task or increasing activity_timeout_seconds."
+            ) from None
+        return None
+
+    # No logs to archive - fail after one retry attempt
+    if state.attempt < 2:
+        wait_seconds = 30
+        logger.info(
+            f"No context to reduce, waiting {wait_seconds}s before retry",
+            extra={
+                "extra_context": {
+                    "attempt": state.attempt,
+                    "spec_name": state.spec_name,
+                    "iteration": state.iteration,
+                }
+            },
+        )
+        print(f"[!]  No logs to archive. Waiting {wait_seconds}s before retry...")
+        time.sleep(wait_seconds)
+        state.attempt += 1
+        return None
+
+    logger.error(
+        "Timeout persists without ability to reduce context",
+        extra={
+            "extra_context": {
+                "attempts": state.attempt,
+                "spec_name": state.spec_name,
+                "iteration": state.iteration,
+                "timeout_seconds": cfg.activity_timeout_seconds,
+            }
+        },
+    )
+    raise RunnerError(
+        f"Activity timeout occurred after {state.attempt} attempts "
+        f"({cfg.activity_timeout_seconds}s = {cfg.activity_timeout_seconds // 60} min). "
+        f"The task may be too complex or the AI is stuck. "
+        f"Consider breaking down the task or increasing activity_timeout_seconds."
+    ) from None
+
+
+def _retry_after_rate_limit(state: _ProviderRetryState, err: RunnerError) -> int | None:
+    """Rotate Claude accounts or wait out a rate limit; never counts as an attempt."""
+    logger.warning(
+        "Rate limit exceeded, waiting before retry",
+        extra={
+            "extra_context": {
+                "attempt": state.attempt,
+                "spec_name": state.spec_name,
+                "iteration": state.iteration,
+                "error": str(err),
+            }
+        },
+    )
+
+    # For Claude provider: try rotating accounts
+    if isinstance(state.provider, ClaudeProvider) and _rotate_claude_account_for_retry(
+        state, "Rate limit"
+    ):
+        return None
+
+    # For non-Claude providers or if rotation not available: wait before retrying
+    backoff_seconds = state.cfg.context_limit_wait_seconds
+    wait_minutes = backoff_seconds // 60
+    print(
+        f"[!]  Rate limit exceeded. "
+        f"Waiting {wait_minutes} minutes ({backoff_seconds}s) before retry..."
+    )
+    time.sleep(backoff_seconds)
+    # Do not increment attempt for rate limits - retry infinitely
+    return None
+
+
+def _retry_after_context_limit(state: _ProviderRetryState, err: RunnerError) -> int | None:
+    """Reduce context, rotate Claude accounts, or wait; never counts as an attempt."""
+    cfg = state.cfg
+    # Try to reduce context by archiving implementation logs
+    print("[!]  Context limit exceeded. Attempting to reduce context...")
+    if reduce_spec_context(state.project_path, state.spec_name, cfg):
+        logger.info(
+            "Context reduced by archiving logs, retrying immediately",
+            extra={
+                "extra_context": {
+                    "attempt": state.attempt,
+                    "spec_name": state.spec_name,
+                    "iteration": state.iteration,
+                }
+            },
+        )
+        print("[OK] Context reduced by archiving implementation logs. Retrying...")
+        # Retry immediately after reducing context
+        return None
+
+    # For Claude provider: rotate accounts before waiting
+    if isinstance(state.provider, ClaudeProvider) and _rotate_claude_account_for_retry(
+        state, "Context limit"
+    ):
+        return None
+
+    # For non-Claude providers or if rotation failed: wait before retrying
+    backoff_seconds = cfg.context_limit_wait_seconds
+    wait_minutes = backoff_seconds // 60
+    logger.warning(
+        "Context limit exceeded, waiting before retry",
+        extra={
+            "extra_context": {
+                "attempt": state.attempt,
+                "max_retries": cfg.max_retries,
+                "wait_seconds": backoff_seconds,
+                "wait_minutes": wait_minutes,
+                "spec_name": state.spec_name,
+                "iteration": state.iteration,
+                "error": str(err),
+            }
+        },
+    )
+    print(
+        f"[!]  Context limit exceeded (no logs to archive). "
+        f"Waiting {wait_minutes} minutes ({backoff_seconds}s) before retry..."
+    )
+    time.sleep(backoff_seconds)
+    # Do not increment attempt for context limits - retry infinitely
+    return None
+
+
+def _retry_after_failure(state: _ProviderRetryState, err: RunnerError) -> int | None:
+    """Back off exponentially for any other error, raising it once retries run out."""
+    cfg = state.cfg
+    if state.attempt >= cfg.max_retries:
+        logger.error(
+            "Provider command failed after all retries",
+            extra={
+                "extra_context": {
+                    "attempts": state.attempt,
+                    "spec_name": state.spec_name,
+                    "iteration": state.iteration,
+                    "error": str(err),
+                }
+            },
+        )
+        # All retries exhausted - raise the last error
+        raise err from None
+
+    # Calculate exponential backoff for other errors: 2^(attempt-1) seconds
+    backoff_seconds = 2 ** (state.attempt - 1)
+    logger.warning(
+        "Provider command failed, retrying with backoff",
+        extra={
+            "extra_context": {
+                "attempt": state.attempt,
+                "max_retries": cfg.max_retries,
+                "backoff_seconds": backoff_seconds,
+                "spec_name": state.spec_name,
+                "iteration": state.iteration,
+                "error": str(err),
+            }
+        },
+    )
+    print(
+        f"[!]  Attempt {state.attempt}/{cfg.max_retries} failed. Retrying in {backoff_seconds}s..."
+    )
+    time.sleep(backoff_seconds)
+    state.attempt += 1
+    return None
+
+
+# Retry handlers by classify_error kind, in priority order for errors matching several kinds.
+# Each returns run_provider's result, None to retry, or raises to give up.
+_RetryHandler = Callable[[_ProviderRetryState, RunnerError], int | None]
+_RETRY_HANDLERS: tuple[tuple[str, _RetryHandler], ...] = (
+    ("no_messages", _retry_after_no_messages),
+    ("timeout", _retry_after_timeout),
+    ("rate", _retry_after_rate_limit),
+    ("context", _retry_after_context_limit),
+)
+
+
 def run_provider(
     provider: Provider,
     cfg: Config,
@@ -1057,11 +1728,15 @@ def run_provider(
         _write_dry_run_log(log_path, header, formatted_command)
         return 0
 
-    # Retry loop with exponential backoff
-    last_error: Exception | None = None
-    attempt = 1
-    starting_claude_account: str | None = None  # Track starting account for rotation cycle
+    retry_state = _ProviderRetryState(
+        provider=provider,
+        cfg=cfg,
+        project_path=project_path,
+        spec_name=spec_name,
+        iteration=iteration,
+    )
 
+    # Retry loop; each error kind has its own recovery strategy
     while True:
         try:
             commits_from_agents = _execute_provider_command(
@@ -1073,12 +1748,12 @@ def run_provider(
                 activity_check_interval_seconds=cfg.activity_check_interval_seconds,
                 ignore_dirs=cfg.ignore_dirs,
             )
-            if attempt > 1:
+            if retry_state.attempt > 1:
                 logger.info(
                     "Provider command succeeded on retry",
                     extra={
                         "extra_context": {
-                            "attempt": attempt,
+                            "attempt": retry_state.attempt,
                             "spec_name": spec_name,
                             "iteration": iteration,
                         }
@@ -1086,334 +1761,14 @@ def run_provider(
                 )
             return commits_from_agents  # Success - exit retry loop
         except RunnerError as err:
-            last_error = err
-
-            # Check error type
-            error_message = str(err)
-            is_rate_error = is_rate_limit_error(error_message)
-            is_context_error = is_context_limit_error(error_message)
-            is_timeout = is_timeout_error(error_message)
-            is_no_messages = is_no_messages_error(error_message)
-
-            # Handle "No messages returned" error - treat as potentially successful
-            if is_no_messages:
-                logger.warning(
-                    "Claude CLI returned 'No messages returned' error - treating as potentially successful",
-                    extra={
-                        "extra_context": {
-                            "attempt": attempt,
-                            "spec_name": spec_name,
-                            "iteration": iteration,
-                            "error": error_message,
-                        }
-                    },
-                )
-                print(
-                    "[!]  Claude CLI error: 'No messages returned'. "
-                    "This may indicate completion or a transient issue."
-                )
-                print("   Continuing to next iteration. Circuit breaker will stop if no progress.")
-                # Return successfully - let circuit breaker handle repeated no-commit scenarios
-                return 0
-
-            # Handle timeout errors
-            if is_timeout:
-                logger.warning(
-                    "Activity timeout exceeded, attempting recovery",
-                    extra={
-                        "extra_context": {
-                            "attempt": attempt,
-                            "timeout_seconds": cfg.activity_timeout_seconds,
-                            "spec_name": spec_name,
-                            "iteration": iteration,
-                            "error": error_message,
-                        }
-                    },
-                )
-
-                # Try to reduce context by archiving implementation logs
-                print(
-                    "[!]  Activity timeout (no file changes detected). Attempting to reduce context..."
-                )
-                context_reduced = reduce_spec_context(project_path, spec_name, cfg)
-
-                if context_reduced:
-                    logger.info(
-                        "Context reduced after timeout, retrying immediately",
-                        extra={
-                            "extra_context": {
-                                "attempt": attempt,
-                                "spec_name": spec_name,
-                                "iteration": iteration,
-                            }
-                        },
-                    )
-                    print("[OK] Context reduced by archiving implementation logs. Retrying...")
-                    # Retry immediately after reducing context, but increment attempt
-                    attempt += 1
-                    if attempt > cfg.max_retries:
-                        logger.error(
-                            "Timeout persists after context reduction and retries",
-                            extra={
-                                "extra_context": {
-                                    "attempts": attempt,
-                                    "spec_name": spec_name,
-                                    "iteration": iteration,
-                                    "timeout_seconds": cfg.activity_timeout_seconds,
-                                }
-                            },
-                        )
-                        raise RunnerError(
-                            f"Activity timeout occurred repeatedly after {attempt - 1} retries "
-                            f"({cfg.activity_timeout_seconds}s = {cfg.activity_timeout_seconds // 60} min). "
-                            f"The task may be too complex or the AI is stuck. "
-                            f"Consider breaking down the task or increasing activity_timeout_seconds."
-                        ) from None
-                    continue
-
-                # No logs to archive - fail after one retry attempt
-                if attempt < 2:
-                    wait_seconds = 30
-                    logger.info(
-                        f"No context to reduce, waiting {wait_seconds}s before retry",
-                        extra={
-                            "extra_context": {
-                                "attempt": attempt,
-                                "spec_name": spec_name,
-                                "iteration": iteration,
-                            }
-                        },
-                    )
-                    print(f"[!]  No logs to archive. Waiting {wait_seconds}s before retry...")
-                    time.sleep(wait_seconds)
-                    attempt += 1
-                    continue
-                else:
-                    logger.error(
-                        "Timeout persists without ability to reduce context",
-                        extra={
-                            "extra_context": {
-                                "attempts": attempt,
-                                "spec_name": spec_name,
-                                "iteration": iteration,
-                                "timeout_seconds": cfg.activity_timeout_seconds,
-                            }
-                        },
-                    )
-                    raise RunnerError(
-                        f"Activity timeout occurred after {attempt} attempts "
-                        f"({cfg.activity_timeout_seconds}s = {cfg.activity_timeout_seconds // 60} min). "
-                        f"The task may be too complex or the AI is stuck. "
-                        f"Consider breaking down the task or increasing activity_timeout_seconds."
-                    ) from None
-
-            # Handle rate limit errors
-            if is_rate_error:
-                logger.warning(
-                    "Rate limit exceeded, waiting before retry",
-                    extra={
-                        "extra_context": {
-                            "attempt": attempt,
-                            "spec_name": spec_name,
-                            "iteration": iteration,
-                            "error": error_message,
-                        }
-                    },
-                )
-
-                # For Claude provider: try rotating accounts
-                if isinstance(provider, ClaudeProvider):
-                    if starting_claude_account is None:
-                        starting_claude_account = get_active_claude_account()
-                        logger.info(f"Tracking starting Claude account: {starting_claude_account}")
-
-                    print("[!]  Rate limit exceeded. Rotating Claude account...")
-                    if rotate_claude_account():
-                        current_account = get_active_claude_account()
-
-                        # Check if we've cycled through all accounts
-                        if current_account == starting_claude_account:
-                            logger.warning(
-                                "All Claude accounts exhausted, waiting before retry",
-                                extra={
-                                    "extra_context": {
-                                        "starting_account": starting_claude_account,
-                                        "spec_name": spec_name,
-                                        "iteration": iteration,
-                                    }
-                                },
-                            )
-                            backoff_seconds = cfg.context_limit_wait_seconds
-                            wait_minutes = backoff_seconds // 60
-                            print(
-                                f"[!]  All Claude accounts exhausted. "
-                                f"Waiting {wait_minutes} minutes ({backoff_seconds}s) before retry..."
-                            )
-                            time.sleep(backoff_seconds)
-                            # Reset starting account for next cycle
-                            starting_claude_account = get_active_claude_account()
-                        else:
-                            logger.info(
-                                f"Rotated to Claude account: {current_account}, retrying",
-                                extra={
-                                    "extra_context": {
-                                        "current_account": current_account,
-                                        "starting_account": starting_claude_account,
-                                        "spec_name": spec_name,
-                                        "iteration": iteration,
-                                    }
-                                },
-                            )
-                        # Retry with new account
-                        continue
-                    else:
-                        # Rotation failed, fall through to wait
-                        print("[!]  Account rotation not available. Falling back to wait...")
-
-                # For non-Claude providers or if rotation not available: wait before retrying
-                backoff_seconds = cfg.context_limit_wait_seconds
-                wait_minutes = backoff_seconds // 60
-                print(
-                    f"[!]  Rate limit exceeded. "
-                    f"Waiting {wait_minutes} minutes ({backoff_seconds}s) before retry..."
-                )
-                time.sleep(backoff_seconds)
-                # Do not increment attempt for rate limits - retry infinitely
-                continue
-
-            # Handle context limit errors
-            if is_context_error:
-                # Try to reduce context by archiving implementation logs
-                print("[!]  Context limit exceeded. Attempting to reduce context...")
-                context_reduced = reduce_spec_context(project_path, spec_name, cfg)
-
-                if context_reduced:
-                    logger.info(
-                        "Context reduced by archiving logs, retrying immediately",
-                        extra={
-                            "extra_context": {
-                                "attempt": attempt,
-                                "spec_name": spec_name,
-                                "iteration": iteration,
-                            }
-                        },
-                    )
-                    print("[OK] Context reduced by archiving implementation logs. Retrying...")
-                    # Retry immediately after reducing context
-                    continue
-
-                # For Claude provider: rotate accounts before waiting
-                if isinstance(provider, ClaudeProvider):
-                    # Track starting account on first context limit hit
-                    if starting_claude_account is None:
-                        starting_claude_account = get_active_claude_account()
-                        logger.info(f"Tracking starting Claude account: {starting_claude_account}")
-
-                    # Rotate to next account
-                    print("[!]  Context limit exceeded. Rotating Claude account...")
-                    if rotate_claude_account():
-                        current_account = get_active_claude_account()
-
-                        # Check if we've cycled through all accounts
-                        if current_account == starting_claude_account:
-                            logger.warning(
-                                "All Claude accounts exhausted, waiting before retry",
-                                extra={
-                                    "extra_context": {
-                                        "starting_account": starting_claude_account,
-                                        "spec_name": spec_name,
-                                        "iteration": iteration,
-                                    }
-                                },
-                            )
-                            backoff_seconds = cfg.context_limit_wait_seconds
-                            wait_minutes = backoff_seconds // 60
-                            print(
-                                f"[!]  All Claude accounts exhausted. "
-                                f"Waiting {wait_minutes} minutes ({backoff_seconds}s) before retry..."
-                            )
-                            time.sleep(backoff_seconds)
-                            # Reset starting account for next cycle
-                            starting_claude_account = get_active_claude_account()
-                        else:
-                            logger.info(
-                                f"Rotated to Claude account: {current_account}, retrying",
-                                extra={
-                                    "extra_context": {
-                                        "current_account": current_account,
-                                        "starting_account": starting_claude_account,
-                                        "spec_name": spec_name,
-                                        "iteration": iteration,
-                                    }
-                                },
-                            )
-                        # Retry with new account
-                        continue
-                    else:
-                        # Rotation failed, fall through to wait
-                        print("[!]  Account rotation failed. Falling back to wait...")
-
-                # For non-Claude providers or if rotation failed: wait before retrying
-                backoff_seconds = cfg.context_limit_wait_seconds
-                wait_minutes = backoff_seconds // 60
-                logger.warning(
-                    "Context limit exceeded, waiting before retry",
-                    extra={
-                        "extra_context": {
-                            "attempt": attempt,
-                            "max_retries": cfg.max_retries,
-                            "wait_seconds": backoff_seconds,
-                            "wait_minutes": wait_minutes,
-                            "spec_name": spec_name,
-                            "iteration": iteration,
-                            "error": error_message,
-                        }
-                    },
-                )
-                print(
-                    f"[!]  Context limit exceeded (no logs to archive). "
-                    f"Waiting {wait_minutes} minutes ({backoff_seconds}s) before retry..."
-                )
-                time.sleep(backoff_seconds)
-                # Do not increment attempt for context limits - retry infinitely
-                continue
-
-            if attempt < cfg.max_retries:
-                # Calculate exponential backoff for other errors: 2^(attempt-1) seconds
-                backoff_seconds = 2 ** (attempt - 1)
-                logger.warning(
-                    "Provider command failed, retrying with backoff",
-                    extra={
-                        "extra_context": {
-                            "attempt": attempt,
-                            "max_retries": cfg.max_retries,
-                            "backoff_seconds": backoff_seconds,
-                            "spec_name": spec_name,
-                            "iteration": iteration,
-                            "error": error_message,
-                        }
-                    },
-                )
-                print(
-                    f"[!]  Attempt {attempt}/{cfg.max_retries} failed. "
-                    f"Retrying in {backoff_seconds}s..."
-                )
-                time.sleep(backoff_seconds)
-                attempt += 1
-            else:
-                logger.error(
-                    "Provider command failed after all retries",
-                    extra={
-                        "extra_context": {
-                            "attempts": attempt,
-                            "spec_name": spec_name,
-                            "iteration": iteration,
-                            "error": str(err),
-                        }
-                    },
-                )
-                # All retries exhausted - raise the last error
-                raise last_error from None
+            error_kinds = classify_error(str(err))
+            handler = next(
+                (handler for kind, handler in _RETRY_HANDLERS if kind in error_kinds),
+                _retry_after_failure,
+            )
+            result = handler(retry_state, err)
+            if result is not None:
+                return result
 
 
 def _display_dry_run_spec_status(spec_name: str, spec_path: Path, stats: TaskStats) -> None:
@@ -1491,7 +1846,7 @@ def run_pre_session_validation(
     print(f"{'=' * 80}\n")
     print("Validating and syncing tasks.md with codebase status...\n")
 
-    prompt = cfg.pre_session_validation_prompt.format(spec_name=spec_name)
+    prompt = render_template(cfg.pre_session_validation_prompt, {"spec_name": spec_name})
     log_dir = project_path / cfg.log_dir_name / spec_name
     log_dir.mkdir(parents=True, exist_ok=True)
     log_path = log_dir / "validation.log"
@@ -1515,6 +1870,54 @@ def run_pre_session_validation(
         print(f"    Check {log_path} for details\n")
 
 
+def _format_validation_log(iteration: int, validation_result: ValidationResult) -> str:
+    """Render the Phase 1 validation log body, to be written in one call."""
+    parts = [
+        f"Iteration {iteration} - Validation Results\n",
+        f"{'=' * 80}\n\n",
+        validation_result.summary() + "\n\n",
+    ]
+    for val in validation_result.validations:
+        if not val.is_valid:
+            parts.append(f"Task: {val.task_id} - {val.title}\n")
+            parts.extend(f"  - {issue}\n" for issue in val.issues)
+            parts.append("\n")
+    return "".join(parts)
+
+
+def _format_verification_log(iteration: int, verification_result: VerificationResult) -> str:
+    """Render the Phase 3 verification log body, to be written in one call."""
+    parts = [
+        f"Iteration {iteration} - Verification Results\n",
+        f"{'=' * 80}\n\n",
+        verification_result.summary() + "\n\n",
+    ]
+
+    completed = [v for v in verification_result.verifications if v.should_mark_complete]
+    incomplete = [v for v in verification_result.verifications if not v.should_mark_complete]
+
+    if completed:
+        parts.append("✅ Verified and marked complete:\n\n")
+        for task in completed:
+            parts.append(f"  {task.task_id}: {task.title}\n")
+            if task.files_modified:
+                parts.append(f"    Files: {', '.join(task.files_modified)}\n")
+        parts.append("\n")
+
+    if incomplete:
+        parts.append("⏸️  Still in progress:\n\n")
+        for task in incomplete:
+            parts.append(f"  {task.task_id}: {task.title}\n")
+            parts.extend(f"    - {issue}\n" for issue in task.issues)
+        parts.append("\n")
+
+    if verification_result.commits_made:
+        parts.append("📝 Commits created:\n")
+        parts.extend(f"  {sha}\n" for sha in verification_result.commits_made)
+
+    return "".join(parts)
+
+
 def run_three_phase_iteration(
     provider: Provider,
     cfg: Config,
@@ -1523,7 +1926,7 @@ def run_three_phase_iteration(
     spec_path: Path,
     iteration: int,
     log_dir: Path,
-) -> tuple[bool, int]:
+) -> tuple[bool, int, str]:
     """Run a single 3-phase workflow iteration.
 
     Args:
@@ -1536,7 +1939,7 @@ def run_three_phase_iteration(
         log_dir: Directory for logs
 
     Returns:
-        Tuple of (progress_made, agent_commits)
+        Tuple of (progress_made, agent_commits, last_commit_after)
     """
     tasks_path = spec_path / cfg.tasks_filename
 
@@ -1559,17 +1962,7 @@ def run_three_phase_iteration(
         )
 
         # Log validation results
-        with validation_log.open("w") as f:
-            f.write(f"Iteration {iteration} - Validation Results\n")
-            f.write(f"{'=' * 80}\n\n")
-            f.write(validation_result.summary() + "\n\n")
-
-            for val in validation_result.validations:
-                if not val.is_valid:
-                    f.write(f"Task: {val.task_id} - {val.title}\n")
-                    for issue in val.issues:
-                        f.write(f"  - {issue}\n")
-                    f.write("\n")
+        validation_log.write_text(_format_validation_log(iteration, validation_result))
 
         print(validation_result.summary())
         if validation_result.tasks_reset > 0:
@@ -1588,23 +1981,26 @@ def run_three_phase_iteration(
     print("PHASE 2: IMPLEMENTATION SESSION")
     print(f"{'=' * 80}\n")
 
-    # Get current stats
-    stats = read_task_stats(tasks_path)
+    # Get current stats; validation may have reset tasks, and the cache
+    # re-parses only if it rewrote tasks.md
+    stats, _ = read_tasks_cached(tasks_path)
     progress_summary = (
         f"{stats.done}/{stats.total} tasks complete "
         f"({stats.pending} pending, {stats.in_progress} in progress)"
     )
 
     # Use implementation prompt
-    prompt = cfg.implementation_prompt.format(
-        spec_name=spec_name,
-        progress_summary=progress_summary,
+    prompt = render_template(
+        cfg.implementation_prompt,
+        {"spec_name": spec_name, "progress_summary": progress_summary},
     )
 
     log_path = log_dir / cfg.log_file_template.format(index=iteration)
 
     # Run implementation with commit blocking
     agent_commits = 0
+    # Snapshot HEAD right before the session so commits made outside it
+    # (between iterations, by the user or a rescue commit) are not credited to it
     last_commit_before = get_current_commit(project_path)
 
     try:
@@ -1656,36 +2052,7 @@ def run_three_phase_iteration(
         )
 
         # Log verification results
-        with verification_log.open("w") as f:
-            f.write(f"Iteration {iteration} - Verification Results\n")
-            f.write(f"{'=' * 80}\n\n")
-            f.write(verification_result.summary() + "\n\n")
-
-            completed = [v for v in verification_result.verifications if v.should_mark_complete]
-            incomplete = [
-                v for v in verification_result.verifications if not v.should_mark_complete
-            ]
-
-            if completed:
-                f.write("✅ Verified and marked complete:\n\n")
-                for task in completed:
-                    f.write(f"  {task.task_id}: {task.title}\n")
-                    if task.files_modified:
-                        f.write(f"    Files: {', '.join(task.files_modified)}\n")
-                f.write("\n")
-
-            if incomplete:
-                f.write("⏸️  Still in progress:\n\n")
-                for task in incomplete:
-                    f.write(f"  {task.task_id}: {task.title}\n")
-                    for issue in task.issues:
-                        f.write(f"    - {issue}\n")
-                f.write("\n")
-
-            if verification_result.commits_made:
-                f.write("📝 Commits created:\n")
-                for sha in verification_result.commits_made:
-                    f.write(f"  {sha}\n")
+        verification_log.write_text(_format_verification_log(iteration, verification_result))
 
         print(verification_result.summary())
         if verification_result.tasks_completed > 0:
@@ -1710,7 +2077,7 @@ def run_three_phase_iteration(
 
     progress_made = has_new_commit or has_agent_commits or has_verified_work
 
-    return progress_made, agent_commits
+    return progress_made, agent_commits, last_commit_after
 
 
 def run_loop(
@@ -1739,7 +2106,9 @@ def run_loop(
 
     while True:
         # === Check completion status ===
-        stats = read_task_stats(tasks_path)
+        # One parse serves both the progress counts and the task listing below,
+        # and is reused while tasks.md is unchanged
+        stats, task_details = read_tasks_cached(tasks_path)
         remaining = stats.total - stats.done
 
         # Display enhanced progress information
@@ -1750,7 +2119,6 @@ def run_loop(
         safe_print(f"{stats.progress_bar()}")
 
         # Show next pending tasks
-        task_details = read_task_details(tasks_path)
         pending_tasks = [t for t in task_details if t.status == "pending"]
         in_progress_tasks = [t for t in task_details if t.status == "in_progress"]
 
@@ -1780,7 +2148,7 @@ def run_loop(
             )
 
             try:
-                progress_made, agent_commits = run_three_phase_iteration(
+                progress_made, agent_commits, _ = run_three_phase_iteration(
                     provider=provider,
                     cfg=cfg,
                     project_path=project_path,
@@ -1823,8 +2191,9 @@ def run_loop(
                 f"{stats.done}/{stats.total} tasks complete "
                 f"({stats.pending} pending, {stats.in_progress} in progress)"
             )
-            prompt = cfg.prompt_template.format(
-                spec_name=spec_name, progress_summary=progress_summary
+            prompt = render_template(
+                cfg.prompt_template,
+                {"spec_name": spec_name, "progress_summary": progress_summary},
             )
 
             log_path = log_dir / cfg.log_file_template.format(index=iteration)
@@ -6,13 +6,18 @@ platform checks throughout the codebase.
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import platform
 import shlex
+import shutil
+import signal
 import subprocess
+import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
@@ -69,6 +74,31 @@ def _get_clean_env(additions: dict[str, str] | None = None) -> dict[str, str]:
     return env
 
 
+@functools.lru_cache(maxsize=64)
+def _which_cached(name: str, path: str | None) -> str | None:
+    """shutil.which, cached per (name, PATH); see _resolve_executable for refreshing."""
+    return shutil.which(name, path=path)
+
+
+def _resolve_executable(name: str, path: str | None) -> str | None:
+    """Resolve a bare command name to an absolute path on the given PATH.
+
+    Names containing a path separator are left to Popen, since they are
+    interpreted relative to the child's cwd. Returns None (let Popen search
+    PATH and raise as usual) when the command cannot be found.
+
+    Lookups are cached per PATH value. A cached miss, or a cached path that
+    is no longer executable (uninstalled or moved), triggers a fresh search.
+    """
+    if os.sep in name or (os.altsep and os.altsep in name):
+        return None
+    resolved = _which_cached(name, path)
+    if resolved is None or not os.access(resolved, os.X_OK):
+        _which_cached.cache_clear()
+        resolved = _which_cached(name, path)
+    return resolved
+
+
 def run_command(
     command: list[str] | tuple[str, ...],
     *,
@@ -149,6 +179,7 @@ def popen_command(
     clean_claude_env: bool = False,
     env_additions: dict[str, str] | None = None,
     text_mode: bool = False,
+    new_process_group: bool = False,
 ) -> subprocess.Popen[str] | subprocess.Popen[bytes]:
     """Platform-agnostic subprocess.Popen() wrapper for non-blocking execution.
 
@@ -165,6 +196,8 @@ def popen_command(
         clean_claude_env: Remove CLAUDE_* env vars to prevent nested sessions
         env_additions: Additional environment variables to set
         text_mode: Return Popen[str] with text mode (for file output)
+        new_process_group: Start the process in its own process group so
+            kill_process_group can stop its descendants too (Linux/macOS only)
 
     Returns:
         Popen process object (bytes mode by default, text mode if text_mode=True)
@@ -198,9 +231,14 @@ def popen_command(
             errors="replace" if text_mode else None,
         )
     else:
-        # On Linux/macOS, use command list with shell=False for security
+        # On Linux/macOS, use command list with shell=False for security.
+        # No preexec_fn/user/group/umask arguments keep CPython on its vfork
+        # fast path, and an absolute executable makes the child exec once
+        # instead of trying every PATH entry.
+        path = (env if env is not None else os.environ).get("PATH")
         return subprocess.Popen(
             command,
+            executable=_resolve_executable(command[0], path),
             cwd=cwd,
             stdin=stdin,
             stdout=stdout,
@@ -211,6 +249,7 @@ def popen_command(
             text=text_mode,
             encoding="utf-8" if text_mode else None,
             errors="replace" if text_mode else None,
+            process_group=0 if new_process_group else None,
         )
 
 
@@ -308,3 +347,62 @@ def safe_terminate_process(process: subprocess.Popen[Any], timeout: int = 5) ->
             logger.error(f"Failed to kill process {process.pid}: {e}")
     except Exception as e:
         logger.error(f"Error terminating process {process.pid}: {e}")
+
+
+def kill_process_group(process: subprocess.Popen[Any]) -> None:
+    """Kill a process together with every descendant in its process group.
+
+    Meant for processes started with popen_command(new_process_group=True).
+    On Windows, or when the process does not lead its own group, only the
+    process itself is killed.
+
+    Args:
+        process: The subprocess to kill
+    """
+    if platform.system() != "Windows":
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+            return
+        except (ProcessLookupError, PermissionError):
+            # Not a group leader, or the whole group is already gone
+            pass
+    try:
+        process.kill()
+    except Exception as e:
+        logger.error(f"Failed to kill process {process.pid}: {e}")
+
+
+def _exit_on_signal(signum: int, frame: object) -> None:
+    """Signal handler that unwinds the main thread like an uncaught exit."""
+    raise SystemExit(128 + signum)
+
+
+@contextmanager
+def kill_process_group_on_abort(process: subprocess.Popen[Any]) -> Iterator[None]:
+    """Kill a detached process group if the block exits abnormally.
+
+    A process started with popen_command(new_process_group=True) is outside
+    the terminal's process group, so SIGINT, SIGHUP and SIGTERM aimed at the
+    runner never reach it. Any exception leaving the block kills the group.
+    On the main thread, SIGTERM and SIGHUP are turned into SystemExit for the
+    duration of the block, so they unwind through it (and through the
+    callers' finally blocks) instead of ending the runner on the spot.
+
+    Args:
+        process: The subprocess whose group is killed on an abnormal exit
+    """
+    previous_handlers: dict[int, Any] = {}
+    if threading.current_thread() is threading.main_thread():
+        for name in ("SIGTERM", "SIGHUP"):
+            signum = getattr(signal, name, None)
+            if signum is not None:
+                previous_handlers[signum] = signal.signal(signum, _exit_on_signal)
+    try:
+        yield
+    except BaseException:
+        kill_process_group(process)
+        raise
+    finally:
+        for signum, handler in previous_handlers.items():
+            if handler is not None:
+                signal.signal(signum, handler)
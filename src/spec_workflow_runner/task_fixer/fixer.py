@@ -138,7 +138,7 @@ class TaskFixer:
             )
 
             result = run_command(
-                command.to_list(),
+                command.argv,
                 cwd=project_path,
                 timeout=self._subprocess_timeout,
                 clean_claude_env=True,
@@ -190,7 +190,10 @@ class TUIApp:
             update: State update to process
         """
         logger.debug(
-            f"State update: project={update.project}, spec={update.spec}, type={update.update_type}"
+            "State update: project=%s, spec=%s, type=%s",
+            update.project,
+            update.spec,
+            update.update_type,
         )
 
         if update.update_type == "runner_state":
@@ -474,11 +477,11 @@ class TUIApp:
                         elif direction == "D":
                             return "left"
                         else:
-                            logger.debug(f"Unknown escape sequence: {repr(data)}")
+                            logger.debug("Unknown escape sequence: %r", data)
                             return None
                     else:
                         # Incomplete escape sequence
-                        logger.debug(f"Incomplete escape sequence: {repr(data)}")
+                        logger.debug("Incomplete escape sequence: %r", data)
                         return None
                 elif data == "\x1b":
                     # Just ESC
@@ -488,7 +491,7 @@ class TUIApp:
                     return data
                 else:
                     # Multiple characters or unknown sequence
-                    logger.debug(f"Unknown input sequence: {repr(data)}")
+                    logger.debug("Unknown input sequence: %r", data)
                     # Return first character only
                     return data[0]
 
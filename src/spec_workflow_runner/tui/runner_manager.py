@@ -23,6 +23,7 @@ from ..utils import (
     check_clean_working_tree,
     check_mcp_server_exists,
     get_current_commit,
+    render_template,
 )
 from .models import RunnerState, RunnerStatus
 from .persistence import StatePersister
@@ -160,7 +161,7 @@ class RunnerManager:
         }
 
         # Build command for provider
-        prompt = self.config.prompt_template.format(**context)
+        prompt = render_template(self.config.prompt_template, context)
         provider_cmd = provider.build_command(
             prompt=prompt,
             project_path=project_path,
@@ -182,7 +183,7 @@ class RunnerManager:
         log_path = log_dir / log_filename
 
         # Start subprocess with Popen (non-blocking)
-        cmd_list = provider_cmd.to_list()
+        cmd_list = provider_cmd.argv
         logger.info(f"Starting runner: {' '.join(cmd_list)}")
 
         # Open log file and keep it open for the duration of the process
@@ -592,7 +593,7 @@ class RunnerManager:
                 "timestamp": datetime.now().isoformat(),
             }
 
-            prompt = self.config.prompt_template.format(**context)
+            prompt = render_template(self.config.prompt_template, context)
             provider_cmd = provider.build_command(
                 prompt=prompt,
                 project_path=runner.project_path,
@@ -614,7 +615,7 @@ class RunnerManager:
             # Start new process
             log_file = log_path.open("w", encoding="utf-8", buffering=1)
             process = popen_command(
-                provider_cmd.to_list(),
+                provider_cmd.argv,
                 cwd=runner.project_path,
                 stdout=log_file,
                 clean_claude_env=True,
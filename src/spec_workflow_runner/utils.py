@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import os
 import re
+import string
 import time
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, TypeVar
@@ -24,6 +26,44 @@ class RunnerError(Exception):
     """Raised when the run needs to abort early."""
 
 
+# Provider error phrases in one alternation; each named group is the error kind
+_ERROR_KIND_PATTERN = re.compile(
+    # Claude: "hit your limit", "rate limit", "too many requests";
+    # OpenAI: "rate_limit_exceeded", "quota exceeded"; HTTP 429 Too Many Requests
+    r"(?P<rate>hit your limit|rate[ _]limit|too many requests|quota exceeded|429)"
+    # Claude: "context limit", "exceed context", "context window", "prompt is too long";
+    # OpenAI: "context_length_exceeded", "exceeds the context window", "maximum context length"
+    r"|(?P<context>context limit|exceeds? context|context window|prompt is too long"
+    r"|context_length_exceeded|maximum context length)"
+    r"|(?P<timeout>timed out after|timeout exceeded)"
+    r"|(?P<no_messages>no messages returned)"
+    # Gemini: only context-related when the message also mentions tokens or context
+    r"|(?P<resource_exhausted>resource_exhausted)",
+    re.IGNORECASE,
+)
+_TOKEN_OR_CONTEXT_PATTERN = re.compile(r"token|context", re.IGNORECASE)
+
+
+def classify_error(error_message: str) -> frozenset[str]:
+    """Find every error kind in a provider error message in a single regex pass.
+
+    Args:
+        error_message: The error message string to check
+
+    Returns:
+        Subset of {"rate", "context", "timeout", "no_messages"}
+    """
+    # Every alternative is a named group, so lastgroup is never None in practice
+    kinds = {
+        match.lastgroup for match in _ERROR_KIND_PATTERN.finditer(error_message) if match.lastgroup
+    }
+    if "resource_exhausted" in kinds:
+        kinds.discard("resource_exhausted")
+        if _TOKEN_OR_CONTEXT_PATTERN.search(error_message):
+            kinds.add("context")
+    return frozenset(kinds)
+
+
 def is_rate_limit_error(error_message: str) -> bool:
     """Detect if an error is due to rate limit/quota exceeded.
 
@@ -38,23 +78,7 @@ def is_rate_limit_error(error_message: str) -> bool:
     Returns:
         True if the error is a rate limit error, False otherwise
     """
-    error_lower = error_message.lower()
-
-    # Rate limit patterns
-    if "hit your limit" in error_lower:
-        return True
-    if "rate limit" in error_lower:
-        return True
-    if "rate_limit" in error_lower:
-        return True
-    if "too many requests" in error_lower:
-        return True
-    if "quota exceeded" in error_lower:
-        return True
-    if "429" in error_message:  # HTTP 429 Too Many Requests
-        return True
-
-    return False
+    return "rate" in classify_error(error_message)
 
 
 def is_context_limit_error(error_message: str) -> bool:
@@ -71,31 +95,7 @@ def is_context_limit_error(error_message: str) -> bool:
     Returns:
         True if the error is a context limit error, False otherwise
     """
-    error_lower = error_message.lower()
-
-    # Claude API error patterns
-    if "context limit" in error_lower:
-        return True
-    if "exceed context" in error_lower or "exceeds context" in error_lower:
-        return True
-    if "context window" in error_lower:
-        return True
-    if "prompt is too long" in error_lower:
-        return True
-
-    # OpenAI error patterns
-    if "context_length_exceeded" in error_lower:
-        return True
-    if "exceeds the context window" in error_lower:
-        return True
-    if "maximum context length" in error_lower:
-        return True
-
-    # Gemini error patterns (be specific to avoid false positives)
-    if "resource_exhausted" in error_lower and ("token" in error_lower or "context" in error_lower):
-        return True
-
-    return False
+    return "context" in classify_error(error_message)
 
 
 def is_timeout_error(error_message: str) -> bool:
@@ -107,8 +107,7 @@ def is_timeout_error(error_message: str) -> bool:
     Returns:
         True if the error is a timeout error, False otherwise
     """
-    error_lower = error_message.lower()
-    return "timed out after" in error_lower or "timeout exceeded" in error_lower
+    return "timeout" in classify_error(error_message)
 
 
 def is_no_messages_error(error_message: str) -> bool:
@@ -124,8 +123,7 @@ def is_no_messages_error(error_message: str) -> bool:
     Returns:
         True if the error is a 'No messages returned' error, False otherwise
     """
-    error_lower = error_message.lower()
-    return "no messages returned" in error_lower
+    return "no_messages" in classify_error(error_message)
 
 
 def reduce_spec_context(project_path: Path, spec_name: str, cfg: Config) -> bool:
@@ -241,7 +239,7 @@ def _install_mcp_server(provider: Provider, project_path: Path, cfg: Config) ->
 
     # Install MCP server automatically
     add_cmd = provider.get_mcp_add_command(server_name, package)
-    command = add_cmd.to_list()
+    command = add_cmd.argv
 
     logger.info(f"Installing MCP server: {' '.join(command)}")
     print(f"\n📦 Auto-installing spec-workflow MCP server for {provider.get_provider_name()}...")
@@ -297,7 +295,7 @@ def check_mcp_server_exists(
         cfg: Configuration object with MCP settings
     """
     mcp_cmd = provider.get_mcp_list_command()
-    command = mcp_cmd.to_list()
+    command = mcp_cmd.argv
     server_name = cfg.mcp_server_name
 
     try:
@@ -606,6 +604,21 @@ class TaskStats:
         percentage = self.completion_percentage
         return f"[{bar}] {percentage:.1f}%"
 
+    @classmethod
+    def from_details(cls, details: list[TaskDetail]) -> TaskStats:
+        """Count statuses of already-parsed tasks.
+
+        read_task_details classifies tasks exactly like read_task_stats, so callers
+        that need both can parse tasks.md once.
+        """
+        done = in_progress = 0
+        for detail in details:
+            if detail.status == "completed":
+                done += 1
+            elif detail.status == "in_progress":
+                in_progress += 1
+        return cls(done=done, pending=len(details) - done - in_progress, in_progress=in_progress)
+
 
 @dataclass(frozen=True)
 class TaskDetail:
@@ -754,16 +767,94 @@ def discover_projects(cfg: Config, *, force_refresh: bool = False) -> list[Path]
     return projects
 
 
+@functools.lru_cache(maxsize=32)
+def _compile_template(template: str) -> tuple[tuple[str, str | None, str | None, str], ...] | None:
+    """Parse a str.format template once into (literal, field, conversion, spec) parts.
+
+    Returns None when a field uses positional, attribute, index or nested-spec
+    syntax; render_template leaves those templates to str.format.
+    """
+    parts = []
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+        if field_name is not None and (
+            not field_name.isidentifier() or (format_spec and "{" in format_spec)
+        ):
+            return None
+        parts.append((literal, field_name, conversion, format_spec or ""))
+    return tuple(parts)
+
+
+def render_template(template: str, context: Mapping[str, object]) -> str:
+    """Render template like template.format(**context), parsing each template only once.
+
+    Raises:
+        KeyError: If the template references a field missing from context
+        ValueError: If the template is malformed
+    """
+    parts = _compile_template(template)
+    if parts is None:
+        return template.format(**context)
+
+    pieces: list[str] = []
+    for literal, field_name, conversion, format_spec in parts:
+        pieces.append(literal)
+        if field_name is None:
+            continue
+        value = context[field_name]
+        if conversion == "r":
+            value = repr(value)
+        elif conversion == "s":
+            value = str(value)
+        elif conversion == "a":
+            value = ascii(value)
+        pieces.append(format(value, format_spec))
+    return "".join(pieces)
+
+
+# Changes within one filesystem timestamp tick leave mtime unchanged
+# (FAT and many SMB mounts round it to 2 seconds)
+_MTIME_GRANULARITY_NS = 2_000_000_000
+
+
+def mtime_is_settled(mtime_ns: int) -> bool:
+    """Tell whether an mtime is old enough to key a cache on.
+
+    A change in the same tick as the last one would not move mtime, so an
+    entry cached while its mtime is this recent could go stale unnoticed.
+
+    Args:
+        mtime_ns: Modification time in nanoseconds, as from st_mtime_ns
+
+    Returns:
+        True if at least one timestamp tick has passed since mtime_ns
+    """
+    return time.time_ns() - mtime_ns >= _MTIME_GRANULARITY_NS
+
+
+@functools.lru_cache(maxsize=64)
+def _scan_specs(specs_root: Path, mtime_ns: int) -> tuple[tuple[str, Path], ...]:
+    """Scan specs_root for spec directories.
+
+    mtime_ns is only part of the cache key: adding, removing or renaming a spec
+    directory updates the parent's mtime, which forces a fresh scan.
+    """
+    return tuple((child.name, child) for child in sorted(specs_root.iterdir()) if child.is_dir())
+
+
 def discover_specs(project_path: Path, cfg: Config) -> list[tuple[str, Path]]:
-    """List specs for the selected project."""
+    """List specs for the selected project.
+
+    Repeated calls on an unchanged specs directory cost a single stat. A
+    directory modified within the last timestamp tick is always rescanned,
+    since another change in that tick would not move its mtime.
+    """
     specs_root = project_path / cfg.spec_workflow_dir_name / cfg.specs_subdir
-    if not specs_root.exists():
-        raise FileNotFoundError(f"No specs directory at {specs_root}")
-    specs: list[tuple[str, Path]] = []
-    for child in sorted(specs_root.iterdir()):
-        if child.is_dir():
-            specs.append((child.name, child))
-    return specs
+    try:
+        mtime_ns = specs_root.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"No specs directory at {specs_root}") from None
+    scan = _scan_specs if mtime_is_settled(mtime_ns) else _scan_specs.__wrapped__
+    return list(scan(specs_root, mtime_ns))
 
 
 TASK_PATTERN = re.compile(
@@ -791,7 +882,7 @@ def read_task_stats(tasks_path: Path) -> TaskStats:
     1. Checkbox format: - [ ] 1. Task title
     2. Heading format: ### TASK-ID: Title with **Status**: field
     """
-    text = tasks_path.read_text(encoding="utf-8")
+    text = read_tasks_text_cached(tasks_path)
 
     # Only count tasks in the "## Tasks" section
     # Stop counting at "## Task Validation Checklist" or similar
@@ -857,8 +948,11 @@ def read_task_details(tasks_path: Path) -> list[TaskDetail]:
 
     Returns a list of TaskDetail objects with task ID, title, status, and description.
     """
-    text = tasks_path.read_text(encoding="utf-8")
+    return _parse_task_details(tasks_path.read_text(encoding="utf-8"))
+
 
+def _parse_task_details(text: str) -> list[TaskDetail]:
+    """Parse TaskDetail entries from the text of a tasks.md file."""
     # Extract Tasks section
     tasks_section_start = text.find("## Tasks")
     if tasks_section_start == -1:
@@ -942,6 +1036,60 @@ def read_task_details(tasks_path: Path) -> list[TaskDetail]:
     return tasks
 
 
+@functools.lru_cache(maxsize=128)
+def _read_tasks_text(tasks_path: Path, mtime_ns: int, size: int) -> str:
+    """Read tasks.md.
+
+    mtime_ns and size are only part of the cache key: editing the file moves
+    them, which forces a fresh read.
+    """
+    return tasks_path.read_text(encoding="utf-8")
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_tasks_text(text: str) -> tuple[TaskStats, tuple[TaskDetail, ...]]:
+    """Parse tasks.md contents; keyed on the text, so a re-read of unchanged content hits."""
+    details = _parse_task_details(text)
+    return TaskStats.from_details(details), tuple(details)
+
+
+def read_tasks_text_cached(tasks_path: Path) -> str:
+    """Return the contents of tasks.md, re-reading only when the file changes.
+
+    A file modified within the last timestamp tick is always read fresh, since
+    a same-size edit in that tick would not move its mtime.
+
+    Args:
+        tasks_path: Path to tasks.md
+
+    Returns:
+        File contents
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    st = tasks_path.stat()
+    read = _read_tasks_text if mtime_is_settled(st.st_mtime_ns) else _read_tasks_text.__wrapped__
+    return read(tasks_path, st.st_mtime_ns, st.st_size)
+
+
+def read_tasks_cached(tasks_path: Path) -> tuple[TaskStats, list[TaskDetail]]:
+    """Return task counts and details from a single parse of tasks.md.
+
+    The text comes from read_tasks_text_cached and the parse is cached on that
+    text, so loops that re-check an unchanged file skip both the read and the
+    parse.
+
+    Args:
+        tasks_path: Path to tasks.md
+
+    Returns:
+        Tuple of (stats, details), with details in file order
+    """
+    stats, details = _parse_tasks_text(read_tasks_text_cached(tasks_path))
+    return stats, list(details)
+
+
 def list_unfinished_specs(project: Path, cfg: Config) -> list[tuple[str, Path]]:
     """Return specs with unfinished tasks, sorted by requirements.md creation time (oldest first)."""
     unfinished_with_ctime: list[tuple[float, str, Path]] = []
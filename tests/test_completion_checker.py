@@ -0,0 +1,175 @@
+"""Tests for completion_checker module."""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from spec_workflow_runner.completion_checker import (
+    _count_commits_after_rescue,
+    _JsonObjectScanner,
+    _stream_probe_output,
+    check_uncommitted_changes,
+    read_head_oid,
+)
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    """Create a temporary git repository with one commit."""
+    subprocess.run(["git", "init"], cwd=tmp_path, check=True, capture_output=True)
+    subprocess.run(
+        ["git", "config", "user.email", "test@example.com"],
+        cwd=tmp_path,
+        check=True,
+        capture_output=True,
+    )
+    subprocess.run(
+        ["git", "config", "user.name", "Test User"],
+        cwd=tmp_path,
+        check=True,
+        capture_output=True,
+    )
+    (tmp_path / "tracked.txt").write_text("original\n")
+    (tmp_path / "to_rename.txt").write_text("rename me\n")
+    subprocess.run(["git", "add", "-A"], cwd=tmp_path, check=True, capture_output=True)
+    subprocess.run(
+        ["git", "commit", "-m", "initial"], cwd=tmp_path, check=True, capture_output=True
+    )
+    return tmp_path
+
+
+def _rev_parse_head(repo: Path) -> str:
+    return subprocess.run(
+        ["git", "rev-parse", "HEAD"], cwd=repo, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def test_check_uncommitted_changes_clean(git_repo: Path):
+    """Test a clean working tree reports no changes."""
+    changes = check_uncommitted_changes(git_repo)
+
+    assert changes["has_changes"] is False
+    assert changes["changed_files"] == []
+    assert changes["staged_files"] == []
+
+
+def test_check_uncommitted_changes_classifies_entries(git_repo: Path):
+    """Test modified, staged, renamed and untracked files are classified."""
+    (git_repo / "tracked.txt").write_text("modified\n")
+    (git_repo / "new file.txt").write_text("untracked\n")
+    subprocess.run(
+        ["git", "mv", "to_rename.txt", "renamed.txt"],
+        cwd=git_repo,
+        check=True,
+        capture_output=True,
+    )
+
+    changes = check_uncommitted_changes(git_repo)
+
+    assert changes["has_changes"] is True
+    assert sorted(changes["changed_files"]) == ["new file.txt", "renamed.txt", "tracked.txt"]
+    assert changes["staged_files"] == ["renamed.txt"]
+
+
+def test_check_uncommitted_changes_outside_repo(tmp_path: Path):
+    """Test a non-repository directory reports no changes."""
+    changes = check_uncommitted_changes(tmp_path)
+
+    assert changes["has_changes"] is False
+
+
+def test_read_head_oid_matches_git(git_repo: Path):
+    """Test HEAD is resolved from a loose ref without invoking git."""
+    assert read_head_oid(git_repo) == _rev_parse_head(git_repo)
+
+
+def test_read_head_oid_packed_refs(git_repo: Path):
+    """Test HEAD is resolved from packed-refs after git pack-refs."""
+    subprocess.run(["git", "pack-refs", "--all"], cwd=git_repo, check=True, capture_output=True)
+
+    assert read_head_oid(git_repo) == _rev_parse_head(git_repo)
+
+
+def test_read_head_oid_not_a_repo(tmp_path: Path):
+    """Test None is returned when there is no .git directory."""
+    assert read_head_oid(tmp_path) is None
+
+
+def test_count_commits_after_rescue_counts_commits_made_before_rescue(git_repo: Path):
+    """Test a commit made after baseline but before the rescue is still counted."""
+    baseline = _rev_parse_head(git_repo)
+    assert _count_commits_after_rescue(git_repo, baseline) == 0
+
+    # Agent commits during the probe window, so HEAD moves before the rescue runs
+    (git_repo / "tracked.txt").write_text("agent work\n")
+    subprocess.run(["git", "commit", "-am", "agent"], cwd=git_repo, check=True, capture_output=True)
+    check_uncommitted_changes(git_repo)
+
+    assert _count_commits_after_rescue(git_repo, baseline) == 1
+
+
+def test_json_object_scanner_across_chunks():
+    """Test the scanner returns the object only once its closing brace arrives."""
+    scanner = _JsonObjectScanner()
+
+    assert scanner.feed("Here you go:\n```json\n{\n") is None
+    assert scanner.feed('  "status": "complete",\n') is None
+    assert scanner.feed('  "message": "braces } and \\" in strings"\n') is None
+    assert scanner.feed("}\n```\n") == (
+        '{\n  "status": "complete",\n  "message": "braces } and \\" in strings"\n}'
+    )
+
+
+def test_json_object_scanner_nested():
+    """Test nested objects are kept whole."""
+    scanner = _JsonObjectScanner()
+
+    assert scanner.feed('{"a": {"b": 1}, "c": 2} trailing {') == '{"a": {"b": 1}, "c": 2}'
+
+
+def test_json_object_scanner_skips_braces_in_prose():
+    """Test a balanced span that is not JSON does not end the scan."""
+    scanner = _JsonObjectScanner()
+
+    assert scanner.feed('Checked {the "tasks" file}, result:\n') is None
+    assert scanner.feed('{"status": "waiting"}\n') == '{"status": "waiting"}'
+
+
+def test_json_object_scanner_finds_object_inside_prose_braces():
+    """Test an object nested in a non-JSON brace span is still found."""
+    scanner = _JsonObjectScanner()
+
+    assert scanner.feed('{note: {"status": "complete"}}') == '{"status": "complete"}'
+
+
+def test_stream_probe_output_stops_after_json(tmp_path: Path):
+    """Test the probe returns without waiting for trailing output."""
+    script = 'import time; print(\'{"status": "complete"}\', flush=True); time.sleep(30)'
+
+    started = time.monotonic()
+    output, json_str = _stream_probe_output([sys.executable, "-c", script], tmp_path, timeout=20)
+
+    assert json_str == '{"status": "complete"}'
+    assert output.startswith(json_str)
+    assert time.monotonic() - started < 10
+
+
+def test_stream_probe_output_timeout(tmp_path: Path):
+    """Test a probe that never prints JSON raises TimeoutExpired."""
+    script = "import time; print('thinking', flush=True); time.sleep(30)"
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        _stream_probe_output([sys.executable, "-c", script], tmp_path, timeout=0.5)
+
+
+def test_stream_probe_output_without_json(tmp_path: Path):
+    """Test plain output is returned for the regex fallback when no object closes."""
+    output, json_str = _stream_probe_output(
+        [sys.executable, "-c", "print('no json here')"], tmp_path, timeout=10
+    )
+
+    assert json_str is None
+    assert output == "no json here\n"
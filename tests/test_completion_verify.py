@@ -4,6 +4,7 @@ from pathlib import Path
 
 import pytest
 
+from spec_workflow_runner import completion_verify
 from spec_workflow_runner.completion_verify import (
     check_files_exist,
     extract_acceptance_criteria,
@@ -119,6 +120,18 @@ def test_extract_files_from_task_section():
     assert "lib/models/subscription.dart" in files
 
 
+def test_extract_files_from_task_section_deduplicates_in_order():
+    """Test duplicate file references are dropped while keeping first-seen order."""
+    task_text = """
+- **Files**: lib/a.dart, lib/b.dart, lib/a.dart
+- **Description**: Touches `lib/b.dart` and `lib/c.dart`
+"""
+
+    files = extract_files_from_task_section(task_text)
+
+    assert files == ["lib/a.dart", "lib/b.dart", "lib/c.dart"]
+
+
 def test_check_files_exist_all_present(project_with_changes: Path):
     """Test checking files when all exist."""
     files = [
@@ -187,6 +200,31 @@ def test_verify_in_progress_tasks_invalid(tasks_md_in_progress: Path, project_wi
     assert any("Missing files" in issue or "No files" in issue for issue in invalid_task.issues)
 
 
+def test_verify_in_progress_tasks_reuses_parse_of_unchanged_tasks(
+    tasks_md_in_progress: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Tasks still in progress on the next verification pass are not re-parsed."""
+    monkeypatch.setattr(completion_verify, "get_modified_files", lambda *args: [])
+    for cached in (
+        completion_verify._parse_acceptance_criteria,
+        completion_verify._extract_file_paths,
+    ):
+        cached.cache_clear()
+
+    verify_in_progress_tasks(tasks_md_in_progress, tasks_md_in_progress.parent)
+    # Task 1 completes; task 2 carries over to the next pass unchanged
+    content = tasks_md_in_progress.read_text()
+    tasks_md_in_progress.write_text(content.replace("- [-] 1.", "- [x] 1."))
+    verify_in_progress_tasks(tasks_md_in_progress, tasks_md_in_progress.parent)
+
+    for cached in (
+        completion_verify._parse_acceptance_criteria,
+        completion_verify._extract_file_paths,
+    ):
+        info = cached.cache_info()
+        assert (info.hits, info.misses) == (1, 2)
+
+
 def test_update_verified_tasks(tmp_path: Path):
     """Test updating tasks.md with verified completions."""
     tasks_file = tmp_path / "tasks.md"
@@ -219,3 +257,45 @@ def test_update_verified_tasks(tmp_path: Path):
     content = tasks_file.read_text()
     assert "- [x] 1. Task to complete" in content
     assert "- [-] 2. Task to keep in progress" in content
+
+
+def test_update_verified_tasks_multiple_in_one_pass(tmp_path: Path):
+    """Test several verified tasks are marked regardless of their order."""
+    tasks_file = tmp_path / "tasks.md"
+    tasks_file.write_text("""## Tasks
+
+- [-] 1. First task
+- [-] 2. Second task
+- [x] 3. Third task
+- [-] 4. Fourth task
+""")
+
+    from spec_workflow_runner.completion_verify import TaskVerification
+
+    def _verified(title: str, passed: bool = True) -> TaskVerification:
+        return TaskVerification(
+            task_id=title.split(".")[0],
+            title=title,
+            current_status="in_progress",
+            files_modified=[],
+            acceptance=None,
+            verification_passed=passed,
+            issues=[],
+        )
+
+    verified_tasks = [
+        _verified("4. Fourth task"),
+        _verified("2. Second task", passed=False),
+        _verified("1. First task"),
+    ]
+
+    completed_count = update_verified_tasks(tasks_file, verified_tasks)
+
+    assert completed_count == 2
+    assert tasks_file.read_text() == """## Tasks
+
+- [x] 1. First task
+- [-] 2. Second task
+- [x] 3. Third task
+- [x] 4. Fourth task
+"""
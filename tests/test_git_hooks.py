@@ -1,6 +1,9 @@
 """Tests for git_hooks module."""
 
+import errno
+import os
 import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -77,6 +80,121 @@ def test_install_blocker_with_existing_hook(git_repo: Path):
     assert "spec-workflow-runner" in content
 
 
+def test_install_blocker_keeps_existing_backup(git_repo: Path):
+    """Test an older backup is never overwritten by the current hook."""
+    manager = GitHookManager(git_repo)
+    manager.backup_hook.write_text("#!/bin/sh\necho 'original'\n")
+    manager.pre_commit_hook.write_text("#!/bin/sh\necho 'stale'\n")
+
+    assert manager.install_commit_blocker() is True
+
+    assert manager.backup_hook.read_text() == "#!/bin/sh\necho 'original'\n"
+    assert manager.is_blocker_installed()
+
+
+def test_install_blocker_without_hard_links_backs_up_by_rename(git_repo: Path, monkeypatch):
+    """Test the existing hook is still backed up where hard links are unsupported."""
+    manager = GitHookManager(git_repo)
+    manager.pre_commit_hook.write_text("#!/bin/sh\necho 'original'\n")
+
+    def no_links(*args: object, **kwargs: object) -> None:
+        raise PermissionError(errno.EPERM, "hard links not supported")
+
+    monkeypatch.setattr(os, "link", no_links)
+
+    assert manager.install_commit_blocker() is True
+
+    assert manager.backup_hook.read_text() == "#!/bin/sh\necho 'original'\n"
+    assert manager.is_blocker_installed()
+
+
+def test_install_blocker_leaves_no_temp_file(git_repo: Path):
+    """Test the hook is swapped in from a temp file that does not linger."""
+    manager = GitHookManager(git_repo)
+
+    assert manager.install_commit_blocker() is True
+
+    assert not manager.tmp_hook.exists()
+    assert manager.is_blocker_installed()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="no executable bit on Windows")
+def test_install_blocker_over_stale_temp_file_is_executable(git_repo: Path):
+    """Test a leftover non-executable temp file does not produce a disabled hook."""
+    manager = GitHookManager(git_repo)
+    manager.tmp_hook.write_text("stale")
+    manager.tmp_hook.chmod(0o644)
+
+    assert manager.install_commit_blocker() is True
+
+    assert os.access(manager.pre_commit_hook, os.X_OK)
+
+
+def test_install_blocker_removes_temp_file_on_write_failure(git_repo: Path, monkeypatch):
+    """Test a failed write does not leave the temp file behind."""
+    manager = GitHookManager(git_repo)
+
+    def failing_write(fd: int, data: bytes) -> int:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "write", failing_write)
+    with pytest.raises(OSError, match="disk full"):
+        manager.install_commit_blocker()
+    monkeypatch.undo()
+
+    assert not manager.tmp_hook.exists()
+    assert not manager.pre_commit_hook.exists()
+
+
+def test_install_blocker_without_hooks_dir(tmp_path: Path):
+    """Test install fails cleanly when the hooks directory is missing."""
+    manager = GitHookManager(tmp_path)
+
+    assert manager.install_commit_blocker() is False
+    assert not manager.pre_commit_hook.exists()
+
+
+def test_install_blocker_with_git_file(tmp_path: Path):
+    """Test install fails cleanly in a worktree or submodule, where .git is a file."""
+    (tmp_path / ".git").write_text("gitdir: /elsewhere/.git/worktrees/feature\n")
+    manager = GitHookManager(tmp_path)
+
+    assert manager.install_commit_blocker() is False
+
+
+def test_remove_blocker_with_git_file(tmp_path: Path):
+    """Test removal is a no-op in a worktree or submodule, where .git is a file."""
+    (tmp_path / ".git").write_text("gitdir: /elsewhere/.git/worktrees/feature\n")
+    manager = GitHookManager(tmp_path)
+
+    assert manager.remove_commit_blocker() is True
+    assert manager.is_blocker_installed() is False
+
+
+def test_block_commits_with_git_file_keeps_original_error(tmp_path: Path):
+    """Test teardown in a worktree does not mask the error raised inside the block."""
+    (tmp_path / ".git").write_text("gitdir: /elsewhere/.git/worktrees/feature\n")
+
+    with pytest.raises(ValueError, match="session failed"):
+        with block_commits(tmp_path):
+            raise ValueError("session failed")
+
+
+def test_install_blocker_propagates_unexpected_link_errors(git_repo: Path, monkeypatch):
+    """Test only the no-hard-link errnos fall back to rename."""
+    manager = GitHookManager(git_repo)
+    manager.pre_commit_hook.write_text("#!/bin/sh\n")
+
+    def failing_link(*args: object, **kwargs: object) -> None:
+        raise OSError(errno.EIO, "I/O error")
+
+    monkeypatch.setattr(os, "link", failing_link)
+
+    with pytest.raises(OSError, match="I/O error"):
+        manager.install_commit_blocker()
+    assert manager.pre_commit_hook.exists()
+
+
 def test_remove_commit_blocker(git_repo: Path):
     """Test removing commit blocker hook."""
     manager = GitHookManager(git_repo)
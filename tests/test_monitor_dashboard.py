@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from rich.console import Console
+from rich.panel import Panel
+
+from spec_workflow_runner import monitor as monitor_module
+from spec_workflow_runner.monitor import Dashboard
+from spec_workflow_runner.utils import TaskStats
+
+
+def _render(renderable: object) -> str:
+    console = Console(width=80, record=True, color_system=None)
+    console.print(renderable)
+    return console.export_text()
+
+
+def test_dashboard_updates_counts_in_place(tmp_path: Path) -> None:
+    dashboard = Dashboard(tmp_path, "demo-spec")
+    log_panel = Panel("logs")
+
+    first = _render(dashboard.update(TaskStats(done=1, pending=2, in_progress=1), log_panel))
+    assert "demo-spec" in first
+    assert "1/4" in first
+
+    second = _render(dashboard.update(TaskStats(done=4, pending=0, in_progress=0), log_panel))
+    assert "4/4" in second
+    assert "1/4" not in second
+
+
+def test_monitor_sees_same_size_flip_within_one_timestamp_tick(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    spec_path = tmp_path / "spec"
+    spec_path.mkdir()
+    tasks_path = spec_path / "tasks.md"
+    tasks_path.write_text("- [-] 1. Only task\n")
+    cfg = SimpleNamespace(
+        tasks_filename="tasks.md",
+        monitor_refresh_seconds=1.0,
+        log_dir_name="logs",
+        log_file_template="task_{index}.log",
+    )
+    sleeps: list[float] = []
+
+    def flip_in_same_tick(seconds: float) -> None:
+        sleeps.append(seconds)
+        if len(sleeps) == 1:
+            # Same size and, as on a coarse-timestamp filesystem, the same mtime
+            mtime_ns = tasks_path.stat().st_mtime_ns
+            tasks_path.write_text("- [x] 1. Only task\n")
+            os.utime(tasks_path, ns=(mtime_ns, mtime_ns))
+        elif len(sleeps) > 5:
+            raise AssertionError("monitor never noticed the completed task")
+
+    monkeypatch.setattr(monitor_module.time, "sleep", flip_in_same_tick)
+
+    monitor_module.monitor(cfg, tmp_path, "spec", spec_path)  # type: ignore[arg-type]
+
+    assert len(sleeps) == 1
@@ -35,3 +35,21 @@ def test_log_follower_switches_to_latest_file(tmp_path: Path) -> None:
     follower.poll()
     assert follower.lines == ["new"]
     assert follower.current_path == log_b
+
+
+def test_log_follower_poll_reports_changes(tmp_path: Path) -> None:
+    follower = LogFollower(tmp_path, pattern="*.log", max_lines=5)
+    assert follower.poll() is False
+
+    log_path = tmp_path / "task_1.log"
+    log_path.write_text("first\n", encoding="utf-8")
+    assert follower.poll() is True
+    assert follower.poll() is False
+
+    with log_path.open("a", encoding="utf-8") as handle:
+        handle.write("second\n")
+    assert follower.poll() is True
+
+    log_path.unlink()
+    assert follower.poll() is True
+    assert follower.poll() is False
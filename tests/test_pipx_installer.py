@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import sys
 from collections.abc import Sequence
 from datetime import UTC, datetime
 from pathlib import Path
 
+import pytest
+
 from spec_workflow_runner import pipx_installer as pipx
 
 
@@ -74,3 +77,38 @@ def test_normalize_target_prefers_real_path(tmp_path: Path) -> None:
     normalized = pipx._normalize_target(str(tmp_path))
 
     assert normalized == str(tmp_path.resolve())
+
+
+def test_normalize_target_keeps_package_specs(tmp_path: Path) -> None:
+    missing = tmp_path / "does-not-exist"
+
+    assert pipx._normalize_target("spec-workflow-runner==0.1.0") == "spec-workflow-runner==0.1.0"
+    assert pipx._normalize_target(str(missing)) == str(missing)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="symlinks need privileges on Windows")
+def test_normalize_target_keeps_symlink_loops(tmp_path: Path) -> None:
+    loop = tmp_path / "loop"
+    loop.symlink_to(loop)
+
+    assert pipx._normalize_target(str(loop)) == str(loop)
+
+
+def test_json_logger_emits_compact_lines(capsys) -> None:
+    import json
+
+    logger = pipx.JsonLogger(debug=False, now=lambda: datetime(2024, 1, 1, tzinfo=UTC))
+
+    logger.info("pipx.install", target=Path("/tmp/pkg"), pip_args=None)
+    logger.debug("pipx.hidden")
+
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 1
+    assert ", " not in lines[0]
+    assert json.loads(lines[0]) == {
+        "ts": "2024-01-01T00:00:00+00:00",
+        "level": "info",
+        "service": pipx.SERVICE_NAME,
+        "event": "pipx.install",
+        "context": {"target": "/tmp/pkg", "pip_args": ""},
+    }
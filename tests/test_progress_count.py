@@ -4,6 +4,7 @@ from pathlib import Path
 
 import pytest
 
+from spec_workflow_runner import progress_count
 from spec_workflow_runner.progress_count import (
     TaskProgress,
     count_tasks,
@@ -149,6 +150,24 @@ def test_count_tasks_with_whitespace_variations(tmp_path: Path) -> None:
     assert progress.total == 4
 
 
+def test_count_tasks_ignores_non_task_brackets(tmp_path: Path) -> None:
+    """Test that only line-leading checkboxes with a title are counted."""
+    tasks_file = tmp_path / "tasks.md"
+    tasks_file.write_text("""## Tasks
+
+- [ ] 1. Real task mentioning - [x] inline
+Text with [x] brackets and a - [-] marker
+* [x] Star bullets are not tasks
+- [x]
+- [?] Unknown state
+""")
+
+    progress = count_tasks(tasks_file)
+
+    assert progress.pending == 1
+    assert progress.total == 1
+
+
 def test_count_tasks_stops_at_next_section(tmp_path: Path) -> None:
     """Test that counting stops at next ## section."""
     tasks_file = tmp_path / "tasks.md"
@@ -171,3 +190,72 @@ def test_count_tasks_stops_at_next_section(tmp_path: Path) -> None:
     assert progress.total == 2
     assert progress.pending == 1
     assert progress.completed == 1
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+def test_count_tasks_across_chunk_boundaries(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, chunk_size: int
+) -> None:
+    """Test streamed counting matches regardless of where chunks split lines."""
+    monkeypatch.setattr(progress_count, "_CHUNK_SIZE", chunk_size)
+    tasks_file = tmp_path / "tasks.md"
+    tasks_file.write_text("""# Tasks Document
+
+- [x] Checklist item before the section
+
+## Tasks
+
+- [ ] 1. First task
+  - [-] 1.1 Indented subtask
+- [x] 2. Second task
+
+## Notes
+
+- [ ] Not counted
+#### Task VF-1.1: Heading task after the section
+""")
+
+    progress = count_tasks(tasks_file)
+
+    assert (progress.pending, progress.in_progress, progress.completed) == (1, 1, 1)
+    assert len(validate_format(tasks_file)) == 1
+
+
+def test_count_tasks_without_tasks_header_counts_whole_file(tmp_path: Path) -> None:
+    """Test that the entire file is counted when there is no Tasks section."""
+    tasks_file = tmp_path / "tasks.md"
+    tasks_file.write_text("# Plan\n\n- [ ] 1. First\n\n## Later\n\n- [x] 2. Second")
+
+    progress = count_tasks(tasks_file)
+
+    assert progress.pending == 1
+    assert progress.completed == 1
+
+
+def test_task_progress_to_json_matches_dict() -> None:
+    """Test compact JSON serialization round-trips to to_dict()."""
+    import json
+
+    progress = TaskProgress(pending=2, in_progress=0, completed=1)
+
+    assert json.loads(progress.to_json()) == progress.to_dict()
+
+
+def test_main_count_mode_prints_compact_json(
+    valid_tasks_md: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test the CLI prints one JSON line by default and pretty JSON with --json."""
+    import json
+
+    from spec_workflow_runner.progress_count import main
+
+    monkeypatch.setattr("sys.argv", ["progress_count.py", str(valid_tasks_md)])
+    assert main() == 0
+    compact = capsys.readouterr().out
+    assert compact.count("\n") == 1
+
+    monkeypatch.setattr("sys.argv", ["progress_count.py", "--json", str(valid_tasks_md)])
+    assert main() == 0
+    pretty = capsys.readouterr().out
+    assert json.loads(pretty) == json.loads(compact)
+    assert pretty.count("\n") > 1
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import os
 import time
 from pathlib import Path
 
+import pytest
+
 from spec_workflow_runner.utils import (
     Config,
     ProjectCache,
@@ -14,6 +17,7 @@ from spec_workflow_runner.utils import (
     _scan_projects,
     _write_cache,
     discover_projects,
+    discover_specs,
 )
 
 
@@ -313,3 +317,42 @@ def test_discover_projects_cache_age_message(tmp_path: Path, capsys) -> None:
     discover_projects(cfg)
     output = capsys.readouterr().out
     assert "scanned 3 days ago" in output
+
+
+def test_discover_specs_reuses_scan_until_directory_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cfg = _make_config(tmp_path, tmp_path / "cache")
+    specs_root = tmp_path / ".spec-workflow" / "specs"
+    (specs_root / "alpha").mkdir(parents=True)
+    (specs_root / "notes.md").write_text("not a spec")
+    os.utime(specs_root, (1_000, 1_000))
+    scans: list[Path] = []
+    original_iterdir = Path.iterdir
+
+    def counting_iterdir(self: Path):  # type: ignore[no-untyped-def]
+        scans.append(self)
+        return original_iterdir(self)
+
+    monkeypatch.setattr(Path, "iterdir", counting_iterdir)
+
+    first = discover_specs(tmp_path, cfg)
+    second = discover_specs(tmp_path, cfg)
+
+    assert first == [("alpha", specs_root / "alpha")]
+    assert second == first
+    assert second is not first
+    assert len(scans) == 1
+
+    # The new entry moves the mtime to now, too recent to trust until it settles
+    (specs_root / "beta").mkdir()
+    assert [name for name, _ in discover_specs(tmp_path, cfg)] == ["alpha", "beta"]
+    assert [name for name, _ in discover_specs(tmp_path, cfg)] == ["alpha", "beta"]
+    assert len(scans) == 3
+
+
+def test_discover_specs_missing_directory(tmp_path: Path) -> None:
+    cfg = _make_config(tmp_path, tmp_path / "cache")
+
+    with pytest.raises(FileNotFoundError, match="No specs directory"):
+        discover_specs(tmp_path, cfg)
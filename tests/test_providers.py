@@ -10,6 +10,8 @@ from spec_workflow_runner.providers import (
     ClaudeProvider,
     CodexProvider,
     GeminiProvider,
+    ProviderCommand,
+    _override_args,
     create_provider,
     get_supported_models,
 )
@@ -355,3 +357,38 @@ def test_gemini_provider_get_mcp_list_command() -> None:
 def test_gemini_provider_get_provider_name() -> None:
     provider = GeminiProvider()
     assert provider.get_provider_name() == "Google Gemini"
+
+
+def test_provider_command_argv_is_built_once() -> None:
+    """Test argv holds the full command and to_list returns an independent copy."""
+    cmd = ProviderCommand(executable="codex", args=("mcp", "list"))
+
+    assert cmd.argv == ("codex", "mcp", "list")
+    first = cmd.to_list()
+    first.append("--mutated")
+    assert cmd.to_list() == ["codex", "mcp", "list"]
+    assert cmd == ProviderCommand(executable="codex", args=("mcp", "list"))
+
+
+def test_codex_provider_reuses_override_args_across_calls() -> None:
+    provider = CodexProvider()
+    overrides = (("features.example", "1"),)
+
+    first = provider.build_command("one", Path("/tmp/project"), overrides)
+    second = provider.build_command("two", Path("/tmp/project"), list(overrides))
+
+    assert first.args[:-1] == second.args[:-1]
+    assert first.args[-2:] == ("features.example=1", "one")
+    assert second.args[-1] == "two"
+
+
+def test_create_provider_shares_instances_for_same_arguments() -> None:
+    first = create_provider("codex", ["codex", "e"], model="gpt-5-codex")
+
+    assert create_provider("codex", ("codex", "e"), model="gpt-5-codex") is first
+    assert create_provider("codex", ("codex", "e"), model=None) is not first
+
+
+def test_override_args_formats_flag_pairs() -> None:
+    assert _override_args((("a", "1"), ("b.c", '"x"'))) == ("-c", "a=1", "-c", 'b.c="x"')
+    assert _override_args(()) == ()
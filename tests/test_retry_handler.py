@@ -107,6 +107,19 @@ class TestRetryContext:
         assert len(data["attempts"]) == 1
         assert data["attempts"][0]["exit_code"] == 1
 
+    def test_to_dict_attempts_match_asdict(self):
+        """Test attempt entries keep every RetryAttempt field."""
+        from dataclasses import asdict
+
+        ctx = RetryContext(
+            runner_id="test-123",
+            spec_name="my-spec",
+            project_path=Path("/test/path"),
+        )
+        ctx.add_attempt(exit_code=None, error_message="Crashed", duration=1.5)
+
+        assert ctx.to_dict()["attempts"] == [asdict(ctx.attempts[0])]
+
 
 class TestRetryHandler:
     """Tests for RetryHandler."""
@@ -137,6 +150,11 @@ class TestRetryHandler:
         assert handler._calculate_backoff(3) == 4.0  # 1 * 2^2
         assert handler._calculate_backoff(4) == 8.0  # 1 * 2^3
 
+    def test_calculate_backoff_beyond_schedule(self, handler):
+        """Test attempts past the precomputed schedule are still computed."""
+        assert handler._backoff_schedule == (1.0, 2.0, 4.0, 8.0)
+        assert handler._calculate_backoff(6) == 32.0  # 1 * 2^5
+
     def test_calculate_backoff_with_cap(self, temp_log_dir):
         """Test backoff calculation with maximum cap."""
         config = RetryConfig(
@@ -152,8 +170,8 @@ class TestRetryHandler:
         assert handler._calculate_backoff(3) == 30.0  # 10 * 2^2 = 40, capped at 30
         assert handler._calculate_backoff(4) == 30.0  # Capped
 
-    def test_should_retry_disabled(self, temp_log_dir):
-        """Test retry disabled in config."""
+    def test_execute_with_retry_disabled(self, temp_log_dir):
+        """Test a failure is not retried when retry is disabled in config."""
         config = RetryConfig(retry_on_crash=False, retry_log_dir=temp_log_dir)
         handler = RetryHandler(config)
 
@@ -162,49 +180,46 @@ class TestRetryHandler:
             spec_name="my-spec",
             project_path=Path("/test"),
         )
+        command_fn = Mock(return_value=Mock())
+        monitor_fn = Mock(return_value=(1, "Error"))
 
-        assert handler._should_retry(ctx, exit_code=1) is False
-
-    def test_should_retry_max_exceeded(self, handler):
-        """Test max retries exceeded."""
-        ctx = RetryContext(
-            runner_id="test-123",
-            spec_name="my-spec",
-            project_path=Path("/test"),
-        )
-
-        # Add 3 failed attempts (max_retries=3)
-        ctx.add_attempt(1, "Error", 1.0)
-        ctx.add_attempt(1, "Error", 1.0)
-        ctx.add_attempt(1, "Error", 1.0)
+        success, result_ctx = handler.execute_with_retry(ctx, command_fn, monitor_fn)
 
-        assert ctx.attempt_count == 3
-        assert handler._should_retry(ctx, exit_code=1) is False
+        assert success is False
+        assert result_ctx.attempt_count == 1
 
-    def test_should_retry_on_failure(self, handler):
-        """Test retry on non-zero exit code."""
+    def test_execute_with_retry_stops_at_max_retries(self, handler):
+        """Test attempts stop once max_retries attempts are recorded."""
         ctx = RetryContext(
             runner_id="test-123",
             spec_name="my-spec",
             project_path=Path("/test"),
         )
+        command_fn = Mock(return_value=Mock())
+        monitor_fn = Mock(return_value=(1, "Error"))
 
-        # First failure - should retry
-        assert handler._should_retry(ctx, exit_code=1) is True
+        with patch("time.sleep") as sleep:
+            success, result_ctx = handler.execute_with_retry(ctx, command_fn, monitor_fn)
 
-        # Add attempt and check again
-        ctx.add_attempt(1, "Error", 1.0)
-        assert handler._should_retry(ctx, exit_code=1) is True
+        assert success is False
+        assert result_ctx.attempt_count == 3  # max_retries=3
+        assert sleep.call_count == 2
 
-    def test_should_not_retry_on_success(self, handler):
-        """Test no retry on successful exit."""
+    def test_execute_with_retry_retries_crash_without_exit_code(self, handler):
+        """Test a crash (no exit code) is retried like a non-zero exit."""
         ctx = RetryContext(
             runner_id="test-123",
             spec_name="my-spec",
             project_path=Path("/test"),
         )
+        command_fn = Mock(return_value=Mock())
+        monitor_fn = Mock(side_effect=[(None, "Timed out"), (0, None)])
+
+        with patch("time.sleep"):
+            success, result_ctx = handler.execute_with_retry(ctx, command_fn, monitor_fn)
 
-        assert handler._should_retry(ctx, exit_code=0) is False
+        assert success is True
+        assert [a.exit_code for a in result_ctx.attempts] == [None, 0]
 
     def test_execute_with_retry_success_first_try(self, handler):
         """Test successful execution on first try."""
@@ -294,28 +309,78 @@ class TestRetryHandler:
         assert command_fn.call_count == 3
         assert monitor_fn.call_count == 0  # Never called due to exception
 
-    def test_log_retry_context(self, handler, temp_log_dir):
-        """Test logging retry context to file."""
+    def test_retry_log_appends_attempts_and_summary(self, handler, temp_log_dir):
+        """Test the retry log gets one JSON line per attempt plus a summary."""
+        import json
+
         ctx = RetryContext(
             runner_id="test-123",
             spec_name="my-spec",
             project_path=Path("/test"),
         )
-        ctx.add_attempt(1, "Failed", 10.0)
+        command_fn = Mock(return_value=Mock())
+        monitor_fn = Mock(side_effect=[(1, "First failure"), (0, None)])
 
-        handler._log_retry_context(ctx)
+        with patch("time.sleep"):
+            handler.execute_with_retry(ctx, command_fn, monitor_fn)
+
+        log_file = temp_log_dir / "test-123.jsonl"
+        records = [json.loads(line) for line in log_file.read_text().splitlines()]
+
+        assert [r["event"] for r in records] == ["attempt", "attempt", "summary"]
+        assert records[0]["exit_code"] == 1
+        assert records[0]["error_message"] == "First failure"
+        assert records[1]["attempt_number"] == 2
+        assert records[2]["success"] is True
+        assert records[2]["runner_id"] == "test-123"
+        assert records[2]["spec_name"] == "my-spec"
+        assert records[2]["attempt_count"] == 2
+
+    def test_retry_log_failure_does_not_abort_execution(self, handler, temp_log_dir):
+        """Test an unwritable retry log only warns and leaves no open handles."""
+        ctx = RetryContext(
+            runner_id="test-123",
+            spec_name="my-spec",
+            project_path=Path("/test"),
+        )
+        # A file in the directory's place cannot be opened into or recreated
+        temp_log_dir.rmdir()
+        temp_log_dir.write_text("")
+        command_fn = Mock(return_value=Mock())
+        monitor_fn = Mock(return_value=(0, None))
 
-        log_file = temp_log_dir / "test-123.json"
-        assert log_file.exists()
+        success, _ = handler.execute_with_retry(ctx, command_fn, monitor_fn)
 
-        import json
+        assert success is True
+        assert handler._log_files == {}
+
+    def test_retry_log_recreates_deleted_log_dir(self, handler, temp_log_dir):
+        """Test deleting the log directory mid-process does not stop retry logs."""
+        ctx = RetryContext(
+            runner_id="test-123",
+            spec_name="my-spec",
+            project_path=Path("/test"),
+        )
+        temp_log_dir.rmdir()
+        command_fn = Mock(return_value=Mock())
+        monitor_fn = Mock(return_value=(0, None))
 
-        with open(log_file) as f:
-            data = json.load(f)
+        handler.execute_with_retry(ctx, command_fn, monitor_fn)
 
-        assert data["runner_id"] == "test-123"
-        assert data["spec_name"] == "my-spec"
-        assert data["attempt_count"] == 1
+        assert (temp_log_dir / "test-123.jsonl").read_text().count("\n") == 2
+
+    def test_log_dir_is_pinned_to_the_cwd_at_creation(self, tmp_path, monkeypatch):
+        """Test a relative log dir keeps pointing where it did when the handler was made."""
+        monkeypatch.chdir(tmp_path)
+        handler = create_retry_handler(RetryConfig(retry_log_dir=Path("logs")))
+        (tmp_path / "elsewhere").mkdir()
+        monkeypatch.chdir(tmp_path / "elsewhere")
+
+        handler._append_retry_log("runner", {"event": "attempt"})
+        handler._close_retry_log("runner")
+
+        assert (tmp_path / "logs" / "runner.jsonl").is_file()
+        assert not (tmp_path / "elsewhere" / "logs").exists()
 
 
 class TestCreateRetryHandler:
@@ -347,3 +412,14 @@ class TestRetryAttempt:
         assert attempt.exit_code == 1
         assert attempt.error_message == "Failed"
         assert attempt.duration_seconds == 10.5
+
+    def test_log_dir_created_once_across_handlers(self, tmp_path):
+        """Test later handlers for the same log dir skip mkdir."""
+        config = RetryConfig(retry_log_dir=tmp_path / "logs")
+        create_retry_handler(config)
+
+        assert config.retry_log_dir.is_dir()
+        with patch.object(Path, "mkdir") as mkdir:
+            create_retry_handler(config)
+
+        mkdir.assert_not_called()
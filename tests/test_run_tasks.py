@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 import io
+import os
+import subprocess
+import sys
+import threading
+from dataclasses import replace
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 
 from spec_workflow_runner import run_tasks as runner
+from spec_workflow_runner.completion_verify import TaskVerification, VerificationResult
 from spec_workflow_runner.providers import CodexProvider
 from spec_workflow_runner.utils import Config, RunnerError, TaskStats
 
@@ -49,6 +56,119 @@ def test_build_prompt_uses_remaining_tasks() -> None:
     assert prompt == "alpha:4:1"
 
 
+def test_mark_task_status_checkbox_format(tmp_path: Path) -> None:
+    tasks_file = tmp_path / "tasks.md"
+    tasks_file.write_text("## Tasks\n\n- [ ] 1. First\n- [ ] 1.1 Sub\n- [ ] 2. Second\n")
+
+    assert runner.mark_task_status(tasks_file, "2", "x") is True
+    assert runner.mark_task_status(tasks_file, "1", "-") is True
+    assert runner.mark_task_status(tasks_file, "3", "x") is False
+
+    assert tasks_file.read_text() == "## Tasks\n\n- [-] 1. First\n- [ ] 1.1 Sub\n- [x] 2. Second\n"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["tasks.md"]
+
+
+def test_mark_task_status_heading_format(tmp_path: Path) -> None:
+    tasks_file = tmp_path / "tasks.md"
+    tasks_file.write_text(
+        "### MEM-001: First\n**Status**: Completed\n\n### MEM-002: Second\n**Status**: Pending\n"
+    )
+
+    assert runner.mark_task_status(tasks_file, "MEM-002", "-") is True
+
+    assert [task["status"] for task in runner.parse_tasks_alternate_format(tasks_file)] == [
+        "completed",
+        "in",
+    ]
+    assert "**Status**: In Progress" in tasks_file.read_text()
+
+
+def test_mark_task_status_heading_format_updates_own_status(tmp_path: Path) -> None:
+    tasks_file = tmp_path / "tasks.md"
+    tasks_file.write_text(
+        "### MEM-001: First\n**Status**: Pending\n\n"
+        "### MEM-002: No status yet\n\n"
+        "### MEM-003: Third\n**Status**: Pending\n"
+    )
+
+    assert runner.mark_task_status(tasks_file, "MEM-003", "x") is True
+    assert runner.mark_task_status(tasks_file, "MEM-002", "x") is False
+
+    assert [task["status"] for task in runner.parse_tasks_alternate_format(tasks_file)] == [
+        "pending",
+        "pending",
+        "completed",
+    ]
+
+
+def test_mark_task_status_skips_write_when_unchanged(tmp_path: Path) -> None:
+    tasks_file = tmp_path / "tasks.md"
+    tasks_file.write_text("- [x] 1. Done\n")
+    before = tasks_file.stat().st_mtime_ns
+
+    assert runner.mark_task_status(tasks_file, "1", "x") is True
+
+    assert tasks_file.stat().st_mtime_ns == before
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX symlinks and modes")
+def test_mark_task_status_keeps_symlink_and_mode(tmp_path: Path) -> None:
+    target = tmp_path / "shared" / "tasks.md"
+    target.parent.mkdir()
+    target.write_text("- [ ] 1. First\n")
+    target.chmod(0o640)
+    tasks_file = tmp_path / "tasks.md"
+    tasks_file.symlink_to(target)
+
+    assert runner.mark_task_status(tasks_file, "1", "x") is True
+
+    assert tasks_file.is_symlink()
+    assert target.read_text() == "- [x] 1. First\n"
+    assert target.stat().st_mode & 0o777 == 0o640
+    assert sorted(p.name for p in target.parent.iterdir()) == ["tasks.md"]
+
+
+def test_mark_task_status_writes_in_place_when_replace_is_denied(
+    tmp_path: Path, monkeypatch
+) -> None:
+    tasks_file = tmp_path / "tasks.md"
+    tasks_file.write_text("- [ ] 1. First\n")
+
+    def deny_replace(*args: object) -> None:
+        raise PermissionError("file is open in another process")
+
+    monkeypatch.setattr(runner.os, "replace", deny_replace)
+
+    assert runner.mark_task_status(tasks_file, "1", "x") is True
+
+    assert tasks_file.read_text() == "- [x] 1. First\n"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["tasks.md"]
+
+
+def test_read_tasks_cached_rereads_only_when_file_changes(tmp_path: Path, monkeypatch) -> None:
+    tasks_file = tmp_path / "tasks.md"
+    tasks_file.write_text("### MEM-001: First\n**Status**: Pending\n")
+    os.utime(tasks_file, (1_000, 1_000))
+    reads = []
+    original_read_text = Path.read_text
+
+    def counting_read_text(self, *args, **kwargs):
+        reads.append(self)
+        return original_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+
+    runner.parse_tasks_alternate_format(tasks_file)
+    runner.read_tasks_cached(tasks_file)
+    assert runner.mark_task_status(tasks_file, "MEM-001", "x") is True
+    assert len(reads) == 1
+
+    # The rewrite is too recent to cache, so it is reread until it settles
+    assert runner.parse_tasks_alternate_format(tasks_file)[0]["status"] == "completed"
+    assert runner.parse_tasks_alternate_format(tasks_file)[0]["status"] == "completed"
+    assert len(reads) == 3
+
+
 def test_run_provider_dry_run_writes_log(tmp_path, capsys) -> None:
     cfg = _make_config()
     provider = CodexProvider()
@@ -124,6 +244,357 @@ def test_run_provider_applies_config_overrides(tmp_path, monkeypatch) -> None:
     ]
 
 
+def test_get_latest_file_mtime_skips_ignored_dirs(tmp_path: Path) -> None:
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "node_modules").mkdir()
+    newest = tmp_path / "src" / "pkg" / "module.py"
+    older = tmp_path / "README.md"
+    ignored = tmp_path / "node_modules" / "dep.js"
+    for path, mtime in ((older, 1_000), (newest, 2_000), (ignored, 3_000)):
+        path.write_text("x")
+        os.utime(path, (mtime, mtime))
+
+    assert runner._get_latest_file_mtime(tmp_path, ("node_modules",)) == 2_000
+    assert runner._get_latest_file_mtime(tmp_path, ()) == 3_000
+    assert runner._get_latest_file_mtime(tmp_path / "missing", ()) == 0.0
+
+
+def test_get_latest_file_mtime_scans_top_level_dirs_in_parallel(tmp_path: Path) -> None:
+    for index in range(4):
+        nested = tmp_path / f"pkg{index}" / "sub"
+        nested.mkdir(parents=True)
+        path = nested / "module.py"
+        path.write_text("x")
+        os.utime(path, (1_000 + index, 1_000 + index))
+
+    assert runner._get_latest_file_mtime(tmp_path, ()) == 1_003
+    assert runner._get_latest_file_mtime(tmp_path, ("pkg3",)) == 1_002
+
+
+def _count_stat_calls(monkeypatch, suffix: str) -> list[str]:  # type: ignore[no-untyped-def]
+    calls: list[str] = []
+    original_stat = os.stat
+
+    def counting_stat(path, *args, **kwargs):  # type: ignore[no-untyped-def]
+        if os.fspath(path).endswith(suffix):
+            calls.append(os.fspath(path))
+        return original_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(runner.os, "stat", counting_stat)
+    return calls
+
+
+def test_get_latest_file_mtime_stops_at_first_file_past_threshold(
+    tmp_path: Path, monkeypatch
+) -> None:
+    for index in range(5):
+        path = tmp_path / f"file{index}.txt"
+        path.write_text("x")
+        os.utime(path, (2_000 + index, 2_000 + index))
+    stats = _count_stat_calls(monkeypatch, ".txt")
+
+    assert runner._get_latest_file_mtime(tmp_path, (), threshold=1_000) >= 2_000
+    assert len(stats) == 1
+
+    stats.clear()
+    assert runner._get_latest_file_mtime(tmp_path, (), threshold=5_000) == 2_004
+    assert len(stats) == 5
+
+
+def test_get_latest_file_mtime_threshold_stops_across_subtrees(tmp_path: Path, monkeypatch) -> None:
+    for index in range(4):
+        (tmp_path / f"pkg{index}").mkdir()
+        for file_index in range(10):
+            path = tmp_path / f"pkg{index}" / f"file{file_index}.txt"
+            path.write_text("x")
+            os.utime(path, (2_000, 2_000))
+    stats = _count_stat_calls(monkeypatch, ".txt")
+
+    assert runner._get_latest_file_mtime(tmp_path, (), threshold=1_000) == 2_000
+    assert len(stats) == 1
+
+    stats.clear()
+    assert runner._get_latest_file_mtime(tmp_path, ()) == 2_000
+    assert len(stats) == 40
+
+
+def _count_scandir_calls(monkeypatch) -> list[str]:  # type: ignore[no-untyped-def]
+    listed: list[str] = []
+    original_scandir = os.scandir
+    monkeypatch.setattr(
+        runner.os, "scandir", lambda path: listed.append(path) or original_scandir(path)
+    )
+    return listed
+
+
+def test_get_latest_file_mtime_relists_only_changed_dirs(tmp_path: Path, monkeypatch) -> None:
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    edited = src_dir / "module.py"
+    edited.write_text("x")
+    os.utime(edited, (1_000, 1_000))
+    # Directory mtimes well in the past, so their listings can be cached
+    for directory in (src_dir, tmp_path):
+        os.utime(directory, (1_000, 1_000))
+    assert runner._get_latest_file_mtime(tmp_path, ()) == 1_000
+
+    listed = _count_scandir_calls(monkeypatch)
+
+    # In-place edits leave the directory listing valid but are still seen
+    os.utime(edited, (2_000, 2_000))
+    assert runner._get_latest_file_mtime(tmp_path, ()) == 2_000
+    assert listed == []
+
+    # New entries change the directory's mtime and force a relist; the fresh
+    # mtime is within a timestamp tick of now, so the listing is not reused yet
+    added = src_dir / "new.py"
+    added.write_text("x")
+    os.utime(added, (3_000, 3_000))
+    assert runner._get_latest_file_mtime(tmp_path, ()) == 3_000
+    assert runner._get_latest_file_mtime(tmp_path, ()) == 3_000
+    assert listed == [os.fspath(src_dir), os.fspath(src_dir)]
+
+
+def test_get_latest_file_mtime_keeps_listings_for_one_project(tmp_path: Path, monkeypatch) -> None:
+    projects = [tmp_path / "one", tmp_path / "two"]
+    for project in projects:
+        project.mkdir()
+        (project / "file.txt").write_text("x")
+        os.utime(project, (1_000, 1_000))
+        runner._get_latest_file_mtime(project, ())
+
+    listed = _count_scandir_calls(monkeypatch)
+
+    runner._get_latest_file_mtime(projects[1], ())
+    assert listed == []
+    runner._get_latest_file_mtime(projects[0], ())
+    assert listed == [os.fspath(projects[0])]
+
+
+def test_execute_provider_command_decodes_stream_output(tmp_path: Path, monkeypatch) -> None:
+    log_path = tmp_path / "task.log"
+
+    class DummyProcess:
+        def __init__(self) -> None:
+            self.stdout = io.BytesIO(
+                '{"type": "result", "result": "d\u00e9j\u00e0 vu"}\r\n'.encode()
+                + b"bad \xff byte\n"
+            )
+            self.returncode = 0
+
+        def wait(self, timeout=None):  # type: ignore[no-untyped-def]
+            return 0
+
+    monkeypatch.setattr(runner, "popen_command", lambda command, **kwargs: DummyProcess())
+
+    assert runner._execute_provider_command(["demo"], tmp_path, "# header\n", log_path) == 0
+
+    assert log_path.read_text(encoding="utf-8").splitlines()[1:3] == [
+        '{"type": "result", "result": "d\u00e9j\u00e0 vu"}',
+        "bad \ufffd byte",
+    ]
+
+
+def test_execute_provider_command_keeps_carriage_return_progress_in_one_line(
+    tmp_path: Path, monkeypatch
+) -> None:
+    log_path = tmp_path / "task.log"
+
+    class DummyProcess:
+        def __init__(self) -> None:
+            self.stdout = io.BytesIO(b"10%\r50%\r100%\ndone\n")
+            self.returncode = 0
+
+        def wait(self, timeout=None):  # type: ignore[no-untyped-def]
+            return 0
+
+    monkeypatch.setattr(runner, "popen_command", lambda command, **kwargs: DummyProcess())
+
+    runner._execute_provider_command(["demo"], tmp_path, "", log_path)
+
+    assert log_path.read_bytes().startswith(b"10%\r50%\r100%\ndone\n")
+
+
+def test_execute_provider_command_flushes_log_before_waiting_for_output(
+    tmp_path: Path, monkeypatch
+) -> None:
+    log_path = tmp_path / "task.log"
+    seen_before_next_read: list[bytes] = []
+
+    class QuietPipe(io.RawIOBase):
+        """Pipe that yields one line and then goes quiet until EOF."""
+
+        def __init__(self) -> None:
+            self.reads = 0
+
+        def readable(self) -> bool:
+            return True
+
+        def readinto(self, buffer):  # type: ignore[no-untyped-def]
+            self.reads += 1
+            if self.reads == 1:
+                data = b"line-1\n"
+                buffer[: len(data)] = data
+                return len(data)
+            seen_before_next_read.append(log_path.read_bytes())
+            return 0
+
+    class DummyProcess:
+        def __init__(self) -> None:
+            self.stdout = QuietPipe()
+            self.returncode = 0
+
+        def wait(self, timeout=None):  # type: ignore[no-untyped-def]
+            return 0
+
+    monkeypatch.setattr(runner, "popen_command", lambda command, **kwargs: DummyProcess())
+
+    runner._execute_provider_command(["demo"], tmp_path, "", log_path)
+
+    assert seen_before_next_read
+    assert b"line-1\n" in seen_before_next_read[0]
+
+
+def test_execute_provider_command_prints_non_object_json_lines(
+    tmp_path: Path, monkeypatch, capsys
+) -> None:
+    class DummyProcess:
+        def __init__(self) -> None:
+            self.stdout = io.BytesIO(b'[1, 2]\n{"type": "result", "result": "done"}\n')
+            self.returncode = 0
+
+        def wait(self, timeout=None):  # type: ignore[no-untyped-def]
+            return 0
+
+    monkeypatch.setattr(runner, "popen_command", lambda command, **kwargs: DummyProcess())
+
+    runner._execute_provider_command(["demo"], tmp_path, "", tmp_path / "task.log")
+
+    out = capsys.readouterr().out
+    assert "[1, 2]" in out
+    assert "[Result: done...]" in out
+
+
+def test_execute_provider_command_reports_output_tail(tmp_path: Path, monkeypatch) -> None:
+    class DummyProcess:
+        def __init__(self) -> None:
+            self.stdout = io.BytesIO(b"line-1\nline-2\nline-3\nline-4\n")
+            self.returncode = 1
+
+        def wait(self, timeout=None):  # type: ignore[no-untyped-def]
+            return 1
+
+    monkeypatch.setattr(runner, "popen_command", lambda command, **kwargs: DummyProcess())
+    monkeypatch.setattr(runner, "_OUTPUT_TAIL_LINES", 2)
+
+    with pytest.raises(RunnerError) as excinfo:
+        runner._execute_provider_command(["demo"], tmp_path, "", tmp_path / "task.log")
+
+    assert str(excinfo.value).endswith("Output: line-3line-4")
+    assert "line-1" in (tmp_path / "task.log").read_text()
+
+
+def test_execute_provider_command_skips_signals_when_process_exits(
+    tmp_path: Path, monkeypatch
+) -> None:
+    class DummyProcess:
+        def __init__(self) -> None:
+            self.stdout = io.BytesIO(b"Error: No messages returned\n")
+            self.returncode = 0
+            self.terminate = MagicMock()
+            self.kill = MagicMock()
+
+        def wait(self, timeout=None):  # type: ignore[no-untyped-def]
+            return 0
+
+    process = DummyProcess()
+    monkeypatch.setattr(runner, "popen_command", lambda command, **kwargs: process)
+    monkeypatch.setattr(runner.time, "sleep", MagicMock(side_effect=AssertionError("slept")))
+
+    assert runner._execute_provider_command(["demo"], tmp_path, "", tmp_path / "task.log") == 0
+
+    process.terminate.assert_not_called()
+    process.kill.assert_not_called()
+    assert "killed early" in (tmp_path / "task.log").read_text()
+
+
+def test_stream_event_handlers_track_task_agents(capsys) -> None:
+    state = runner._StreamState()
+    handlers = runner._STREAM_EVENT_HANDLERS
+
+    handlers["assistant"](
+        {
+            "message": {
+                "content": [
+                    {"type": "text", "text": "Working on it"},
+                    {"type": "tool_use", "name": "Task", "id": "tu-1"},
+                    {"type": "tool_use", "name": "Read", "id": "tu-2"},
+                ]
+            }
+        },
+        state,
+    )
+    handlers["tool_result"]({"tool_use_id": "tu-1", "content": "Started agent ID: abc-123"}, state)
+    handlers["tool_result"]({"tool_use_id": "tu-2", "content": "agent id: ignored"}, state)
+
+    assert [agent["agent_id"] for agent in state.spawned_agents] == ["abc-123"]
+    assert state.pending_tool_uses == {}
+    out = capsys.readouterr().out
+    assert "Working on it" in out
+    assert "[Using tool: Task]" in out
+    assert "Task agent detected: abc-123" in out
+
+
+def test_execute_provider_command_skips_decoder_for_plain_text(
+    tmp_path: Path, monkeypatch, capsys
+) -> None:
+    class DummyProcess:
+        def __init__(self) -> None:
+            self.stdout = io.BytesIO(b"warning: slow network\n\n{not json\n")
+            self.returncode = 0
+
+        def wait(self, timeout=None):  # type: ignore[no-untyped-def]
+            return 0
+
+    decoder = MagicMock(side_effect=runner.json.JSONDecodeError("bad", "{not json", 1))
+    monkeypatch.setattr(runner, "popen_command", lambda command, **kwargs: DummyProcess())
+    monkeypatch.setattr(runner, "_decode_stream_event", decoder)
+
+    runner._execute_provider_command(["demo"], tmp_path, "", tmp_path / "task.log")
+
+    decoder.assert_called_once_with("{not json")
+    out = capsys.readouterr().out
+    assert "warning: slow network" in out
+    assert "{not json" in out
+
+
+def test_wait_for_exit_parks_on_output_then_waits_for_process() -> None:
+    output_done = threading.Event()
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(0.2)"])
+    try:
+        with pytest.raises(subprocess.TimeoutExpired):
+            runner._wait_for_exit(proc, output_done, 0.01)
+
+        output_done.set()
+        assert runner._wait_for_exit(proc, output_done, 5) == 0
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def test_wait_for_exit_times_out_after_output_ends_if_process_lingers() -> None:
+    output_done = threading.Event()
+    output_done.set()
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(5)"])
+    try:
+        with pytest.raises(subprocess.TimeoutExpired):
+            runner._wait_for_exit(proc, output_done, 0.05)
+    finally:
+        proc.kill()
+        proc.wait()
+    assert runner._wait_for_exit(proc, output_done, 0.05) == proc.returncode
+
+
 def test_list_unfinished_specs_filters_completed(tmp_path: Path) -> None:
     cfg = _make_config()
     specs_root = tmp_path / cfg.spec_workflow_dir_name / cfg.specs_subdir
@@ -756,3 +1227,90 @@ def test_run_provider_infinite_retries_for_context_limit(tmp_path: Path, monkeyp
     # Should sleep 5 times with context_limit_wait_seconds (600)
     assert len(sleep_calls) == 5
     assert all(s == 600 for s in sleep_calls)
+
+
+def test_hms_formats_local_time_once_per_second(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify _hms matches datetime formatting and reuses the text within a second."""
+    runner._format_hms.cache_clear()
+    monkeypatch.setattr(runner.time, "time", lambda: 1_700_000_000.25)
+    expected = datetime.fromtimestamp(1_700_000_000).strftime("%H:%M:%S")
+    assert runner._hms() == expected
+    monkeypatch.setattr(runner.time, "time", lambda: 1_700_000_000.75)
+    assert runner._hms() == expected
+    assert runner._format_hms.cache_info().hits == 1
+
+
+def test_git_head_fingerprint_changes_when_branch_ref_is_rewritten(tmp_path: Path) -> None:
+    """Verify the HEAD signature tracks commits and falls back to None without .git."""
+    assert runner._git_head_fingerprint(tmp_path) is None
+
+    refs = tmp_path / ".git" / "refs" / "heads"
+    refs.mkdir(parents=True)
+    (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main\n", encoding="utf-8")
+    (refs / "main").write_text("a" * 40 + "\n", encoding="utf-8")
+    before = runner._git_head_fingerprint(tmp_path)
+    assert before is not None
+    assert runner._git_head_fingerprint(tmp_path) == before
+
+    # git updates refs by renaming a lock file over the old ref
+    (refs / "main.lock").write_text("b" * 40 + "\n", encoding="utf-8")
+    os.replace(refs / "main.lock", refs / "main")
+    assert runner._git_head_fingerprint(tmp_path) != before
+
+
+def test_format_verification_log_matches_layout() -> None:
+    def verification(task_id: str, passed: bool, files: list[str], issues: list[str]):
+        return TaskVerification(
+            task_id, f"Task {task_id}", "in_progress", files, None, passed, issues
+        )
+
+    result = VerificationResult(
+        spec_name="demo",
+        tasks_verified=2,
+        tasks_completed=1,
+        tasks_incomplete=1,
+        verifications=[verification("1", True, ["a.py"], []), verification("2", False, [], ["x"])],
+        commits_made=["abc123"],
+    )
+
+    assert runner._format_verification_log(3, result) == (
+        "Iteration 3 - Verification Results\n" + "=" * 80 + "\n\n" + result.summary() + "\n\n"
+        "✅ Verified and marked complete:\n\n  1: Task 1\n    Files: a.py\n\n"
+        "⏸️  Still in progress:\n\n  2: Task 2\n    - x\n\n"
+        "📝 Commits created:\n  abc123\n"
+    )
+
+
+def test_three_phase_iteration_ignores_commits_made_before_the_session(
+    tmp_path: Path, monkeypatch
+) -> None:
+    """Verify a commit landing before Phase 2 is not credited to the session."""
+    cfg = replace(_make_config(), block_commits_during_implementation=False)
+    spec_path = tmp_path / "spec"
+    spec_path.mkdir()
+    (spec_path / "tasks.md").write_text("- [ ] 1. First\n", encoding="utf-8")
+    head = ["before"]
+
+    def validate(**kwargs: object) -> None:
+        # e.g. the user committing while the previous iteration wrapped up
+        head[0] = "user-commit"
+        raise RuntimeError("skip validation")
+
+    monkeypatch.setattr(runner, "run_validation", validate)
+    monkeypatch.setattr(runner, "get_current_commit", lambda project_path: head[0])
+    monkeypatch.setattr(runner, "run_provider", lambda *args, **kwargs: 0)
+    monkeypatch.setattr(
+        runner, "run_verification", MagicMock(side_effect=RuntimeError("skip verification"))
+    )
+
+    progress_made, agent_commits, last_commit_after = runner.run_three_phase_iteration(
+        provider=MagicMock(),
+        cfg=cfg,
+        project_path=tmp_path,
+        spec_name="alpha",
+        spec_path=spec_path,
+        iteration=1,
+        log_dir=tmp_path / "logs",
+    )
+
+    assert (progress_made, agent_commits, last_commit_after) == (False, 0, "user-commit")
@@ -2,11 +2,23 @@
 
 from __future__ import annotations
 
+import os
+import select
+import shutil
+import signal
 import subprocess
+import sys
+import time
 from unittest.mock import Mock, patch
 
+import pytest
+
 from spec_workflow_runner.subprocess_helpers import (
+    _resolve_executable,
+    kill_process_group,
+    kill_process_group_on_abort,
     monitor_process_with_timeout,
+    popen_command,
     safe_terminate_process,
 )
 
@@ -127,3 +139,107 @@ class TestSafeTerminateProcess:
         safe_terminate_process(mock_process, timeout=5)
 
         mock_process.terminate.assert_called_once()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX Popen branch")
+class TestPopenCommand:
+    """Tests for popen_command executable resolution."""
+
+    def test_bare_name_resolved_on_path(self):
+        """Test a bare command name resolves to the same binary PATH lookup finds."""
+        assert _resolve_executable("sh", None) == shutil.which("sh")
+
+    def test_path_with_separator_left_to_popen(self):
+        """Test relative paths are not resolved against the parent's cwd."""
+        assert _resolve_executable("./run.sh", None) is None
+
+    def test_resolution_follows_moved_and_new_commands(self, tmp_path):
+        """Test cached lookups notice commands that were removed or installed."""
+        first, second = tmp_path / "first", tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+        path = os.pathsep.join([str(first), str(second)])
+
+        assert _resolve_executable("spec-tool", path) is None
+
+        for directory in (first, second):
+            tool = directory / "spec-tool"
+            tool.write_text("#!/bin/sh\n")
+            tool.chmod(0o755)
+        assert _resolve_executable("spec-tool", path) == str(first / "spec-tool")
+
+        (first / "spec-tool").unlink()
+        assert _resolve_executable("spec-tool", path) == str(second / "spec-tool")
+
+    def test_runs_resolved_command(self, tmp_path):
+        """Test the spawned process still sees the original argv[0]."""
+        process = popen_command(["sh", "-c", 'printf "%s" "$0"'], cwd=tmp_path)
+        output, _ = process.communicate(timeout=10)
+
+        assert process.returncode == 0
+        assert output == b"sh"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="process groups are POSIX-only")
+class TestKillProcessGroup:
+    """Tests for kill_process_group."""
+
+    def test_kills_descendants_holding_the_pipe(self):
+        """Test killing the group closes the pipe even when a grandchild inherited it."""
+        script = (
+            "import subprocess, sys, time; "
+            "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']); "
+            "print('ready', flush=True); time.sleep(30)"
+        )
+        process = popen_command([sys.executable, "-c", script], new_process_group=True)
+        try:
+            assert process.stdout.readline() == b"ready\n"
+            kill_process_group(process)
+            process.wait(timeout=5)
+
+            # EOF only arrives once every writer, including the grandchild, is gone
+            readable, _, _ = select.select([process.stdout], [], [], 5)
+            assert readable
+            assert process.stdout.read() == b""
+        finally:
+            process.kill()
+            process.wait()
+
+    def test_abort_kills_group_on_exception(self):
+        """Test an exception leaving the block kills the detached provider."""
+        process = popen_command(["sleep", "30"], new_process_group=True)
+        try:
+            with pytest.raises(ValueError):
+                with kill_process_group_on_abort(process):
+                    raise ValueError("session failed")
+            assert process.wait(timeout=5) == -signal.SIGKILL
+        finally:
+            process.kill()
+            process.wait()
+
+    def test_abort_turns_sigterm_into_exit_and_restores_handler(self):
+        """Test SIGTERM to the runner unwinds the block, killing the group."""
+        previous = signal.getsignal(signal.SIGTERM)
+        process = popen_command(["sleep", "30"], new_process_group=True)
+        try:
+            with pytest.raises(SystemExit) as exc_info:
+                with kill_process_group_on_abort(process):
+                    os.kill(os.getpid(), signal.SIGTERM)
+                    time.sleep(5)
+            assert exc_info.value.code == 128 + signal.SIGTERM
+            assert process.wait(timeout=5) == -signal.SIGKILL
+            assert signal.getsignal(signal.SIGTERM) is previous
+        finally:
+            process.kill()
+            process.wait()
+
+    def test_normal_exit_leaves_process_running(self):
+        """Test a clean exit from the block does not kill the process."""
+        process = popen_command(["sleep", "30"], new_process_group=True)
+        try:
+            with kill_process_group_on_abort(process):
+                pass
+            assert process.poll() is None
+        finally:
+            process.kill()
+            process.wait()
@@ -1,8 +1,18 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
-from spec_workflow_runner.utils import read_task_stats
+import pytest
+
+from spec_workflow_runner import utils
+from spec_workflow_runner.utils import (
+    TaskStats,
+    read_task_details,
+    read_task_stats,
+    read_tasks_cached,
+    read_tasks_text_cached,
+)
 
 
 def write_tasks(tmp_path: Path, content: str) -> Path:
@@ -81,3 +91,55 @@ def test_read_task_stats_ignores_indented_checklist_items(tmp_path):
     assert stats.pending == 1
     assert stats.in_progress == 0
     assert stats.total == 2
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "## Tasks\n\n- [ ] 1. Pending\n- [X] 2. Done\n- [-] 3. Working\n\n## Notes\n- [ ] 9. Extra\n",
+        "### MEM-001: First\n**Status**: Completed\n\n"
+        "### MEM-002: Second\n**Status**: In Progress\n\n"
+        "### MEM-003: Third\n**Status**: Blocked\n\n"
+        "### MEM-004: Fourth\n",
+    ],
+)
+def test_task_stats_from_details_matches_read_task_stats(tmp_path, content):
+    tasks_path = write_tasks(tmp_path, content)
+
+    assert TaskStats.from_details(read_task_details(tasks_path)) == read_task_stats(tasks_path)
+
+
+def test_read_tasks_cached_reuses_parse_until_file_changes(tmp_path, monkeypatch):
+    tasks_path = write_tasks(tmp_path, "- [ ] 1. First\n- [x] 2. Second\n")
+    expected = (read_task_stats(tasks_path), read_task_details(tasks_path))
+    utils._parse_tasks_text.cache_clear()
+    parses = []
+    parse = utils._parse_task_details
+    monkeypatch.setattr(
+        utils, "_parse_task_details", lambda text: parses.append(text) or parse(text)
+    )
+    reads = []
+    read_text = Path.read_text
+    monkeypatch.setattr(
+        Path,
+        "read_text",
+        lambda self, *args, **kwargs: reads.append(self) or read_text(self, *args, **kwargs),
+    )
+
+    # Freshly written, so a same-tick edit could still follow: re-read every
+    # time, but unchanged text is not parsed again
+    assert read_tasks_cached(tasks_path) == expected
+    assert read_tasks_text_cached(tasks_path) == "- [ ] 1. First\n- [x] 2. Second\n"
+    assert read_tasks_cached(tasks_path) == expected
+    assert (len(reads), len(parses)) == (3, 1)
+
+    os.utime(tasks_path, (1_000, 1_000))
+    assert read_tasks_cached(tasks_path) == expected
+    assert read_tasks_text_cached(tasks_path) == "- [ ] 1. First\n- [x] 2. Second\n"
+    assert read_tasks_cached(tasks_path) == expected
+    assert (len(reads), len(parses)) == (4, 1)
+
+    # Editing the file changes its text and forces a fresh parse
+    tasks_path.write_text("- [x] 1. First\n- [x] 2. Second\n", encoding="utf-8")
+    assert read_tasks_cached(tasks_path)[0].done == 2
+    assert len(parses) == 2
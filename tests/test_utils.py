@@ -2,7 +2,17 @@
 
 from __future__ import annotations
 
-from spec_workflow_runner.utils import is_context_limit_error, is_rate_limit_error
+import time
+
+import pytest
+
+from spec_workflow_runner.utils import (
+    classify_error,
+    is_context_limit_error,
+    is_rate_limit_error,
+    mtime_is_settled,
+    render_template,
+)
 
 
 def test_is_context_limit_error_detects_claude_errors() -> None:
@@ -141,3 +151,54 @@ def test_is_rate_limit_error_handles_multiline_errors() -> None:
     Please try again later
     """
     assert is_rate_limit_error(multiline_error)
+
+
+def test_classify_error_reports_every_kind_present() -> None:
+    """Verify a single pass finds co-occurring error kinds for the caller to prioritize."""
+    message = "Rate limit hit, then: No messages returned. Command timed out after 30s"
+    assert classify_error(message) == {"rate", "no_messages", "timeout"}
+    assert classify_error("RESOURCE_EXHAUSTED: token budget") == {"context"}
+    assert classify_error("RESOURCE_EXHAUSTED") == frozenset()
+    assert classify_error("Connection refused") == frozenset()
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "Spec {spec_name}: {tasks_done}/{tasks_total} {{literal}}",
+        "{spec_name!r} {tasks_done:>4} {tasks_total:03d} {spec_name!a}",
+        "{0} positional",
+        "{ctx[spec_name]} indexed",
+        "{spec_name:{width}} nested spec",
+    ],
+)
+def test_render_template_matches_str_format(template: str) -> None:
+    """render_template agrees with str.format, including its fallback cases."""
+    context = {
+        "spec_name": "alpha",
+        "tasks_done": 3,
+        "tasks_total": 7,
+        "width": 8,
+        "ctx": {"spec_name": "beta"},
+    }
+    try:
+        expected = template.format(**context)
+    except (IndexError, KeyError) as err:
+        with pytest.raises(type(err)):
+            render_template(template, context)
+    else:
+        assert render_template(template, context) == expected
+
+
+def test_render_template_missing_field_raises_key_error() -> None:
+    """Missing placeholders raise KeyError like str.format."""
+    with pytest.raises(KeyError, match="tasks_done"):
+        render_template("{spec_name} {tasks_done}", {"spec_name": "alpha"})
+
+
+def test_mtime_is_settled_only_after_a_timestamp_tick() -> None:
+    """Mtimes from the last couple of seconds are too fresh to cache on."""
+    now = time.time_ns()
+    assert mtime_is_settled(now - 10_000_000_000)
+    assert not mtime_is_settled(now)
+    assert not mtime_is_settled(now - 1_000_000_000)